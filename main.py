@@ -2,6 +2,8 @@
 import sys
 import argparse
 from webscraper_core.manager import run_many_and_aggregate
+from webscraper_core.parsing import PARSERS, get_default_parser, resolve_parser, set_default_parser
+from webscraper_core.database import SQLITE_PROFILES, DEFAULT_PROFILE
 
 # Force UTF-8 output on Windows
 if sys.platform == 'win32':
@@ -53,6 +55,60 @@ Examples:
         help="Set the output mode. 'normal' for standard output, 'debug' for verbose logging. (Default: normal)"
     )
     
+    # Define optional --http-cache argument
+    parser.add_argument(
+        '--http-cache',
+        metavar='DIR',
+        default=None,
+        help='Cache listing pages in DIR and refetch them with conditional GETs (ETag / Last-Modified). (Default: disabled)'
+    )
+    
+    # Define optional --force argument
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reprocess pages even if their content is unchanged since the last run.'
+    )
+    
+    # Define optional --parser argument
+    parser.add_argument(
+        '--parser',
+        choices=PARSERS,
+        default=get_default_parser(),
+        help=f"HTML parser backend for all sites. Falls back to an installed one if missing. (Default: {get_default_parser()})"
+    )
+    
+    # Define optional --parse-workers argument
+    parser.add_argument(
+        '--parse-workers',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Parse listing pages in N worker processes instead of the worker threads. (Default: 0)'
+    )
+    
+    # Define optional --db-profile argument
+    parser.add_argument(
+        '--db-profile',
+        choices=list(SQLITE_PROFILES),
+        default=DEFAULT_PROFILE,
+        help="SQLite settings profile. 'performance' enables WAL, synchronous=NORMAL and larger caches for heavy write loads. (Default: default)"
+    )
+    
+    # Define optional --single-writer argument
+    parser.add_argument(
+        '--single-writer',
+        action='store_true',
+        help='Save articles from one dedicated writer thread in batches instead of from every worker thread.'
+    )
+    
+    # Define optional --url-index argument
+    parser.add_argument(
+        '--url-index',
+        action='store_true',
+        help='Load stored article URLs into memory once and skip known articles without querying the database.'
+    )
+    
     # Parse command-line arguments
     args = parser.parse_args()
     
@@ -60,6 +116,13 @@ Examples:
     urls = args.urls
     max_workers = args.workers
     mode = args.mode
+    http_cache_dir = args.http_cache
+    skip_unchanged = not args.force
+    set_default_parser(args.parser)
+    parse_workers = max(0, args.parse_workers)
+    db_profile = args.db_profile
+    single_writer = args.single_writer
+    url_index = args.url_index
     
     # Display debug mode indicator if enabled
     if mode == 'debug':
@@ -70,6 +133,13 @@ Examples:
         print(f"  URLs to scrape: {len(urls)}")
         print(f"  Worker threads: {max_workers}")
         print(f"  Output mode: {mode}")
+        print(f"  HTTP cache: {http_cache_dir or 'disabled'}")
+        print(f"  Skip unchanged pages: {skip_unchanged}")
+        print(f"  HTML parser: {resolve_parser()}")
+        print(f"  Parse worker processes: {parse_workers or 'disabled'}")
+        print(f"  Database profile: {db_profile}")
+        print(f"  Single writer: {single_writer}")
+        print(f"  Known-URL index: {url_index}")
         print("\n")
     
     print("=" * 70)
@@ -82,7 +152,10 @@ Examples:
     print("\n")
     
     # Run scraper on all URLs and get aggregated results
-    results, aggregated = run_many_and_aggregate(urls, max_workers=max_workers)
+    results, aggregated = run_many_and_aggregate(urls, max_workers=max_workers, http_cache_dir=http_cache_dir,
+                                                 skip_unchanged=skip_unchanged, parse_workers=parse_workers,
+                                                 db_profile=db_profile, single_writer=single_writer,
+                                                 url_index=url_index)
     
     # Display detailed results per URL
     print("\n" + "=" * 70)
@@ -90,6 +163,9 @@ Examples:
     print("=" * 70)
     
     for result in results:
+        if result.get('status') == 'unchanged':
+            print(f"\n[UNCHANGED] {result['url']}")
+            continue
         status_icon = "[OK]" if result.get('status') == 'success' else "[FAIL]"
         print(f"\n{status_icon} {result['url']}")
         print(f"   Created: {result.get('created', 0)} articles")
@@ -103,6 +179,7 @@ Examples:
     print("=" * 70)
     print(f"\nTotal URLs Processed: {aggregated.get('total_urls', 0)}")
     print(f"Successful: {aggregated.get('successful_urls', 0)}")
+    print(f"Unchanged: {aggregated.get('unchanged_urls', 0)}")
     print(f"Failed: {aggregated.get('failed_urls', 0)}")
     print(f"\nTotal Articles:")
     print(f"  Created: {aggregated.get('total_created', 0)}")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark DataCamp card extraction against the number of cards on the page.
+
+Builds synthetic blog index pages from the documented card structure and
+times DataCampScraper.extract_listing() on each. Extraction is card-scoped,
+so the time per card should stay flat as the page grows.
+
+Usage:
+  python tests/benchmark_datacamp_extraction.py [--repeat N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.scrapers.datacamp_scraper import DataCampScraper
+from tests.test_datacamp_cards import make_card
+
+
+CARD_COUNTS = (100, 200, 400, 800, 1600)
+
+
+def build_page(cards: int) -> str:
+    return '<html><body>' + ''.join(make_card(i) for i in range(cards)) + '</body></html>'
+
+
+def time_extraction(scraper: DataCampScraper, html: str, repeat: int) -> float:
+    """Return the best of `repeat` runs, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        articles = scraper.extract_listing(html)
+        best = min(best, time.perf_counter() - start)
+    assert articles, "no articles extracted"
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DataCamp card extraction')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per page size (default: 3)')
+    args = parser.parse_args()
+
+    scraper = DataCampScraper('https://www.datacamp.com/blog')
+    print(f"{'cards':>7} {'total ms':>10} {'µs/card':>9}")
+    baseline = None
+    for cards in CARD_COUNTS:
+        seconds = time_extraction(scraper, build_page(cards), args.repeat)
+        per_card = seconds / cards * 1e6
+        baseline = baseline or per_card
+        print(f"{cards:>7} {seconds * 1000:>10.1f} {per_card:>9.1f}  ({per_card / baseline:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
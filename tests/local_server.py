@@ -0,0 +1,47 @@
+"""Local HTTP server helper for tests that exercise fetch code without network access."""
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+def start_server(pages, keep_alive=False, etags=None):
+    """Serve a dict of {path: html} on localhost.
+
+    etags maps paths to an ETag; a matching If-None-Match gets 304 Not Modified.
+    Returns (server, base_url). server.requests records (path, headers, client_port)
+    for every request received. Call server.shutdown() when done.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1' if keep_alive else 'HTTP/1.0'
+
+        def do_GET(self):
+            server.requests.append((self.path, dict(self.headers), self.client_address[1]))
+            body = pages.get(self.path)
+            etag = (etags or {}).get(self.path)
+            if body is not None and etag and self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            if body is None:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            data = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            if etag:
+                self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
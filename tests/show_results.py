@@ -12,6 +12,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import sys
 from webscraper_core.database import create_connection
 from webscraper_core.models import Article, Author
+from webscraper_core.repositories.article_repository import ArticleRepository
+from sqlalchemy import func
 
 def print_header(text):
     """Print formatted header."""
@@ -46,12 +48,11 @@ def main():
     print(f"{'ID':<4} {'Title':<50} {'Date':<12} {'Author':<15}")
     print("-" * 80)
     
-    articles = session.query(Article).order_by(Article.article_id).all()
+    # One joined query for articles and author names (no per-article author lookup)
+    articles = ArticleRepository(session).list_articles_with_authors()
     for article in articles:
-        author = session.query(Author).filter(Author.author_id == article.author_id).first()
-        author_name = author.name if author else "Unknown"
         title = article.title[:47] + "..." if len(article.title) > 50 else article.title
-        print(f"{article.article_id:<4} {title:<50} {str(article.publication_date):<12} {author_name:<15}")
+        print(f"{article.article_id:<4} {title:<50} {str(article.publication_date):<12} {article.author:<15}")
     
     # Show URLs
     print(f"\n4. All Article URLs:\n")
@@ -60,10 +61,14 @@ def main():
     
     # Summary statistics by author
     print(f"\n5. Articles by Author:\n")
-    authors = session.query(Author).all()
-    for author in authors:
-        count = session.query(Article).filter(Article.author_id == author.author_id).count()
-        print(f"   • {author.name:<30} - {count} article(s)")
+    author_counts = (
+        session.query(Author.name, func.count(Article.article_id))
+        .outerjoin(Article, Article.author_id == Author.author_id)
+        .group_by(Author.author_id)
+        .order_by(Author.author_id)
+    )
+    for name, count in author_counts:
+        print(f"   • {name:<30} - {count} article(s)")
     
     # Show data validation
     print(f"\n6. Data Validation Results:\n")
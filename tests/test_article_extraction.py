@@ -11,6 +11,7 @@ from webscraper_core.database import create_connection, create_tables
 from webscraper_core.models import Base
 from webscraper_core.repositories.author_repository import AuthorRepository
 from webscraper_core.repositories.article_repository import ArticleRepository
+from webscraper_core.records import ArticleRecord
 
 
 def test_extract_article_data_returns_correct_structure():
@@ -264,6 +265,83 @@ def test_duplicate_article_handling_across_saves():
     print("✓ Duplicate articles skipped across multiple saves")
 
 
+def test_bulk_insert_skips_duplicate_urls():
+    """Test that ArticleRepository.add_articles_bulk dedups by URL in one insert."""
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    create_tables()
+    session = SessionLocal()
+    
+    author_repo = AuthorRepository(session)
+    article_repo = ArticleRepository(session)
+    author_ids = {'Author A': author_repo.create_author('Author A').author_id}
+    
+    first = [
+        ArticleRecord('Article 1', 'Author A', 'https://example.com/article1', date(2024, 10, 18)),
+        ArticleRecord('Article 2', 'Author A', 'https://example.com/article2'),
+    ]
+    second = [
+        ArticleRecord('Article 1 Duplicate', 'Author A', 'https://example.com/article1'),
+        ArticleRecord('Article 3', 'Author A', 'https://example.com/article3'),
+        ArticleRecord('Article 3 Repeated', 'Author A', 'https://example.com/article3'),
+        ArticleRecord('No URL', 'Author A', ''),
+        ArticleRecord('Unresolved Author', 'Author Z', 'https://example.com/article4'),
+    ]
+    
+    assert article_repo.add_articles_bulk(first, author_ids) == {'created': 2, 'skipped': 0, 'errors': 0}
+    assert article_repo.add_articles_bulk(second, author_ids) == {'created': 1, 'skipped': 2, 'errors': 2}
+    
+    titles = sorted(a.title for a in article_repo.list_articles())
+    assert titles == ['Article 1', 'Article 2', 'Article 3']
+    
+    session.close()
+    print("✓ Bulk insert skips duplicate URLs")
+
+
+def test_get_or_create_many_authors():
+    """Test batched author resolution and the unique index on author.name."""
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    create_tables()
+    session = SessionLocal()
+    
+    author_repo = AuthorRepository(session)
+    existing = author_repo.create_author('Author A')
+    
+    ids = author_repo.get_or_create_many(['Author A', 'Author B', 'Author B', 'Author C'])
+    assert set(ids) == {'Author A', 'Author B', 'Author C'}
+    assert ids['Author A'] == existing.author_id
+    assert author_repo.get_or_create_many(['Author C', 'Author B']) == {
+        'Author C': ids['Author C'], 'Author B': ids['Author B']
+    }
+    assert len(author_repo.list_authors()) == 3
+    
+    # The unique index rejects a duplicate name; get_or_create reuses the row
+    assert author_repo.create_author('Author B') is None
+    assert author_repo.get_or_create('Author B').author_id == ids['Author B']
+    
+    session.close()
+    print("✓ Authors resolved in bulk without duplicates")
+
+
+def test_unique_author_index_added_to_existing_database():
+    """Test that create_tables() adds the author name index to an older database."""
+    from sqlalchemy import inspect, text
+    create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE author (author_id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL)"))
+    
+    create_tables()
+    
+    indexes = inspect(engine).get_indexes('author')
+    assert any(ix['column_names'] == ['name'] and ix['unique'] for ix in indexes)
+    print("✓ Unique author name index added to an existing database")
+
+
 if __name__ == '__main__':
     print("Running article extraction and database integration tests...\n")
     test_extract_article_data_returns_correct_structure()
@@ -272,4 +350,7 @@ if __name__ == '__main__':
     test_article_deduplication_by_url()
     test_full_workflow_scrape_to_database()
     test_duplicate_article_handling_across_saves()
+    test_bulk_insert_skips_duplicate_urls()
+    test_get_or_create_many_authors()
+    test_unique_author_index_added_to_existing_database()
     print("\n✅ All article extraction and database tests passed!")
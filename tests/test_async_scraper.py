@@ -0,0 +1,147 @@
+"""Tests for the asyncio fetch engine (AsyncWebScraper)."""
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.async_scraper import AsyncWebScraper, create_client_session
+from webscraper_core.manager import run_many_async
+from webscraper_core.scraper import WebScraper
+from webscraper_core.database import create_connection, dispose_engines
+from webscraper_core.models import Base
+from webscraper_core.repositories.author_repository import AuthorRepository
+from webscraper_core.repositories.article_repository import ArticleRepository
+from webscraper_core.scrapers.realpython_scraper import RealPythonScraper
+from webscraper_core.http_client import HttpClient
+from webscraper_core.rate_limit import HostRateLimiter
+from tests.local_server import start_server
+
+
+def _realpython_pages(base_url):
+    cards = ''.join(
+        f"""
+        <div class="card border-0">
+            <a href="{base_url}/article-{i}/">
+                <h2 class="card-title">Article {i}</h2>
+            </a>
+            <span class="mr-2">Oct 1{i}, 2025</span>
+        </div>
+        """
+        for i in range(3)
+    )
+    pages = {'/': f"<html><body>{cards}</body></html>"}
+    for i in range(3):
+        pages[f'/article-{i}/'] = f"""
+        <div class="card mt-3" id="author">
+            <p class="card-header h3">About <strong>Author {i}</strong></p>
+        </div>
+        """
+    return pages
+
+
+def _unthrottled_scraper(url):
+    """RealPythonScraper with a private limiter so the test server is not rate limited."""
+    scraper = RealPythonScraper(url, http=HttpClient(limiter=HostRateLimiter()))
+    scraper.http.limiter.configure('127.0.0.1', rate=1000, burst=100)
+    return scraper
+
+
+def test_async_scrape_fetches_listing_and_details():
+    """Test that AsyncWebScraper extracts cards and fills authors from detail pages."""
+    pages = {}
+    server, base_url = start_server(pages)
+    pages.update(_realpython_pages(base_url))
+
+    scraper = _unthrottled_scraper(base_url + '/')
+
+    async def scrape():
+        async with create_client_session() as http:
+            return await AsyncWebScraper(scraper, http).scrape()
+
+    try:
+        articles = asyncio.run(scrape())
+    finally:
+        server.shutdown()
+
+    assert [a['title'] for a in articles] == ['Article 0', 'Article 1', 'Article 2']
+    assert [a['author'] for a in articles] == ['Author 0', 'Author 1', 'Author 2']
+    print("✓ AsyncWebScraper extracts and enriches articles")
+
+
+def test_async_fetch_url_returns_none_on_http_error():
+    """Test that a failed fetch returns None instead of raising."""
+    server, base_url = start_server({})
+    scraper = _unthrottled_scraper(base_url + '/')
+
+    async def fetch():
+        async with create_client_session() as http:
+            return await AsyncWebScraper(scraper, http).fetch_page()
+
+    try:
+        assert asyncio.run(fetch()) is None
+    finally:
+        server.shutdown()
+    print("✓ AsyncWebScraper returns None for failed fetches")
+
+
+def test_run_many_async_saves_to_db_file():
+    """Test run_many_async end to end: fetch, extract off the event loop and save to db_file."""
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    # Forget cached engines so run_many_async creates the schema again
+    dispose_engines()
+
+    # Every page shares articles and authors with its neighbour
+    pages = {
+        f'/page-{p}': ''.join(
+            f'<article class="post"><h2>Post {i}</h2><a href="https://example.com/post-{i}">Read</a>'
+            f'<span class="author">Author {i % 3}</span></article>'
+            for i in range(p * 5, p * 5 + 10)
+        )
+        for p in range(4)
+    }
+    server, base_url = start_server(pages)
+    urls = [base_url + path for path in pages]
+
+    parse_threads = []
+    original = WebScraper.extract_listing
+
+    def recording_extract_listing(self, html_content):
+        parse_threads.append(threading.current_thread())
+        return original(self, html_content)
+
+    WebScraper.extract_listing = recording_extract_listing
+    try:
+        first = run_many_async(urls, max_concurrency=4, db_file='test_scraper.db')
+        second = run_many_async(urls, max_concurrency=4, db_file='test_scraper.db')
+    finally:
+        WebScraper.extract_listing = original
+        server.shutdown()
+
+    assert all(r['status'] == 'success' and r['errors'] == 0 for r in first), first
+    assert sum(r['created'] for r in first) == 25
+    assert sum(r['skipped'] for r in first) == 15
+    assert [r['status'] for r in second] == ['unchanged'] * 4
+    # Listings were parsed in worker threads, not on the event loop's thread
+    assert len(parse_threads) == 4 and threading.main_thread() not in parse_threads
+
+    session = SessionLocal()
+    try:
+        assert len(ArticleRepository(session).list_articles()) == 25
+        assert sorted(a.name for a in AuthorRepository(session).list_authors()) == ['Author 0', 'Author 1', 'Author 2']
+    finally:
+        session.close()
+    print("✓ run_many_async saves every page to db_file")
+
+
+if __name__ == '__main__':
+    print("Running async scraper tests...\n")
+    test_async_scrape_fetches_listing_and_details()
+    test_async_fetch_url_returns_none_on_http_error()
+    test_run_many_async_saves_to_db_file()
+    print("\n✅ All async scraper tests passed!")
@@ -0,0 +1,63 @@
+"""Tests for the persisted Cloudflare clearance cache."""
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import requests
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.clearance_cache import ClearanceCache
+
+HOST = 'www.datacamp.com'
+
+
+def _session_with_clearance(value, expires=None):
+    session = requests.Session()
+    session.headers['User-Agent'] = 'TestBrowser/1.0'
+    session.cookies.set('cf_clearance', value, domain='.datacamp.com', path='/', expires=expires)
+    session.cookies.set('__cf_bm', 'bm', domain='.datacamp.com', path='/')
+    return session
+
+
+def test_clearance_round_trip():
+    """Test that a stored clearance is restored into a fresh session."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ClearanceCache(str(Path(tmp) / 'clearance.json'))
+        assert cache.store(_session_with_clearance('abc'), HOST)
+
+        fresh = requests.Session()
+        assert cache.apply(fresh, HOST)
+        assert fresh.cookies.get('cf_clearance', domain='.datacamp.com') == 'abc'
+        assert fresh.cookies.get('__cf_bm', domain='.datacamp.com') == 'bm'
+        assert fresh.headers['User-Agent'] == 'TestBrowser/1.0'
+
+        # A new cache instance (next run) reads the same file
+        assert ClearanceCache(cache.path).load(HOST)['user_agent'] == 'TestBrowser/1.0'
+    print("✓ Clearance cookies and user agent persist across sessions")
+
+
+def test_clearance_expiry_and_unchanged_store():
+    """Test that expired entries are ignored and unchanged clearances are not rewritten."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ClearanceCache(str(Path(tmp) / 'clearance.json'))
+        assert cache.store(_session_with_clearance('abc'), HOST)
+        assert not cache.store(_session_with_clearance('abc'), HOST)
+
+        cache.store(_session_with_clearance('old', expires=int(time.time()) + 1), HOST)
+        time.sleep(1.1)
+        assert cache.load(HOST) is None
+        assert not cache.apply(requests.Session(), HOST)
+
+        # Sessions without a clearance cookie are never stored
+        assert not cache.store(requests.Session(), HOST)
+    print("✓ Expired clearances are ignored")
+
+
+if __name__ == '__main__':
+    print("Running clearance cache tests...\n")
+    test_clearance_round_trip()
+    test_clearance_expiry_and_unchanged_store()
+    print("\n✅ All clearance cache tests passed!")
@@ -0,0 +1,134 @@
+"""Tests for SQLite connection profiles."""
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event, text
+
+from webscraper_core import database
+from webscraper_core.database import (
+    create_connection, get_session_factory, ensure_schema, dispose_engines, SQLITE_PROFILES
+)
+
+
+def _pragmas(session, names):
+    return {name: session.execute(text(f'PRAGMA {name}')).scalar() for name in names}
+
+
+def test_performance_profile_applied_on_connect():
+    """Test that the performance profile's PRAGMAs are set on each connection."""
+    with tempfile.TemporaryDirectory() as tmp:
+        SessionLocal = create_connection(os.path.join(tmp, 'profile.db'), profile='performance')
+        session = SessionLocal()
+        try:
+            values = _pragmas(session, SQLITE_PROFILES['performance'])
+        finally:
+            session.close()
+            database.engine.dispose()
+
+    assert values['journal_mode'] == 'wal'
+    assert values['synchronous'] == 1  # NORMAL
+    assert values['busy_timeout'] == 5000
+    assert values['cache_size'] == -65536
+    assert values['temp_store'] == 2  # MEMORY
+    print("✓ Performance profile PRAGMAs applied on connect")
+
+
+def test_default_profile_and_unknown_profile():
+    """Test that the default profile leaves SQLite settings alone and unknown names fail."""
+    with tempfile.TemporaryDirectory() as tmp:
+        SessionLocal = create_connection(os.path.join(tmp, 'default.db'))
+        session = SessionLocal()
+        try:
+            values = _pragmas(session, ['journal_mode', 'synchronous'])
+        finally:
+            session.close()
+            database.engine.dispose()
+
+        assert values == {'journal_mode': 'delete', 'synchronous': 2}  # FULL
+        assert create_connection(os.path.join(tmp, 'other.db'), profile='turbo') is None
+    print("✓ Default profile keeps SQLite defaults; unknown profiles are rejected")
+
+
+
+def _count_authors(SessionLocal):
+    session = SessionLocal()
+    try:
+        return session.execute(text("SELECT count(*) FROM author")).scalar()
+    finally:
+        session.close()
+
+
+def test_in_memory_database():
+    """Test that in-memory databases work with both connection helpers."""
+    try:
+        for SessionLocal in (create_connection(':memory:'), get_session_factory(':memory:')):
+            assert SessionLocal is not None
+            database.Base.metadata.create_all(SessionLocal.kw['bind'])
+            session = SessionLocal()
+            try:
+                session.execute(text("INSERT INTO author (name) VALUES ('Jane Doe')"))
+                session.commit()
+            finally:
+                session.close()
+            # Sessions opened in other threads see the same database
+            with ThreadPoolExecutor(max_workers=1) as ex:
+                count = ex.submit(_count_authors, SessionLocal).result()
+            assert count == 1
+    finally:
+        database.engine.dispose()
+        dispose_engines()
+    print("✓ In-memory databases are supported")
+
+
+def test_engine_registry_reuses_engine_and_schema():
+    """Test that repeated calls share one engine and create the schema only once."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = os.path.join(tmp, 'registry.db')
+        try:
+            SessionLocal = get_session_factory(db_file, profile='performance', pool_size=3)
+            engine = SessionLocal.kw['bind']
+
+            # Same database, given relative to a different directory: same engine
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                assert get_session_factory('registry.db', profile='performance', pool_size=3) is SessionLocal
+            finally:
+                os.chdir(cwd)
+            assert get_session_factory(db_file, pool_size=3) is not SessionLocal
+
+            statements = []
+            event.listen(engine, 'before_cursor_execute',
+                         lambda conn, cursor, statement, *args: statements.append(statement))
+            assert ensure_schema(engine) is True
+            assert statements == []  # schema already created by get_session_factory
+
+            session = SessionLocal()
+            try:
+                tables = {name for (name,) in session.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'table'"))}
+            finally:
+                session.close()
+            assert {'author', 'article', 'page_fingerprint'} <= tables
+        finally:
+            dispose_engines()
+
+        # A disposed registry builds a new engine
+        assert get_session_factory(db_file, profile='performance', pool_size=3) is not SessionLocal
+        dispose_engines()
+    print("✓ Engine registry reuses engines and creates the schema once")
+
+
+if __name__ == '__main__':
+    print("Running database profile tests...\n")
+    test_performance_profile_applied_on_connect()
+    test_default_profile_and_unknown_profile()
+    test_in_memory_database()
+    test_engine_registry_reuses_engine_and_schema()
+    print("\n✅ All database profile tests passed!")
@@ -0,0 +1,58 @@
+"""Tests for card-scoped DataCamp article extraction (no network)."""
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.scrapers.datacamp_scraper import DataCampScraper
+
+
+def make_card(index: int, authors=('Matt Crabtree', 'Adel Nehme'), day: str = 'November 22, 2024') -> str:
+    """Build a card with the structure documented in docs/DATA_CAMP_RULES.md."""
+    author_blocks = ''.join(
+        f'<div><div><div><a data-trackid="media-visit-author-profile" href="/portfolio/{i}">'
+        f'<img alt="photo"></a></div></div><div><p>{name}<!-- --> </p></div></div>'
+        for i, name in enumerate(authors)
+    )
+    return (
+        f'<div data-trackid="media-card-Article {index}"><div>'
+        f'<object><a data-trackid="blog-category-badge" href="/blog/category/python"><strong>Python</strong></a></object>'
+        f'<a data-trackid="media-card-/blog/article-{index}" href="/blog/article-{index}"><h2>Article {index}</h2></a>'
+        f'</div><div>{author_blocks}<p>{day}</p></div></div>'
+    )
+
+
+def test_card_fields():
+    """Test title, url, co-authors and date of a documented card."""
+    scraper = DataCampScraper('https://www.datacamp.com/blog')
+    articles = scraper.extract_article_data(f'<html><body>{make_card(1)}</body></html>')
+
+    assert articles == [{
+        'title': 'Article 1',
+        'author': 'Matt Crabtree, Adel Nehme',
+        'url': 'https://www.datacamp.com/blog/article-1',
+        'publication_date': date(2024, 11, 22),
+    }]
+    print("✓ Card fields extracted")
+
+
+def test_authors_do_not_leak_between_cards():
+    """Test that a card whose author name is missing does not take the next card's."""
+    broken = make_card(1, authors=()).replace('</div></div>', (
+        '<a data-trackid="media-visit-author-profile" href="/portfolio/x"><img></a></div></div>'), 1)
+    html = f'<html><body>{broken}{make_card(2, authors=("May Lee",))}</body></html>'
+    articles = DataCampScraper('https://www.datacamp.com/blog').extract_article_data(html)
+
+    assert [a['author'] for a in articles] == ['Unknown', 'May Lee']
+    # An author named after a month is not mistaken for the date
+    assert articles[1]['publication_date'] == date(2024, 11, 22)
+    print("✓ Author lookup stays inside its card")
+
+
+if __name__ == '__main__':
+    print("Running DataCamp card tests...\n")
+    test_card_fields()
+    test_authors_do_not_leak_between_cards()
+    print("\n✅ All DataCamp card tests passed!")
@@ -0,0 +1,79 @@
+"""Tests for the shared date parsing module."""
+import io
+import sys
+from contextlib import redirect_stdout
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.dates import parse_date, parse_dates, contains_month, _parse_date_cached
+from webscraper_core.scraper import WebScraper
+from webscraper_core.scrapers.realpython_scraper import RealPythonScraper
+from webscraper_core.scrapers.freecodecamp_scraper import FreeCodeCampScraper
+from webscraper_core.scrapers.datacamp_scraper import DataCampScraper
+
+
+def test_parse_date_formats():
+    """Test every supported article date shape."""
+    expected = date(2024, 10, 18)
+    for text in ("2024-10-18", "2024-10-18T10:30:00", "2024-10-18T10:30:00+00:00",
+                 "2024-10-18T10:30:00.000Z", "October 18, 2024", "Oct 18, 2024",
+                 "oct 18, 2024", "18 October 2024", "18 Oct 2024", "  Oct 18, 2024 "):
+        assert parse_date(text) == expected, text
+    print("✓ All supported date formats parse")
+
+
+def test_parse_date_rejects_invalid():
+    """Test that unknown shapes and impossible dates return None."""
+    for text in (None, "", "yesterday", "Updated Oct 18, 2024", "2024-02-30", "Feb 30, 2024", "2024-13-01"):
+        assert parse_date(text) is None, text
+    assert parse_date("Feb 29, 2024") == date(2024, 2, 29)
+    print("✓ Invalid dates return None")
+
+
+def test_parse_dates_batch_and_memo():
+    """Test the batch API and that repeated strings hit the memo."""
+    texts = ["Nov 22, 2024", "Nov 22, 2024", None, "2024-11-21"] * 5
+    before = _parse_date_cached.cache_info()
+    results = parse_dates(texts)
+    after = _parse_date_cached.cache_info()
+
+    assert results == [date(2024, 11, 22), date(2024, 11, 22), None, date(2024, 11, 21)] * 5
+    # Two distinct strings parsed at most once each
+    assert after.misses - before.misses <= 2
+    print("✓ Batch parsing reuses results for repeated strings")
+
+
+def test_contains_month():
+    """Test month detection on page text."""
+    assert contains_month("Oct 15, 2025")
+    assert contains_month("November 22, 2024")
+    assert contains_month("Sept 3, 2024")
+    assert not contains_month("Mayer Smith")
+    assert not contains_month("")
+    print("✓ Month names are detected as whole words")
+
+
+def test_unparsed_date_warnings():
+    """Test that only the generic scraper warns about unparseable dates."""
+    for scraper, warns in ((WebScraper("https://example.com"), True),
+                           (RealPythonScraper("https://realpython.com/"), False),
+                           (FreeCodeCampScraper("https://www.freecodecamp.org/news"), False),
+                           (DataCampScraper("https://www.datacamp.com/blog"), False)):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            assert scraper._parse_date("sometime soon") is None
+        assert ("Could not parse date" in output.getvalue()) == warns, type(scraper).__name__
+    print("✓ Site scrapers skip unparseable dates quietly")
+
+
+if __name__ == '__main__':
+    print("Running date parsing tests...\n")
+    test_parse_date_formats()
+    test_parse_date_rejects_invalid()
+    test_parse_dates_batch_and_memo()
+    test_contains_month()
+    test_unparsed_date_warnings()
+    print("\n✅ All date parsing tests passed!")
@@ -0,0 +1,120 @@
+"""Tests for detail-page enrichment in the site scrapers."""
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.scrapers.realpython_scraper import RealPythonScraper
+from webscraper_core.http_client import HttpClient
+from webscraper_core.rate_limit import HostRateLimiter
+
+
+AUTHOR_PAGE = """
+<div class="card mt-3" id="author">
+    <p class="card-header h3">About <strong>{name}</strong></p>
+</div>
+"""
+
+
+class _SlowDetailScraper(RealPythonScraper):
+    """RealPythonScraper whose detail fetch sleeps instead of using the network."""
+
+    def __init__(self, url, **kwargs):
+        super().__init__(url, **kwargs)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def fetch_detail_page(self, article_url):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.1)
+        with self._lock:
+            self.active -= 1
+        return AUTHOR_PAGE.format(name=article_url.rsplit('/', 2)[-2])
+
+
+def _articles(count):
+    return [
+        {'title': f'Article {i}', 'author': 'Unknown',
+         'url': f'https://realpython.com/author-{i}/', 'publication_date': None}
+        for i in range(count)
+    ]
+
+
+def test_realpython_enrichment_runs_concurrently():
+    """Test that author pages are fetched in parallel and merged back in order."""
+    scraper = _SlowDetailScraper('https://realpython.com/', http=HttpClient(limiter=HostRateLimiter()))
+    articles = _articles(10)
+
+    start = time.monotonic()
+    scraper.enrich_articles(articles)
+    elapsed = time.monotonic() - start
+
+    assert [a['author'] for a in articles] == [f'author-{i}' for i in range(10)]
+    assert scraper.max_active == scraper.DETAIL_WORKERS
+    assert elapsed < 0.1 * 10 / 2
+    print("✓ Detail pages fetched concurrently within DETAIL_WORKERS")
+
+
+def test_enrichment_skips_articles_with_known_author():
+    """Test that only articles still missing an author are fetched."""
+    scraper = _SlowDetailScraper('https://realpython.com/', http=HttpClient(limiter=HostRateLimiter()))
+    articles = _articles(3)
+    articles[1]['author'] = 'Already Known'
+
+    scraper.enrich_articles(articles)
+    assert [a['author'] for a in articles] == ['author-0', 'Already Known', 'author-2']
+    print("✓ Enrichment only fetches articles that need it")
+
+
+def test_iter_enriched_streams_in_order():
+    """Test that the first article is yielded after one fetch and input is read lazily."""
+    scraper = _SlowDetailScraper('https://realpython.com/', http=HttpClient(limiter=HostRateLimiter()))
+    consumed = []
+
+    def source():
+        for article in _articles(10):
+            consumed.append(article)
+            yield article
+
+    stream = scraper.iter_enriched(source())
+    start = time.monotonic()
+    first = next(stream)
+    first_elapsed = time.monotonic() - start
+    read_ahead = len(consumed)
+    rest = list(stream)
+
+    assert first['author'] == 'author-0'
+    assert first_elapsed < 0.1 * 2
+    assert read_ahead <= scraper.DETAIL_WORKERS + 1
+    assert [a['author'] for a in rest] == [f'author-{i}' for i in range(1, 10)]
+    print("✓ Enriched articles stream in order with bounded read-ahead")
+
+
+def test_iter_articles_is_a_generator():
+    """Test that listing extraction can be consumed one card at a time."""
+    html = ''.join(
+        f'<div class="card border-0"><a href="/a-{i}/"><h2 class="card-title">A {i}</h2></a></div>'
+        for i in range(3)
+    )
+    scraper = RealPythonScraper('https://realpython.com/', http=HttpClient(limiter=HostRateLimiter()))
+    stream = scraper.iter_articles(html)
+
+    assert next(stream)['url'] == 'https://realpython.com/a-0/'
+    assert [a['title'] for a in stream] == ['A 1', 'A 2']
+    assert scraper.extract_listing(html) == list(scraper.iter_articles(html))
+    print("✓ iter_articles yields cards one at a time")
+
+
+if __name__ == '__main__':
+    print("Running enrichment tests...\n")
+    test_realpython_enrichment_runs_concurrently()
+    test_enrichment_skips_articles_with_known_author()
+    test_iter_enriched_streams_in_order()
+    test_iter_articles_is_a_generator()
+    print("\n✅ All enrichment tests passed!")
@@ -0,0 +1,71 @@
+"""Tests for process-pool listing extraction."""
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.extraction import scraper_name_for_url, extract_records, create_parse_pool
+from webscraper_core.scrapers.realpython_scraper import RealPythonScraper
+from webscraper_core.database import create_connection, create_tables
+from webscraper_core.models import Base
+from webscraper_core.manager import _process_single
+from tests.local_server import start_server
+from tests.test_parsing import REALPYTHON_HTML
+
+
+def test_scraper_name_for_url():
+    """Test that URLs map to the registered site scrapers."""
+    assert scraper_name_for_url("https://realpython.com/") == 'realpython'
+    assert scraper_name_for_url("https://www.freecodecamp.org/news") == 'freecodecamp'
+    assert scraper_name_for_url("https://www.datacamp.com/blog") == 'datacamp'
+    assert scraper_name_for_url("https://example.com/blog") == 'generic'
+    print("✓ URLs map to scraper names")
+
+
+def test_pool_extraction_matches_in_process():
+    """Test that workers return the same records as in-process extraction."""
+    url = "https://realpython.com/"
+    expected = RealPythonScraper(url).extract_listing(REALPYTHON_HTML)
+
+    with create_parse_pool(2) as pool:
+        futures = [pool.submit(extract_records, 'realpython', url, REALPYTHON_HTML.encode('utf-8'))
+                   for _ in range(4)]
+        results = [f.result() for f in futures]
+
+    assert len(expected) == 2
+    assert all(r == expected for r in results)
+    print("✓ Parse pool returns the same articles as in-process extraction")
+
+
+def test_process_single_with_parse_pool():
+    """Test the full fetch/extract/save path with extraction in a worker process."""
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    create_tables()
+    session = SessionLocal()
+
+    pages = {'/blog': """
+    <article class="post"><h2>First</h2><a href="https://example.com/first">Read</a></article>
+    <article class="post"><h2>Second</h2><a href="https://example.com/second">Read</a></article>
+    """}
+    server, base_url = start_server(pages)
+    try:
+        with create_parse_pool(1) as pool:
+            result = _process_single(base_url + '/blog', session, parse_pool=pool)
+    finally:
+        server.shutdown()
+        session.close()
+
+    assert result['status'] == 'success'
+    assert result['created'] == 2
+    print("✓ _process_single extracts through the parse pool")
+
+
+if __name__ == '__main__':
+    print("Running parse pool tests...\n")
+    test_scraper_name_for_url()
+    test_pool_extraction_matches_in_process()
+    test_process_single_with_parse_pool()
+    print("\n✅ All parse pool tests passed!")
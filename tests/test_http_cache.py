@@ -0,0 +1,74 @@
+"""Tests for the on-disk HTTP cache with conditional GET."""
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.http_cache import HttpCache
+from webscraper_core.http_client import HttpClient
+from webscraper_core.rate_limit import HostRateLimiter
+from webscraper_core.scraper import WebScraper
+from webscraper_core.async_scraper import AsyncWebScraper, create_client_session
+from tests.local_server import start_server
+
+
+def test_fetch_page_revalidates_with_etag():
+    """Test that a cached page is revalidated and served from disk on 304."""
+    server, base_url = start_server({'/news': '<html>v1</html>'}, etags={'/news': '"v1"'})
+    client = HttpClient(limiter=HostRateLimiter())
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = WebScraper(base_url + '/news', http=client, cache=HttpCache(tmp))
+        try:
+            assert scraper.fetch_page() == '<html>v1</html>'
+            assert scraper.fetch_page() == '<html>v1</html>'
+        finally:
+            server.shutdown()
+
+    first_headers, second_headers = server.requests[0][1], server.requests[1][1]
+    assert 'If-None-Match' not in first_headers
+    assert second_headers['If-None-Match'] == '"v1"'
+    print("✓ Cached page is revalidated with If-None-Match and served on 304")
+
+
+def test_responses_without_validators_are_not_cached():
+    """Test that only responses with ETag or Last-Modified are stored."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HttpCache(tmp)
+        assert not cache.store('https://example.com/', 'body', {})
+        assert cache.lookup('https://example.com/') is None
+
+        assert cache.store('https://example.com/', 'body', {'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        cached = cache.lookup('https://example.com/')
+        assert cached.body == 'body'
+        assert cached.validators() == {'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    print("✓ Only responses with validators are cached")
+
+
+def test_async_fetch_page_uses_cache():
+    """Test that the async engine sends validators and uses the cached body on 304."""
+    server, base_url = start_server({'/': '<html>async</html>'}, etags={'/': '"a"'})
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = WebScraper(base_url + '/', http=HttpClient(limiter=HostRateLimiter()), cache=HttpCache(tmp))
+
+        async def fetch_twice():
+            async with create_client_session() as http:
+                engine = AsyncWebScraper(scraper, http)
+                return [await engine.fetch_page(), await engine.fetch_page()]
+
+        try:
+            assert asyncio.run(fetch_twice()) == ['<html>async</html>'] * 2
+        finally:
+            server.shutdown()
+    assert server.requests[1][1]['If-None-Match'] == '"a"'
+    print("✓ Async engine revalidates cached pages")
+
+
+if __name__ == '__main__':
+    print("Running HTTP cache tests...\n")
+    test_fetch_page_revalidates_with_etag()
+    test_responses_without_validators_are_not_cached()
+    test_async_fetch_page_uses_cache()
+    print("\n✅ All HTTP cache tests passed!")
@@ -0,0 +1,83 @@
+"""Tests for the shared pooled HttpClient."""
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cloudscraper
+
+from webscraper_core.http_client import HttpClient, get_default_client
+from webscraper_core.rate_limit import HostRateLimiter
+from webscraper_core.scraper import WebScraper
+from webscraper_core.scrapers.realpython_scraper import RealPythonScraper
+from webscraper_core.scrapers.datacamp_scraper import DataCampScraper, get_cloud_client
+from tests.local_server import start_server
+
+
+def test_client_reuses_keep_alive_connection():
+    """Test that consecutive requests to one host share a single TCP connection."""
+    server, base_url = start_server({'/a': 'A', '/b': 'B'}, keep_alive=True)
+    client = HttpClient(limiter=HostRateLimiter())
+    try:
+        assert client.get(base_url + '/a').text == 'A'
+        assert client.get(base_url + '/b').text == 'B'
+        assert client.get(base_url + '/a').text == 'A'
+    finally:
+        client.close()
+        server.shutdown()
+
+    client_ports = {port for _, _, port in server.requests}
+    assert len(server.requests) == 3
+    assert len(client_ports) == 1
+    print("✓ HttpClient reuses keep-alive connections")
+
+
+def test_scrapers_share_default_client():
+    """Test that scrapers use the shared client unless one is injected."""
+    assert WebScraper("https://example.com").http is get_default_client()
+    assert RealPythonScraper("https://realpython.com/").http is get_default_client()
+    assert DataCampScraper("https://www.datacamp.com/blog").http is get_cloud_client()
+
+    custom = HttpClient(pool_maxsize=2)
+    assert WebScraper("https://example.com", http=custom).http is custom
+    print("✓ Scrapers share pooled clients and accept injected ones")
+
+
+def test_fetch_page_uses_injected_client():
+    """Test that fetch_page goes through the injected client."""
+    server, base_url = start_server({'/': '<html></html>'}, keep_alive=True)
+    client = HttpClient(connect_timeout=1, read_timeout=1, limiter=HostRateLimiter())
+    try:
+        assert WebScraper(base_url + '/', http=client).fetch_page() == '<html></html>'
+        assert WebScraper(base_url + '/missing', http=client).fetch_page() is None
+    finally:
+        client.close()
+        server.shutdown()
+    print("✓ fetch_page uses the injected client")
+
+
+def test_passed_in_session_keeps_its_adapters():
+    """Test that a cloudscraper session keeps its TLS adapter, with resized pools."""
+    session = cloudscraper.create_scraper()
+    tls_adapter = session.adapters['https://']
+
+    client = HttpClient(session=session, pool_maxsize=3)
+    try:
+        assert client.session.adapters['https://'] is tls_adapter
+        assert isinstance(tls_adapter, cloudscraper.CipherSuiteAdapter)
+        assert tls_adapter.poolmanager.connection_pool_kw['maxsize'] == 3
+        assert tls_adapter.poolmanager.connection_pool_kw['ssl_context'] is tls_adapter.ssl_context
+        assert isinstance(get_cloud_client().session.adapters['https://'], cloudscraper.CipherSuiteAdapter)
+    finally:
+        client.close()
+    print("✓ Passed-in sessions keep their own adapters")
+
+
+if __name__ == '__main__':
+    print("Running HTTP client tests...\n")
+    test_client_reuses_keep_alive_connection()
+    test_scrapers_share_default_client()
+    test_fetch_page_uses_injected_client()
+    test_passed_in_session_keeps_its_adapters()
+    print("\n✅ All HTTP client tests passed!")
@@ -5,12 +5,18 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from webscraper_core.manager import run_many_and_aggregate, _save_articles_to_db
-from webscraper_core.database import create_connection, create_tables
+from webscraper_core.manager import (
+    run, run_many, run_many_and_aggregate, aggregate_results, _save_articles_to_db, _filter_new_articles,
+    _process_single, _prepare_records
+)
+from webscraper_core.scraper import WebScraper
+from webscraper_core.records import ArticleRecord
+from webscraper_core.database import create_connection, create_tables, dispose_engines
 from webscraper_core.models import Base
 from webscraper_core.repositories.author_repository import AuthorRepository
 from webscraper_core.repositories.article_repository import ArticleRepository
 from datetime import date
+from tests.local_server import start_server
 
 
 def test_main_workflow_with_mock_data():
@@ -153,8 +159,190 @@ def test_aggregated_statistics_calculation():
     print(f"  Total Skipped: {total_skipped}")
 
 
+def test_known_urls_are_filtered_before_enrichment():
+    """Test that articles already in the database are split off in one bulk lookup."""
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    create_tables()
+    session = SessionLocal()
+
+    author = AuthorRepository(session).get_or_create('Author A')
+    article_repo = ArticleRepository(session)
+    article_repo.add_article_with_dedup({'title': 'Stored', 'url': 'https://realpython.com/stored/'}, author)
+
+    assert article_repo.get_existing_urls(
+        ['https://realpython.com/stored/', 'https://realpython.com/new/', None]
+    ) == {'https://realpython.com/stored/'}
+
+    articles = [
+        {'title': 'Stored', 'author': 'Unknown', 'url': 'https://realpython.com/stored/'},
+        {'title': 'New', 'author': 'Unknown', 'url': 'https://realpython.com/new/'},
+    ]
+    new_articles, known = _filter_new_articles(articles, session)
+    assert [a['url'] for a in new_articles] == ['https://realpython.com/new/']
+    assert known == 1
+
+    session.close()
+    print("✓ Known URLs are skipped before detail-page enrichment")
+
+
+def test_unchanged_page_is_short_circuited():
+    """Test that a byte-identical page skips extraction and DB work on the next run."""
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    create_tables()
+    session = SessionLocal()
+
+    listing = """
+    <article class="post"><h2>First</h2><a href="https://example.com/first">Read</a></article>
+    <article class="post"><h2>Second</h2><a href="https://example.com/second">Read</a></article>
+    """
+    pages = {'/blog': listing}
+    server, base_url = start_server(pages)
+    url = base_url + '/blog'
+    try:
+        first = _process_single(url, session)
+        second = _process_single(url, session)
+        forced = _process_single(url, session, skip_unchanged=False)
+        pages['/blog'] = listing + '<article class="post"><h2>Third</h2><a href="https://example.com/third">Read</a></article>'
+        changed = _process_single(url, session)
+    finally:
+        server.shutdown()
+        session.close()
+
+    assert first['status'] == 'success' and first['created'] == 2
+    assert second['status'] == 'unchanged' and second['created'] == 0
+    assert forced['status'] == 'success' and forced['skipped'] == 2
+    assert changed['status'] == 'success' and changed['created'] == 1 and changed['skipped'] == 2
+
+    stats = aggregate_results([first, second, changed])
+    assert stats['successful_urls'] == 2
+    assert stats['unchanged_urls'] == 1
+    assert stats['failed_urls'] == 0
+    print("✓ Unchanged pages are reported as 'unchanged' without extraction")
+
+
+
+def test_run_many_workers_use_own_sessions():
+    """Test that concurrent workers writing overlapping articles and authors stay consistent."""
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    # Forget cached engines so run_many creates the schema again
+    dispose_engines()
+
+    # Every page shares articles and authors with its neighbours
+    pages = {
+        f'/page-{p}': ''.join(
+            f'<article class="post"><h2>Post {i}</h2><a href="https://example.com/post-{i}">Read</a>'
+            f'<span class="author">Author {i % 3}</span></article>'
+            for i in range(p * 5, p * 5 + 10)
+        )
+        for p in range(8)
+    }
+    server, base_url = start_server(pages)
+    try:
+        results = run_many([base_url + path for path in pages], max_workers=8, db_file='test_scraper.db')
+    finally:
+        server.shutdown()
+
+    assert all(r['status'] == 'success' and r['errors'] == 0 for r in results), results
+    assert sum(r['created'] for r in results) == 45
+    assert sum(r['total_articles'] for r in results) == 80
+
+    SessionLocal = create_connection('test_scraper.db')
+    session = SessionLocal()
+    try:
+        assert len(ArticleRepository(session).list_articles()) == 45
+        assert sorted(a.name for a in AuthorRepository(session).list_authors()) == ['Author 0', 'Author 1', 'Author 2']
+    finally:
+        session.close()
+    print("✓ run_many workers write concurrently through their own sessions")
+
+
+def test_run_many_rejects_in_memory_database():
+    """Test that run_many refuses an in-memory database its workers could not share."""
+    pages = {'/blog': '<article class="post"><h2>Post</h2><a href="https://example.com/post">Read</a></article>'}
+    server, base_url = start_server(pages)
+    try:
+        assert run_many([base_url + '/blog'], max_workers=2, db_file=':memory:') == []
+    finally:
+        server.shutdown()
+    # Nothing was fetched
+    assert server.requests == []
+    print("✓ run_many rejects in-memory databases")
+
+
+def test_author_fallback_limit_is_per_page():
+    """Test that the Real Python author fallback covers the first 3 articles of a page, not of each batch."""
+    fetched = []
+    original = WebScraper.fetch_realpython_author
+    WebScraper.fetch_realpython_author = lambda self, url: fetched.append(url) or 'Jane Doe'
+    try:
+        page = [ArticleRecord(title=f'Post {i}', url=f'https://realpython.com/post-{i}/') for i in range(6)]
+        # The page is saved in batches of two
+        for start in range(0, 6, 2):
+            records, errors = _prepare_records(page[start:start + 2], 'https://realpython.com/', start_index=start)
+            assert errors == 0 and len(records) == 2
+    finally:
+        WebScraper.fetch_realpython_author = original
+
+    assert fetched == [f'https://realpython.com/post-{i}/' for i in range(3)]
+    assert [a.author for a in page] == ['Jane Doe'] * 3 + ['Unknown'] * 3
+    print("✓ Author fallback limit applies per listing page")
+
+
+def test_run_skips_known_urls_before_enrichment():
+    """Test that run() fetches detail pages only for articles not yet in the database."""
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    # Forget cached engines so run creates the schema again
+    dispose_engines()
+    create_tables()
+
+    pages = {'/post-0': '<p>Stored</p>', '/post-1': '<p>New</p>'}
+    server, base_url = start_server(pages)
+    pages['/blog'] = ''.join(
+        f'<article class="post"><h2>Post {i}</h2><a href="{base_url}/post-{i}">Read</a></article>'
+        for i in range(2)
+    )
+    session = SessionLocal()
+    author = AuthorRepository(session).get_or_create('Author A')
+    ArticleRepository(session).add_article_with_dedup({'title': 'Post 0', 'url': f'{base_url}/post-0'}, author)
+    session.close()
+
+    original = WebScraper.detail_url
+    WebScraper.detail_url = lambda self, article: article.get('url')
+    try:
+        run(base_url + '/blog', db_file='test_scraper.db')
+    finally:
+        WebScraper.detail_url = original
+        server.shutdown()
+
+    assert [r[0] for r in server.requests if r[0] != '/blog'] == ['/post-1']
+    session = SessionLocal()
+    try:
+        assert sorted(a.url for a in ArticleRepository(session).list_articles()) == [
+            f'{base_url}/post-0', f'{base_url}/post-1',
+        ]
+    finally:
+        session.close()
+    print("✓ run() skips known articles before detail-page enrichment")
+
+
 if __name__ == '__main__':
     print("Testing main.py multi-site scraping workflow...\n")
     test_main_workflow_with_mock_data()
     test_aggregated_statistics_calculation()
+    test_known_urls_are_filtered_before_enrichment()
+    test_unchanged_page_is_short_circuited()
+    test_run_many_workers_use_own_sessions()
+    test_run_many_rejects_in_memory_database()
+    test_author_fallback_limit_is_per_page()
+    test_run_skips_known_urls_before_enrichment()
     print("\n✅ Main.py multi-site scraping validated!")
@@ -0,0 +1,152 @@
+"""Tests for the configurable HTML parser backend."""
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.parsing import (
+    PARSERS, is_available, resolve_parser, set_default_parser, get_default_parser
+)
+from webscraper_core.scraper import WebScraper
+from webscraper_core.scrapers.realpython_scraper import RealPythonScraper
+from webscraper_core.scrapers.freecodecamp_scraper import FreeCodeCampScraper
+from webscraper_core.scrapers.datacamp_scraper import DataCampScraper
+
+
+REALPYTHON_HTML = """
+<html><body>
+  <div class="card border-0">
+    <a href="/python-parsers/"><h2 class="card-title">Choosing a Parser</h2></a>
+    <span class="mr-2">Oct 15, 2025</span>
+  </div>
+  <div class="card border-0">
+    <a href="/python-speed/"><h2 class="card-title">Speeding Up Python</h2></a>
+    <span class="mr-2">Oct 14, 2025</span>
+  </div>
+</body></html>
+"""
+
+FREECODECAMP_HTML = """
+<html><body>
+  <nav><a href="/news/">News</a></nav>
+  <div class="post-card featured">
+    <h2 class="post-card-title"><a href="/news/strainers/">Parsing Less HTML</a></h2>
+    <div class="post-card-content">
+      <footer class="post-card-meta">
+        <a class="meta-item" href="/news/author/jane/">Jane Doe</a>
+        <time datetime="2025-10-15T08:00:00.000Z">Oct 15, 2025</time>
+      </footer>
+    </div>
+  </div>
+</body></html>
+"""
+
+DATACAMP_HTML = """
+<html><body>
+  <header><p>DataCamp Blog</p></header>
+  <div data-trackid="media-card-1">
+    <a data-trackid="media-card-1" href="/blog/strainers"><h2>Strained Parsing</h2></a>
+    <a data-trackid="media-visit-author-profile" href="/portfolio/jane"><span></span></a>
+    <p>Jane Doe</p>
+    <p>November 22, 2024</p>
+  </div>
+</body></html>
+"""
+
+
+def test_parser_resolution_and_fallback():
+    """Test that a missing backend falls back to an installed one."""
+    assert resolve_parser('html.parser') == 'html.parser'
+    assert is_available(resolve_parser('not-a-parser'))
+
+    try:
+        set_default_parser('not-a-parser')
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    print("✓ Unknown or missing parsers fall back to an installed backend")
+
+
+def test_parser_precedence():
+    """Test instance override > site PARSER > global default."""
+    original = get_default_parser()
+
+    class HtmlParserSite(WebScraper):
+        PARSER = 'html.parser'
+
+    try:
+        set_default_parser('html.parser')
+        assert WebScraper("https://example.com")._make_soup('<p>x</p>').builder.NAME == 'html.parser'
+        set_default_parser('lxml')
+        assert HtmlParserSite("https://example.com")._make_soup('<p>x</p>').builder.NAME == 'html.parser'
+        scraper = HtmlParserSite("https://example.com", parser=resolve_parser('lxml'))
+        assert scraper._make_soup('<p>x</p>').builder.NAME == resolve_parser('lxml')
+    finally:
+        set_default_parser(original)
+    print("✓ Parser precedence: instance, site, global")
+
+
+def test_extraction_is_identical_across_backends():
+    """Test that every installed backend extracts the same Real Python cards."""
+    results = []
+    for name in PARSERS:
+        if is_available(name):
+            scraper = RealPythonScraper("https://realpython.com/", parser=name)
+            results.append(scraper.extract_listing(REALPYTHON_HTML))
+
+    assert len(results[0]) == 2
+    assert all(r == results[0] for r in results)
+    print(f"✓ {len(results)} parser backends produce identical articles")
+
+
+def test_strained_listing_matches_full_tree():
+    """Test that parsing only the card subtrees extracts the same articles."""
+    cases = [
+        (RealPythonScraper("https://realpython.com/"), REALPYTHON_HTML),
+        (FreeCodeCampScraper("https://www.freecodecamp.org/news/"), FREECODECAMP_HTML),
+        (DataCampScraper("https://www.datacamp.com/blog"), DATACAMP_HTML),
+    ]
+    for scraper, html in cases:
+        strained = scraper.extract_listing(html)
+        strainer = scraper.LISTING_STRAINER
+        try:
+            type(scraper).LISTING_STRAINER = None
+            full = scraper.extract_listing(html)
+        finally:
+            type(scraper).LISTING_STRAINER = strainer
+        assert strained and strained == full, type(scraper).__name__
+
+    soup = FreeCodeCampScraper("https://www.freecodecamp.org/news/")._make_soup(
+        FREECODECAMP_HTML, parse_only=FreeCodeCampScraper.LISTING_STRAINER)
+    assert soup.find('nav') is None
+    print("✓ Strained listing parses match full-tree parses")
+
+
+def test_strained_author_page():
+    """Test that Real Python author pages parse only the author box."""
+    html = """
+    <html><body><main><p>Long article body</p></main>
+      <div class="card mt-3" id="author">
+        <p class="card-header h3"><strong>Jane Doe</strong></p>
+      </div>
+    </body></html>
+    """
+    for name in PARSERS:
+        if is_available(name):
+            scraper = RealPythonScraper("https://realpython.com/", parser=name)
+            assert scraper._parse_author(html) == 'Jane Doe'
+    soup = RealPythonScraper("https://realpython.com/")._make_soup(
+        html, parse_only=RealPythonScraper.DETAIL_STRAINER)
+    assert soup.find('main') is None
+    print("✓ Author pages are parsed down to the author box")
+
+
+if __name__ == '__main__':
+    print("Running parser backend tests...\n")
+    test_parser_resolution_and_fallback()
+    test_parser_precedence()
+    test_extraction_is_identical_across_backends()
+    test_strained_listing_matches_full_tree()
+    test_strained_author_page()
+    print("\n✅ All parser backend tests passed!")
@@ -0,0 +1,148 @@
+"""Tests for the single-writer database stage."""
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.pipeline import ArticleWriter
+from webscraper_core.manager import run_many
+from webscraper_core.database import create_connection, create_tables
+from webscraper_core.models import Base
+from webscraper_core.records import ArticleRecord
+from webscraper_core.repositories.author_repository import AuthorRepository
+from webscraper_core.repositories.article_repository import ArticleRepository
+from webscraper_core.repositories.page_fingerprint_repository import PageFingerprintRepository
+from tests.local_server import start_server
+
+
+def _fresh_db():
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    create_tables()
+    return SessionLocal
+
+
+def _records(start, count, author='Jane Doe'):
+    return [ArticleRecord(title=f'Post {i}', author=author, url=f'https://example.com/post-{i}')
+            for i in range(start, start + count)]
+
+
+def test_writer_flushes_by_size():
+    """Test that submissions are combined into one transaction per full batch."""
+    SessionLocal = _fresh_db()
+
+    # A long interval, so only the batch size (or close) triggers a flush
+    with ArticleWriter(SessionLocal, batch_size=4, flush_interval=60) as writer:
+        first = writer.submit('https://example.com/a', _records(0, 2))
+        second = writer.submit('https://example.com/b', _records(1, 2, author='John Roe'))
+        assert first.result(timeout=5) == {'created': 2, 'skipped': 0, 'errors': 0}
+        assert second.result(timeout=5) == {'created': 1, 'skipped': 1, 'errors': 0}
+        assert writer.flushes == 1
+
+        third = writer.submit('https://example.com/c', _records(5, 1))
+    # close() writes what is still pending
+    assert third.result(timeout=0) == {'created': 1, 'skipped': 0, 'errors': 0}
+    assert writer.flushes == 2
+
+    session = SessionLocal()
+    try:
+        assert len(ArticleRepository(session).list_articles()) == 4
+        assert len(AuthorRepository(session).list_authors()) == 2
+    finally:
+        session.close()
+    print("✓ Writer combines submissions into batches")
+
+
+def test_writer_flushes_by_time():
+    """Test that a small submission is written once the flush interval passes."""
+    SessionLocal = _fresh_db()
+
+    with ArticleWriter(SessionLocal, batch_size=500, flush_interval=0.05) as writer:
+        result = writer.submit('https://example.com/a', _records(0, 1)).result(timeout=5)
+        assert result == {'created': 1, 'skipped': 0, 'errors': 0}
+        assert writer.save_fingerprint('https://example.com/a', 'abc').result(timeout=5) is True
+
+    session = SessionLocal()
+    try:
+        assert PageFingerprintRepository(session).get_hash('https://example.com/a') == 'abc'
+    finally:
+        session.close()
+    print("✓ Writer flushes partial batches after the flush interval")
+
+
+def test_run_many_single_writer():
+    """Test run_many with one writer thread saving every worker's articles."""
+    SessionLocal = _fresh_db()
+
+    # Every page shares articles and authors with its neighbours
+    pages = {
+        f'/page-{p}': ''.join(
+            f'<article class="post"><h2>Post {i}</h2><a href="https://example.com/post-{i}">Read</a>'
+            f'<span class="author">Author {i % 3}</span></article>'
+            for i in range(p * 5, p * 5 + 10)
+        )
+        for p in range(8)
+    }
+    server, base_url = start_server(pages)
+    try:
+        results = run_many([base_url + path for path in pages], max_workers=8,
+                           db_file='test_scraper.db', single_writer=True)
+    finally:
+        server.shutdown()
+
+    assert all(r['status'] == 'success' and r['errors'] == 0 for r in results), results
+    assert sum(r['created'] for r in results) == 45
+    assert sum(r['total_articles'] for r in results) == 80
+
+    SessionLocal = create_connection('test_scraper.db')
+    session = SessionLocal()
+    try:
+        assert len(ArticleRepository(session).list_articles()) == 45
+        assert len(AuthorRepository(session).list_authors()) == 3
+        assert all(PageFingerprintRepository(session).get_hash(base_url + path) for path in pages)
+    finally:
+        session.close()
+    print("✓ run_many saves through a single writer")
+
+
+class _CrashingWriter(ArticleWriter):
+    """Writer whose thread dies on its first flush."""
+
+    def _flush(self, session, pending):
+        raise SystemExit("writer crashed")
+
+
+def test_writer_failure_fails_waiting_callers():
+    """Test that a dead writer fails queued and later submissions instead of hanging."""
+    SessionLocal = _fresh_db()
+
+    writer = _CrashingWriter(SessionLocal, batch_size=1, max_pending=1)
+    futures = [writer.submit('https://example.com/a', _records(i, 1)) for i in range(5)]
+    for future in futures:
+        try:
+            future.result(timeout=5)
+            assert False, "expected RuntimeError"
+        except RuntimeError:
+            pass
+    writer.close()
+
+    # A writer that cannot even open its session
+    broken = ArticleWriter(lambda: 1 / 0, max_pending=1)
+    try:
+        broken.submit('https://example.com/b', _records(0, 1)).result(timeout=5)
+        assert False, "expected RuntimeError"
+    except RuntimeError:
+        pass
+    broken.close()
+    print("✓ A stopped writer fails its callers instead of blocking them")
+
+
+if __name__ == '__main__':
+    print("Running single-writer pipeline tests...\n")
+    test_writer_flushes_by_size()
+    test_writer_flushes_by_time()
+    test_writer_failure_fails_waiting_callers()
+    test_run_many_single_writer()
+    print("\n✅ All single-writer pipeline tests passed!")
@@ -0,0 +1,80 @@
+"""Tests for the per-host token-bucket rate limiter."""
+import sys
+import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.rate_limit import HostRateLimiter, parse_retry_after
+from webscraper_core.http_client import HttpClient
+from webscraper_core.scrapers.realpython_scraper import RealPythonScraper
+
+
+def test_token_bucket_burst_then_steady_rate():
+    """Test that a host allows `burst` requests at once, then spaces the rest."""
+    limiter = HostRateLimiter()
+    limiter.configure('a.example', rate=10, burst=3)
+
+    waits = [limiter.reserve('https://a.example/page') for _ in range(5)]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert 0.09 <= waits[3] <= 0.1
+    assert 0.19 <= waits[4] <= 0.2
+    print("✓ Token bucket allows a burst then the configured rate")
+
+
+def test_hosts_do_not_wait_on_each_other():
+    """Test that a throttled host does not delay requests to another host."""
+    limiter = HostRateLimiter()
+    limiter.configure('slow.example', rate=1, burst=1)
+
+    def fetch(url):
+        start = time.monotonic()
+        limiter.acquire(url)
+        return time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        slow = [ex.submit(fetch, 'https://slow.example/a'), ex.submit(fetch, 'https://slow.example/b')]
+        fast = ex.submit(fetch, 'https://fast.example/')
+        assert fast.result() < 0.1
+        assert sorted(f.result() for f in slow)[1] >= 0.9
+    print("✓ Different hosts never wait on each other")
+
+
+def test_retry_after_defers_host():
+    """Test that Retry-After holds the host and parses both header formats."""
+    limiter = HostRateLimiter()
+    limiter.defer('https://b.example/x', 5)
+    assert limiter.reserve('https://b.example/y') > 4
+    assert limiter.reserve('https://c.example/') == 0.0
+
+    assert parse_retry_after('120') == 120.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('soon') is None
+    print("✓ Retry-After defers only the affected host")
+
+
+def test_scraper_configures_site_limit():
+    """Test that site scrapers register their politeness limit on the client's limiter."""
+    limiter = HostRateLimiter()
+    client = HttpClient(limiter=limiter)
+    RealPythonScraper('https://realpython.com/', http=client)
+    RealPythonScraper('https://realpython.com/', http=client)
+
+    # Second scraper must not reset the budget: one burst, then RATE_LIMIT_DELAY spacing
+    burst = RealPythonScraper.RATE_LIMIT_BURST
+    assert burst == 1  # one request every RATE_LIMIT_DELAY, as with the old fixed sleep
+    assert [limiter.reserve('https://realpython.com/a/') for _ in range(burst)] == [0.0] * burst
+    delay = RealPythonScraper.RATE_LIMIT_DELAY
+    assert delay - 0.1 <= limiter.reserve('https://realpython.com/b/') <= delay
+    print("✓ Site scrapers share one per-host budget")
+
+
+if __name__ == '__main__':
+    print("Running rate limiter tests...\n")
+    test_token_bucket_burst_then_steady_rate()
+    test_hosts_do_not_wait_on_each_other()
+    test_retry_after_defers_host()
+    test_scraper_configures_site_limit()
+    print("\n✅ All rate limiter tests passed!")
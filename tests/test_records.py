@@ -0,0 +1,63 @@
+"""Tests for the slotted ArticleRecord type."""
+import pickle
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.records import ArticleRecord
+from webscraper_core.scrapers.realpython_scraper import RealPythonScraper
+from tests.test_parsing import REALPYTHON_HTML
+
+
+def test_record_is_dict_compatible():
+    """Test dict-style reads, writes and comparisons."""
+    record = ArticleRecord(title='Intro', url='https://example.com/intro')
+
+    assert record['author'] == 'Unknown'
+    record['author'] = 'Jane Doe'
+    assert record.author == 'Jane Doe'
+    assert record.get('publication_date') is None
+    assert record.get('missing', 'default') == 'default'
+    assert 'url' in record and 'missing' not in record
+    assert dict(record) == record.to_dict() == {
+        'title': 'Intro', 'author': 'Jane Doe',
+        'url': 'https://example.com/intro', 'publication_date': None,
+    }
+    assert record == dict(record) and dict(record) == record
+    assert ArticleRecord.from_dict(dict(record)) == record
+
+    try:
+        record['extra'] = 1
+        assert False, "expected KeyError"
+    except KeyError:
+        pass
+    print("✓ ArticleRecord behaves like an article dict")
+
+
+def test_record_is_compact_and_picklable():
+    """Test that records have no per-instance dict and survive pickling (parse pool)."""
+    record = ArticleRecord('Intro', 'Jane Doe', 'https://example.com/intro', date(2025, 10, 15))
+
+    assert not hasattr(record, '__dict__')
+    assert sys.getsizeof(record) < sys.getsizeof(record.to_dict())
+    assert pickle.loads(pickle.dumps(record)) == record
+    print("✓ ArticleRecord is slotted and picklable")
+
+
+def test_scrapers_produce_records():
+    """Test that site scrapers yield ArticleRecord instances."""
+    articles = RealPythonScraper("https://realpython.com/").extract_listing(REALPYTHON_HTML)
+
+    assert articles and all(isinstance(a, ArticleRecord) for a in articles)
+    print("✓ Scrapers produce ArticleRecord instances")
+
+
+if __name__ == '__main__':
+    print("Running ArticleRecord tests...\n")
+    test_record_is_dict_compatible()
+    test_record_is_compact_and_picklable()
+    test_scrapers_produce_records()
+    print("\n✅ All ArticleRecord tests passed!")
@@ -0,0 +1,89 @@
+"""Tests for relationship loading strategies and flat report rows."""
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event
+
+from webscraper_core.models import Article
+from webscraper_core.repositories.author_repository import AuthorRepository
+from webscraper_core.repositories.article_repository import ArticleRepository
+from tests.test_repository_streaming import _seed
+
+
+@contextmanager
+def _count_queries(session):
+    """Count the SELECT statements sent through session's engine."""
+    statements = []
+    engine = session.get_bind()
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_execute)
+
+
+def test_load_strategies_avoid_n_plus_one():
+    """Test that joined/selectin loading reads relationships without a query per row."""
+    session, _ = _seed(20)
+    try:
+        with _count_queries(session) as lazy:
+            names = [a.author.name for a in ArticleRepository(session).list_articles()]
+        session.expunge_all()
+        with _count_queries(session) as joined:
+            joined_names = [a.author.name for a in ArticleRepository(session).list_articles(load='joined')]
+        session.expunge_all()
+        with _count_queries(session) as selectin:
+            counts = {a.name: len(a.articles) for a in AuthorRepository(session).list_authors(load='selectin')}
+        session.expunge_all()
+        with _count_queries(session) as paged:
+            page = ArticleRepository(session).page_after(None, 5, Article, load='joined')
+            [a.author.name for a in page]
+
+        assert joined_names == names
+        assert len(lazy) == 3  # articles + one per distinct author
+        assert len(joined) == 1
+        assert len(selectin) == 2 and counts == {'Jane Doe': 10, 'John Roe': 10}
+        assert len(paged) == 1
+
+        try:
+            ArticleRepository(session).list_articles(load='eager')
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    finally:
+        session.close()
+    print("✓ Load strategies read relationships without N+1 queries")
+
+
+def test_list_articles_with_authors():
+    """Test the flat article/author report rows."""
+    session, _ = _seed(4)
+    try:
+        with _count_queries(session) as statements:
+            rows = ArticleRepository(session).list_articles_with_authors()
+        assert len(statements) == 1
+        assert [(r.title, r.author) for r in rows] == [
+            ('Post 0', 'Jane Doe'), ('Post 1', 'John Roe'), ('Post 2', 'Jane Doe'), ('Post 3', 'John Roe'),
+        ]
+        assert rows[0]._fields == ('article_id', 'title', 'url', 'publication_date', 'author')
+        # Plain rows: nothing was added to the identity map
+        assert len(session.identity_map) == 0
+    finally:
+        session.close()
+    print("✓ list_articles_with_authors returns flat rows in one query")
+
+
+if __name__ == '__main__':
+    print("Running relationship loading tests...\n")
+    test_load_strategies_avoid_n_plus_one()
+    test_list_articles_with_authors()
+    print("\n✅ All relationship loading tests passed!")
@@ -0,0 +1,77 @@
+"""Tests for streaming and keyset-paginated repository reads."""
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.database import create_connection, create_tables
+from webscraper_core.models import Base, Article, Author
+from webscraper_core.records import ArticleRecord
+from webscraper_core.repositories.author_repository import AuthorRepository
+from webscraper_core.repositories.article_repository import ArticleRepository
+
+
+def _seed(count):
+    """Create a clean database with count articles split between two authors."""
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    create_tables()
+    session = SessionLocal()
+    author_ids = AuthorRepository(session).get_or_create_many(['Jane Doe', 'John Roe'])
+    records = [ArticleRecord(title=f'Post {i}', author=['Jane Doe', 'John Roe'][i % 2],
+                             url=f'https://example.com/post-{i}')
+               for i in range(count)]
+    ArticleRepository(session).add_articles_bulk(records, author_ids)
+    return session, author_ids
+
+
+def test_iter_all_and_iter_by_criteria():
+    """Test that streaming reads return the same rows as the list methods."""
+    session, author_ids = _seed(25)
+    try:
+        repo = ArticleRepository(session)
+        streamed = repo.iter_all(chunk_size=10)
+        assert not isinstance(streamed, list)
+        assert [a.url for a in streamed] == [a.url for a in repo.list_articles()]
+
+        janes = list(repo.iter_by_criteria(Article, {'author_id': author_ids['Jane Doe']}, chunk_size=4))
+        assert len(janes) == 13
+        assert [a.name for a in AuthorRepository(session).iter_all()] == ['Jane Doe', 'John Roe']
+
+        try:
+            repo.iter_by_criteria(Article, {'missing': 1})
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    finally:
+        session.close()
+    print("✓ iter_all / iter_by_criteria stream rows")
+
+
+def test_page_after_walks_table():
+    """Test keyset pagination over the whole table."""
+    session, _ = _seed(25)
+    try:
+        repo = ArticleRepository(session)
+        seen, last_id = [], None
+        while page := repo.page_after(last_id, 10):
+            assert len(page) <= 10
+            seen.extend(page)
+            last_id = page[-1].article_id
+
+        assert len(seen) == 25
+        ids = [a.article_id for a in seen]
+        assert ids == sorted(ids) and len(set(ids)) == 25
+        assert [a.author_id for a in repo.page_after(None, 5, Author)] == [1, 2]
+    finally:
+        session.close()
+    print("✓ page_after walks the table in primary key order")
+
+
+if __name__ == '__main__':
+    print("Running repository streaming tests...\n")
+    test_iter_all_and_iter_by_criteria()
+    test_page_after_walks_table()
+    print("\n✅ All repository streaming tests passed!")
@@ -0,0 +1,134 @@
+"""Tests for request coalescing (SingleFlight) and the per-run fetch memo."""
+import sys
+import time
+import asyncio
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.singleflight import SingleFlight
+from webscraper_core.scraper import WebScraper
+from webscraper_core.scrapers.realpython_scraper import RealPythonScraper
+from webscraper_core.http_client import HttpClient
+from webscraper_core.rate_limit import HostRateLimiter
+from tests.local_server import start_server
+
+
+def test_concurrent_calls_are_coalesced():
+    """Test that concurrent calls for one key run the function once."""
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return 'page'
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(lambda _: flight.do('url', fetch), range(8)))
+
+    assert results == ['page'] * 8
+    assert len(calls) == 1
+    assert flight.do('url', fetch) == 'page' and len(calls) == 1
+    print("✓ Concurrent duplicate calls share one result")
+
+
+def test_failures_propagate_and_are_not_memoised():
+    """Test that exceptions and None results reach the caller and the next call retries."""
+    flight = SingleFlight()
+
+    def boom():
+        raise RuntimeError('boom')
+
+    try:
+        flight.do('url', boom)
+        assert False, "expected RuntimeError"
+    except RuntimeError:
+        pass
+    assert 'url' not in flight
+    assert flight.do('url', lambda: None) is None
+    assert 'url' not in flight
+    assert flight.do('url', lambda: 'page') == 'page'
+    assert 'url' in flight
+    print("✓ Exceptions and None results are not memoised")
+
+
+def test_async_calls_are_coalesced():
+    """Test that coroutines for one key await a single call."""
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'page'
+
+    async def run():
+        return await asyncio.gather(*(flight.do_async('url', fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == ['page'] * 5
+    assert len(calls) == 1
+    print("✓ Async duplicate calls share one result")
+
+
+def test_author_page_fetched_once_per_run():
+    """Test that enrichment and the manager's author fallback share one fetch."""
+    author_page = """
+    <div class="card mt-3" id="author">
+        <p class="card-header h3">About <strong>Jane Doe</strong></p>
+    </div>
+    """
+    server, base_url = start_server({'/article/': author_page})
+    article_url = base_url + '/article/'
+    client = HttpClient(limiter=HostRateLimiter())
+    flight = SingleFlight()
+    try:
+        scraper = RealPythonScraper(base_url + '/', http=client, flight=flight)
+        client.limiter.configure('127.0.0.1', rate=1000, burst=100)
+        articles = scraper.enrich_articles([{'title': 'A', 'author': 'Unknown', 'url': article_url}])
+        fallback = WebScraper(base_url + '/', http=client, flight=flight).fetch_realpython_author(article_url)
+    finally:
+        server.shutdown()
+
+    assert articles[0]['author'] == 'Jane Doe'
+    assert fallback == 'Jane Doe'
+    assert [path for path, _, _ in server.requests] == ['/article/']
+    print("✓ Author page is fetched once per run")
+
+
+
+def test_memo_keeps_parsed_detail_and_retries_failures():
+    """Test that the memo holds the parsed author, not the HTML, and failed fetches are retried."""
+    author_page = """
+    <div class="card mt-3" id="author">
+        <p class="card-header h3">About <strong>Jane Doe</strong></p>
+    </div>
+    """
+    server, base_url = start_server({'/article/': author_page})
+    client = HttpClient(limiter=HostRateLimiter())
+    client.limiter.configure('127.0.0.1', rate=1000, burst=100)
+    flight = SingleFlight()
+    try:
+        scraper = RealPythonScraper(base_url + '/', http=client, flight=flight)
+        assert scraper.get_detail(base_url + '/missing/') is None
+        assert scraper.get_detail(base_url + '/missing/') is None
+        assert scraper.get_detail(base_url + '/article/') == {'author': 'Jane Doe'}
+        assert scraper.get_detail(base_url + '/article/') == {'author': 'Jane Doe'}
+    finally:
+        server.shutdown()
+
+    assert flight._results == {base_url + '/article/': {'author': 'Jane Doe'}}
+    assert [path for path, _, _ in server.requests] == ['/missing/', '/missing/', '/article/']
+    print("✓ Memo keeps parsed details and retries failed fetches")
+
+
+if __name__ == '__main__':
+    print("Running singleflight tests...\n")
+    test_concurrent_calls_are_coalesced()
+    test_failures_propagate_and_are_not_memoised()
+    test_async_calls_are_coalesced()
+    test_author_page_fetched_once_per_run()
+    test_memo_keeps_parsed_detail_and_retries_failures()
+    print("\n✅ All singleflight tests passed!")
@@ -0,0 +1,96 @@
+"""Tests for the in-memory known-URL index."""
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from webscraper_core.url_index import KnownUrlIndex, url_digest
+from webscraper_core.manager import run_many, _filter_new_articles
+from webscraper_core.database import create_connection, create_tables
+from webscraper_core.models import Base
+from webscraper_core.records import ArticleRecord
+from webscraper_core.repositories.author_repository import AuthorRepository
+from webscraper_core.repositories.article_repository import ArticleRepository
+from tests.local_server import start_server
+
+
+def _fresh_db():
+    SessionLocal = create_connection('test_scraper.db')
+    from webscraper_core.database import engine
+    Base.metadata.drop_all(bind=engine)
+    create_tables()
+    return SessionLocal
+
+
+def test_index_membership():
+    """Test lookups, updates and the filter used before enrichment."""
+    index = KnownUrlIndex(['https://example.com/a'])
+    index.add('https://example.com/b')
+    index.update(['https://example.com/c', None])
+
+    assert url_digest('https://example.com/a') == url_digest('https://example.com/a') < 2 ** 64
+    assert len(index) == 3
+    assert 'https://example.com/c' in index
+    assert 'https://example.com/d' not in index and None not in index
+
+    articles = [ArticleRecord(url='https://example.com/a'), ArticleRecord(url='https://example.com/d')]
+    # No session: the index answers without the database
+    new_articles, known = _filter_new_articles(articles, None, index)
+    assert [a.url for a in new_articles] == ['https://example.com/d'] and known == 1
+    print("✓ Index answers new-vs-known from memory")
+
+
+def test_index_loads_from_database():
+    """Test that load() streams every stored URL into the index."""
+    SessionLocal = _fresh_db()
+    session = SessionLocal()
+    try:
+        records = [ArticleRecord(title=f'Post {i}', author='Jane Doe', url=f'https://example.com/post-{i}')
+                   for i in range(25)]
+        author_ids = AuthorRepository(session).get_or_create_many(['Jane Doe'])
+        ArticleRepository(session).add_articles_bulk(records, author_ids)
+
+        index = KnownUrlIndex.load(session, chunk_size=10)
+    finally:
+        session.close()
+
+    assert len(index) == 25
+    assert all(r.url in index for r in records)
+    print("✓ Index is loaded from the database")
+
+
+def test_run_many_with_url_index():
+    """Test that the index is kept current during a run and reused on the next one."""
+    _fresh_db()
+
+    # Every page shares articles with its neighbour
+    pages = {
+        f'/page-{p}': ''.join(
+            f'<article class="post"><h2>Post {i}</h2><a href="https://example.com/post-{i}">Read</a></article>'
+            for i in range(p * 5, p * 5 + 10)
+        )
+        for p in range(4)
+    }
+    server, base_url = start_server(pages)
+    try:
+        urls = [base_url + path for path in pages]
+        first = run_many(urls, max_workers=1, db_file='test_scraper.db', url_index=True)
+        second = run_many(urls, max_workers=2, db_file='test_scraper.db', url_index=True,
+                          skip_unchanged=False)
+    finally:
+        server.shutdown()
+
+    assert sum(r['created'] for r in first) == 25
+    assert sum(r['skipped'] for r in first) == 15
+    assert sum(r['created'] for r in second) == 0
+    assert sum(r['skipped'] for r in second) == 40
+    print("✓ run_many skips known articles through the index")
+
+
+if __name__ == '__main__':
+    print("Running known-URL index tests...\n")
+    test_index_membership()
+    test_index_loads_from_database()
+    test_run_many_with_url_index()
+    print("\n✅ All known-URL index tests passed!")
@@ -0,0 +1,127 @@
+"""Asyncio fetch engine for WebScraper and the site scrapers.
+
+Wraps a (sync) scraper instance and performs its network I/O with aiohttp,
+so many listing and detail pages can be in flight on a single thread.
+Extraction is still done by the wrapped scraper's parsing methods, in
+worker threads so parsing never stalls the event loop, and requests share the per-host rate limiter of the scraper's HttpClient, so
+sync and async fetches to one site draw on the same budget.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from .scraper import WebScraper
+from .http_client import RETRY_AFTER_STATUSES
+from .http_cache import HttpCache
+from .rate_limit import parse_retry_after
+from .records import ArticleRecord
+
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+
+def create_client_session(max_concurrency: int = 100) -> aiohttp.ClientSession:
+    """Create an aiohttp session whose connector allows max_concurrency connections."""
+    connector = aiohttp.TCPConnector(limit=max_concurrency)
+    return aiohttp.ClientSession(connector=connector, timeout=DEFAULT_TIMEOUT)
+
+
+class AsyncWebScraper:
+    """Async counterpart of WebScraper that delegates parsing to a sync scraper.
+
+    Usage:
+      async with create_client_session() as http:
+          articles = await AsyncWebScraper(RealPythonScraper(url), http).scrape()
+    """
+
+    def __init__(self, scraper: WebScraper, session: aiohttp.ClientSession):
+        self.scraper = scraper
+        self.session = session
+        self.url = scraper.url
+        self.limiter = scraper.http.limiter
+
+    async def fetch_url(self, url: str, cache: Optional[HttpCache] = None) -> Optional[str]:
+        """Fetch HTML content from any URL, waiting for the host's rate limit.
+
+        With a cache, the request is conditional and a 304 returns the cached body.
+        """
+        cached = cache.lookup(url) if cache is not None else None
+        try:
+            await self.limiter.acquire_async(url)
+            headers = cached.validators() if cached is not None else None
+            async with self.session.get(url, headers=headers) as response:
+                if response.status in RETRY_AFTER_STATUSES:
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    if retry_after:
+                        self.limiter.defer(url, retry_after)
+                if cached is not None and response.status == 304:
+                    return cached.body
+                response.raise_for_status()
+                html_content = await response.text()
+                if cache is not None:
+                    cache.store(url, html_content, response.headers)
+                return html_content
+        except asyncio.TimeoutError:
+            print(f"Timeout fetching {url}")
+            return None
+        except aiohttp.ClientResponseError as err:
+            if err.status == 429:
+                print(f"Rate limited (429) - skipping {url}")
+            else:
+                print(f"Failed to fetch {url}: {err}")
+            return None
+        except aiohttp.ClientError as err:
+            print(f"Failed to fetch {url}: {err}")
+            return None
+
+    async def fetch_page(self) -> Optional[str]:
+        """Fetch HTML content from the scraper's URL.
+
+        Scrapers with a specialised fetch_page (e.g. DataCampScraper, which needs
+        cloudscraper to pass Cloudflare) run it in a worker thread instead.
+        """
+        if type(self.scraper).fetch_page is not WebScraper.fetch_page:
+            return await asyncio.to_thread(self.scraper.fetch_page)
+        return await self.fetch_url(self.url, cache=self.scraper.cache)
+
+    async def enrich_articles(self, articles: List[ArticleRecord]) -> List[ArticleRecord]:
+        """Fetch detail pages for articles that need them and merge the results.
+
+        Up to the scraper's DETAIL_WORKERS requests are in flight at once;
+        they are spaced by the host's rate limit with asyncio.sleep, so the
+        delay never blocks other sites.
+        """
+        pending = [(article, url) for article in articles if (url := self.scraper.detail_url(article))]
+        if not pending:
+            return articles
+
+        semaphore = asyncio.Semaphore(max(1, self.scraper.DETAIL_WORKERS))
+
+        async def fetch(url: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                html_content = await self.fetch_url(url)
+            if not html_content:
+                return None
+            # Parse off the event loop so other requests keep moving
+            return await asyncio.to_thread(self.scraper.parse_detail, html_content)
+
+        async def get_detail(url: str) -> Optional[Dict[str, Any]]:
+            # Share the scraper's per-run memo so each page is fetched once per run
+            if self.scraper.flight is None:
+                return await fetch(url)
+            return await self.scraper.flight.do_async(url, lambda: fetch(url))
+
+        details = await asyncio.gather(*(get_detail(url) for _, url in pending))
+        for (article, _), fields in zip(pending, details):
+            for key, value in (fields or {}).items():
+                article[key] = value
+        return articles
+
+    async def scrape(self) -> List[ArticleRecord]:
+        """Fetch, extract and enrich articles. Returns [] if the fetch fails."""
+        html_content = await self.fetch_page()
+        if html_content is None:
+            return []
+        articles = await asyncio.to_thread(self.scraper.extract_listing, html_content)
+        return await self.enrich_articles(articles)
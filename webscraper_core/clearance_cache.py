@@ -0,0 +1,101 @@
+"""On-disk cache of Cloudflare clearance cookies.
+
+Cloudflare issues a ``cf_clearance`` cookie once its challenge is solved. The
+cookie is bound to the User-Agent that solved it, so both are saved together
+with an expiry time. Restoring them into a fresh session lets later fetches
+(and later runs) skip the challenge until the clearance expires.
+"""
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+import requests
+
+
+CLEARANCE_COOKIE = 'cf_clearance'
+DEFAULT_TTL = 30 * 60  # seconds, used when the cookie has no expiry of its own
+
+
+class ClearanceCache:
+    """JSON file store of clearance cookies and user agent, keyed by host.
+
+    File format:
+      {"www.datacamp.com": {"cookies": [{"name": ..., "value": ..., "domain": ..., "path": ...}],
+                            "user_agent": "...", "expires_at": 1760000000.0}}
+    """
+
+    def __init__(self, path: str = '.cloudflare_clearance.json', ttl: float = DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: dict) -> None:
+        # Write to a temp file and rename so a crash never leaves a truncated cache
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def load(self, host: str) -> Optional[dict]:
+        """Return the cached entry for host, or None if missing or expired."""
+        with self._lock:
+            entry = self._read().get(host)
+        if not entry or entry.get('expires_at', 0) <= time.time():
+            return None
+        return entry
+
+    def apply(self, session: requests.Session, host: str) -> bool:
+        """Restore cached cookies and user agent into session. Returns True if restored."""
+        entry = self.load(host)
+        if entry is None:
+            return False
+        for cookie in entry.get('cookies', []):
+            session.cookies.set(cookie['name'], cookie['value'],
+                                domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+        if entry.get('user_agent'):
+            session.headers['User-Agent'] = entry['user_agent']
+        return True
+
+    def store(self, session: requests.Session, host: str) -> bool:
+        """Save the session's clearance cookies for host if they changed.
+
+        Returns True if the cache file was updated.
+        """
+        clearance = next((c for c in session.cookies if c.name == CLEARANCE_COOKIE), None)
+        if clearance is None:
+            return False
+
+        expires_at = clearance.expires if clearance.expires else time.time() + self.ttl
+        cookies = [
+            {'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path}
+            for c in session.cookies
+            if c.domain and host.endswith(c.domain.lstrip('.'))
+        ]
+
+        with self._lock:
+            data = self._read()
+            cached = data.get(host)
+            if cached and any(c['name'] == CLEARANCE_COOKIE and c['value'] == clearance.value
+                              for c in cached.get('cookies', [])):
+                return False
+            data[host] = {
+                'cookies': cookies,
+                'user_agent': session.headers.get('User-Agent', ''),
+                'expires_at': float(expires_at),
+            }
+            try:
+                self._write(data)
+            except OSError as e:
+                print(f"Failed to save clearance cache {self.path}: {e}")
+                return False
+        return True
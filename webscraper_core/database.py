@@ -1,6 +1,11 @@
 # Initialize SQLite database using SQLAlchemy ORM
-from sqlalchemy import create_engine
+import os
+import threading
+from typing import Dict, Set, Tuple
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.exc import SQLAlchemyError
 
 # Import models - handle both relative and absolute imports
@@ -13,21 +18,135 @@ except ImportError:
 engine = None
 SessionLocal = None
 
-def create_connection(db_file: str):
+# Engines reused across runs, by (database URL, profile, pool size); each is
+# built once per process by get_session_factory()
+_session_factories: Dict[Tuple[str, str, int], sessionmaker] = {}
+# Engines whose schema ensure_schema() has already created
+_schema_ready: Set[Engine] = set()
+_registry_lock = threading.Lock()
+
+# PRAGMAs applied to every new SQLite connection, by profile name.
+# 'default' keeps SQLite's own settings (rollback journal, synchronous=FULL).
+# 'performance' suits heavy concurrent writes: WAL lets readers run during a
+# write, synchronous=NORMAL only fsyncs at checkpoints (safe with WAL; a power
+# loss can drop the last commits but not corrupt the file), busy_timeout waits
+# for a locked database instead of failing, and the page cache, memory map
+# and temp store keep hot pages and temporary b-trees in memory.
+SQLITE_PROFILES = {
+    'default': {},
+    'performance': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,        # milliseconds
+        'cache_size': -65536,        # negative = KiB, i.e. 64 MiB
+        'mmap_size': 268435456,      # 256 MiB
+        'temp_store': 'MEMORY',
+    },
+}
+DEFAULT_PROFILE = 'default'
+
+def create_connection(db_file: str, profile: str = DEFAULT_PROFILE, pool_size: int = 5):
     """Create a database engine and session factory for SQLite.
     
+    The engine is safe to share between threads: each thread should open its
+    own Session from the returned factory, and pooled connections may be
+    used by whichever thread checks them out.
+    
     :param db_file: Path to the SQLite database file
+    :param profile: Name in SQLITE_PROFILES whose PRAGMAs are applied on connect
+    :param pool_size: Connections kept open for concurrent sessions (e.g. worker count)
     :return: SessionLocal (session factory) or None on error
     """
     global engine, SessionLocal
+    if profile not in SQLITE_PROFILES:
+        print(f"Unknown database profile '{profile}', expected one of {', '.join(SQLITE_PROFILES)}")
+        return None
     try:
-        engine = create_engine(f'sqlite:///{db_file}', echo=False)
+        engine = _build_engine(f'sqlite:///{db_file}', profile, pool_size)
         SessionLocal = sessionmaker(bind=engine)
         return SessionLocal
     except SQLAlchemyError as e:
         print(f"Failed to create database connection: {e}")
         return None
 
+def get_session_factory(db_file: str, profile: str = DEFAULT_PROFILE, pool_size: int = 5):
+    """Return a session factory from the process-wide engine registry.
+    
+    Unlike create_connection(), the engine (and its connection pool) for a
+    given database, profile and pool size is built only once per process and
+    reused by every later call, and its schema is created on first use with
+    ensure_schema(). Meant for code that runs repeatedly, such as run_many()
+    in a long-running loop. The global engine/SessionLocal are not changed.
+    
+    :param db_file: Path to the SQLite database file
+    :param profile: Name in SQLITE_PROFILES whose PRAGMAs are applied on connect
+    :param pool_size: Connections kept open for concurrent sessions (e.g. worker count)
+    :return: SessionLocal (session factory) or None on error
+    """
+    if profile not in SQLITE_PROFILES:
+        print(f"Unknown database profile '{profile}', expected one of {', '.join(SQLITE_PROFILES)}")
+        return None
+    # Absolute path, so the same file is one key whatever the working directory
+    path = ':memory:' if is_in_memory(db_file) else os.path.abspath(db_file)
+    key = (f'sqlite:///{path}', profile, pool_size)
+    with _registry_lock:
+        factory = _session_factories.get(key)
+        if factory is None:
+            try:
+                factory = sessionmaker(bind=_build_engine(key[0], profile, pool_size))
+            except SQLAlchemyError as e:
+                print(f"Failed to create database connection: {e}")
+                return None
+            _session_factories[key] = factory
+    if not ensure_schema(factory.kw['bind']):
+        return None
+    return factory
+
+def dispose_engines():
+    """Close the pooled connections of every registry engine and empty the registry."""
+    with _registry_lock:
+        for factory in _session_factories.values():
+            factory.kw['bind'].dispose()
+        _session_factories.clear()
+        _schema_ready.clear()
+
+def is_in_memory(db_file: str) -> bool:
+    """Return True if db_file names an in-memory SQLite database."""
+    return db_file in ('', ':memory:')
+
+def _build_engine(url: str, profile: str, pool_size: int) -> Engine:
+    if make_url(url).database in (None, '', ':memory:'):
+        # An in-memory database lives in its connection, so every session
+        # shares one (StaticPool); sessions must then take turns, which is
+        # why run_many() refuses in-memory databases
+        pool_args = {'poolclass': StaticPool}
+    else:
+        pool_args = {'pool_size': pool_size, 'max_overflow': pool_size}
+    target_engine = create_engine(
+        url,
+        echo=False,
+        # Connections move between worker threads through the pool; each is
+        # only used by one session at a time
+        connect_args={'check_same_thread': False},
+        **pool_args,
+    )
+    _apply_profile(target_engine, SQLITE_PROFILES[profile])
+    return target_engine
+
+def _apply_profile(target_engine, pragmas: dict):
+    """Run the profile's PRAGMAs on each connection the engine opens."""
+    if not pragmas:
+        return
+
+    @event.listens_for(target_engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+
 def create_tables():
     """Create all tables defined in the models using SQLAlchemy."""
     try:
@@ -35,6 +154,42 @@ def create_tables():
         print("Tables created successfully using SQLAlchemy.")
     except SQLAlchemyError as e:
         print(f"Error creating tables: {e}")
+        return
+    _create_missing_indexes(engine)
+
+def ensure_schema(target_engine: Engine) -> bool:
+    """Create missing tables and indexes once per engine (quietly, idempotent).
+    
+    The first call inspects the database and creates what is missing; later
+    calls for the same engine return immediately.
+    
+    :return: True if the schema is in place, False on error
+    """
+    with _registry_lock:
+        if target_engine in _schema_ready:
+            return True
+        try:
+            Base.metadata.create_all(target_engine)
+        except SQLAlchemyError as e:
+            print(f"Error creating tables: {e}")
+            return False
+        _create_missing_indexes(target_engine)
+        _schema_ready.add(target_engine)
+        return True
+
+def _create_missing_indexes(target_engine: Engine):
+    """Add indexes declared after a table was first created (best effort).
+    
+    create_all() skips existing tables together with their indexes, so
+    databases created by older versions would never get them otherwise.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(target_engine, checkfirst=True)
+            except SQLAlchemyError as e:
+                # e.g. a unique index over rows that already contain duplicates
+                print(f"Warning: could not create index {index.name}: {e}")
 def main():
     """Initialize the SQLAlchemy database and create tables."""
     database = "scraper_data.db"
@@ -0,0 +1,78 @@
+"""Date parsing shared by all scrapers.
+
+Article dates come in a handful of shapes ("2024-10-18", "2024-10-18T10:30:00Z",
+"October 18, 2024", "Oct 18, 2024", "18 Oct 2024"). Each shape has a compiled
+regex, so a string is matched once instead of trying strptime formats until
+one stops raising. Results are memoised in a bounded LRU cache because
+listing pages repeat the same few dates on every card.
+"""
+import calendar
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+
+DATE_CACHE_SIZE = 4096
+
+_MONTHS = ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+           'august', 'september', 'october', 'november', 'december')
+# Full name or three-letter abbreviation -> month number
+_MONTH_NUMBERS = {name: i for i, full in enumerate(_MONTHS, 1) for name in (full, full[:3])}
+
+_MONTH_NAME = r'(?P<month>' + '|'.join(sorted(_MONTH_NUMBERS, key=len, reverse=True)) + r')'
+
+# Month names as they appear in page text ("Oct 15, 2025", "November 22, 2024")
+MONTH_PATTERN = re.compile(
+    r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?'
+    r'|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\b'
+)
+
+_ISO_DATE = re.compile(r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})')
+_MONTH_DAY_YEAR = re.compile(_MONTH_NAME + r'\s+(?P<day>\d{1,2}),\s+(?P<year>\d{4})', re.IGNORECASE)
+_DAY_MONTH_YEAR = re.compile(r'(?P<day>\d{1,2})\s+' + _MONTH_NAME + r'\s+(?P<year>\d{4})', re.IGNORECASE)
+
+# Time and timezone suffixes are dropped: everything from the first 'T' or '+'
+_TIME_SUFFIX = re.compile(r'[T+].*', re.DOTALL)
+
+
+def contains_month(text: str) -> bool:
+    """Return True if text mentions a month name (a likely date)."""
+    return bool(text) and MONTH_PATTERN.search(text) is not None
+
+
+def parse_date(date_str: Optional[str]) -> Optional[date]:
+    """Parse a date string into a date object. Returns None if it is not a known format."""
+    if not date_str:
+        return None
+    return _parse_date_cached(date_str)
+
+
+def parse_dates(date_strs: Iterable[Optional[str]]) -> List[Optional[date]]:
+    """Parse many date strings at once; each distinct string is parsed only once."""
+    parsed = {}
+    results = []
+    for date_str in date_strs:
+        if date_str not in parsed:
+            parsed[date_str] = parse_date(date_str)
+        results.append(parsed[date_str])
+    return results
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date_cached(date_str: str) -> Optional[date]:
+    text = _TIME_SUFFIX.sub('', date_str).replace('Z', '').strip()
+
+    for pattern in (_ISO_DATE, _MONTH_DAY_YEAR, _DAY_MONTH_YEAR):
+        match = pattern.fullmatch(text)
+        if match:
+            break
+    else:
+        return None
+
+    month = match.group('month')
+    month = int(month) if month.isdigit() else _MONTH_NUMBERS[month.lower()]
+    year, day = int(match.group('year')), int(match.group('day'))
+    if year < 1 or not 1 <= month <= 12 or not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return date(year, month, day)
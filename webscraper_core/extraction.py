@@ -0,0 +1,100 @@
+"""Listing extraction in worker processes.
+
+BeautifulSoup parsing is CPU-bound and holds the GIL, so when many large
+listing pages are processed by threads, parsing serialises and stalls the
+threads waiting on the network. A parse pool moves extraction into separate
+processes: the I/O layer fetches a page and submits its raw HTML bytes plus
+the site scraper name, and the worker returns ArticleRecord instances
+(slotted and picklable, so they cross the process boundary cheaply).
+
+Usage:
+  with create_parse_pool(8) as pool:
+      articles = pool.submit(extract_records, 'realpython', url, html.encode()).result()
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Type
+
+from .scraper import WebScraper
+from .scrapers.realpython_scraper import RealPythonScraper
+from .scrapers.freecodecamp_scraper import FreeCodeCampScraper
+from .scrapers.datacamp_scraper import DataCampScraper
+from .http_client import HttpClient
+from .rate_limit import HostRateLimiter
+from .parsing import get_default_parser, set_default_parser
+from .records import ArticleRecord
+
+
+# Site scrapers by name; the name is what crosses the process boundary
+SCRAPERS: Dict[str, Type[WebScraper]] = {
+    'realpython': RealPythonScraper,
+    'freecodecamp': FreeCodeCampScraper,
+    'datacamp': DataCampScraper,
+    'generic': WebScraper,
+}
+
+# Host fragment -> scraper name, checked in order
+_SITE_HOSTS = (
+    ('realpython.com', 'realpython'),
+    ('freecodecamp.org', 'freecodecamp'),
+    ('datacamp.com', 'datacamp'),
+)
+
+# Network client for scrapers built in a worker process; never used to fetch
+_offline_client: Optional[HttpClient] = None
+
+
+def scraper_name_for_url(url: str) -> str:
+    """Return the SCRAPERS key of the scraper that handles url."""
+    for host, name in _SITE_HOSTS:
+        if host in url:
+            return name
+    return 'generic'
+
+
+def _get_worker_scraper(scraper_name: str, url: str, parser: Optional[str]) -> WebScraper:
+    """Build a scraper for parsing only.
+
+    It gets a private HttpClient so constructing it never creates the shared
+    network client, rate limits or Cloudflare session in the worker.
+    """
+    global _offline_client
+    if _offline_client is None:
+        _offline_client = HttpClient(limiter=HostRateLimiter())
+    return SCRAPERS[scraper_name](url, http=_offline_client, parser=parser)
+
+
+def extract_records(scraper_name: str, url: str, html_bytes: bytes,
+                    parser: Optional[str] = None) -> List[ArticleRecord]:
+    """Extract listing articles from a fetched page (runs in a worker process).
+
+    Args:
+        scraper_name: Key in SCRAPERS
+        url: Page URL (scrapers use it to make article links absolute)
+        html_bytes: Page HTML encoded as UTF-8
+        parser: Parser backend override; None uses the scraper's PARSER or
+            the default passed to the pool
+
+    Returns the same ArticleRecords as scraper.extract_listing().
+    """
+    scraper = _get_worker_scraper(scraper_name, url, parser)
+    return scraper.extract_listing(html_bytes.decode('utf-8'))
+
+
+def _init_worker(default_parser: str) -> None:
+    """Carry the parent's parser default into a (possibly spawned) worker."""
+    set_default_parser(default_parser)
+
+
+def create_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """Create a process pool for extract_records().
+
+    Workers are spawned, not forked, so they never inherit the parent's
+    threads, locks or open sockets.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(get_default_parser(),),
+    )
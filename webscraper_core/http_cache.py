@@ -0,0 +1,76 @@
+"""On-disk HTTP response cache with conditional GET.
+
+Responses that carry an ETag or Last-Modified validator are stored on disk,
+keyed by URL. The next request for the URL sends If-None-Match /
+If-Modified-Since, and a 304 Not Modified reply is answered from the cache,
+so unchanged listing pages cost a round trip but no body transfer.
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Mapping, Optional
+
+
+class CachedResponse:
+    """A cached body plus the validators it was served with."""
+
+    def __init__(self, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def validators(self) -> dict:
+        """Return the conditional request headers for this entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Directory of cached responses, one JSON file per URL.
+
+    Usage:
+      cache = HttpCache('.http_cache')
+      html = client.get_text(url, cache=cache)
+    """
+
+    def __init__(self, directory: str = '.http_cache'):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for url, or None."""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('url') != url or 'body' not in entry:
+            return None
+        return CachedResponse(entry['body'], entry.get('etag'), entry.get('last_modified'))
+
+    def store(self, url: str, body: str, headers: Mapping[str, str]) -> bool:
+        """Cache body if the response headers carry a validator. Returns True if stored."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return False
+
+        path = self._path(url)
+        # Write to a temp file and rename so readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'url': url, 'etag': etag, 'last_modified': last_modified, 'body': body}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Failed to write HTTP cache entry for {url}: {e}")
+            return False
+        return True
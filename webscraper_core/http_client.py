@@ -0,0 +1,129 @@
+"""Shared, pooled HTTP client used by WebScraper and the site scrapers.
+
+A single requests.Session keeps TCP/TLS connections alive between requests,
+so repeated fetches to the same host (e.g. Real Python detail pages) skip
+the handshake. The underlying urllib3 connection pools are thread-safe, so
+one client can be shared by all worker threads. Every request first waits
+on the client's per-host rate limiter.
+"""
+import threading
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import HostRateLimiter, get_default_limiter, parse_retry_after
+from .http_cache import HttpCache
+
+
+DEFAULT_POOL_CONNECTIONS = 10  # number of per-host pools kept
+DEFAULT_POOL_MAXSIZE = 10      # keep-alive connections per host
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 15.0
+
+# Status codes whose Retry-After header holds back further requests to the host
+RETRY_AFTER_STATUSES = (429, 503)
+
+
+class HttpClient:
+    """Thread-safe HTTP client with per-host connection pooling and keep-alive.
+
+    Usage:
+      client = HttpClient(pool_maxsize=20, read_timeout=30)
+      response = client.get('https://realpython.com/')
+
+    An existing requests.Session (or subclass, e.g. a cloudscraper instance)
+    can be passed in to get the same pooling behaviour. Clients share the
+    process-wide rate limiter unless one is passed in.
+    """
+
+    def __init__(self,
+                 session: Optional[requests.Session] = None,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 limiter: Optional[HostRateLimiter] = None):
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.limiter = limiter if limiter is not None else get_default_limiter()
+
+        # Size the connection pools once; the session is only read from after this
+        if session is None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+        else:
+            # Keep the caller's adapters (e.g. cloudscraper's TLS adapter) and
+            # only resize their pools
+            self.session = session
+            for adapter in self.session.adapters.values():
+                if isinstance(adapter, HTTPAdapter):
+                    _resize_pools(adapter, pool_connections, pool_maxsize)
+
+    def get(self, url: str, headers: Optional[dict] = None, timeout=None, **kwargs) -> requests.Response:
+        """Send a GET request over a pooled keep-alive connection.
+
+        Waits for the host's rate limit first, and honours Retry-After on
+        429/503 responses for later requests. timeout defaults to the
+        client's (connect, read) timeouts.
+        """
+        self.limiter.acquire(url)
+        response = self.session.get(url, headers=headers, timeout=timeout or self.timeout, **kwargs)
+        if response.status_code in RETRY_AFTER_STATUSES:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after:
+                self.limiter.defer(url, retry_after)
+        return response
+
+    def get_text(self, url: str, headers: Optional[dict] = None,
+                 cache: Optional[HttpCache] = None, **kwargs) -> str:
+        """GET a page and return its text, raising requests exceptions on failure.
+
+        With a cache, the request is conditional on the cached validators and
+        a 304 Not Modified response returns the cached body.
+        """
+        request_headers = dict(headers or {})
+        cached = cache.lookup(url) if cache is not None else None
+        if cached is not None:
+            request_headers.update(cached.validators())
+
+        response = self.get(url, headers=request_headers or None, **kwargs)
+        if cached is not None and response.status_code == 304:
+            return cached.body
+        response.raise_for_status()
+        if cache is not None:
+            cache.store(url, response.text, response.headers)
+        return response.text
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+def _resize_pools(adapter: HTTPAdapter, pool_connections: int, pool_maxsize: int) -> None:
+    """Rebuild an adapter's pool manager with new sizes, keeping its subclass setup."""
+    adapter._pool_connections = pool_connections
+    adapter._pool_maxsize = pool_maxsize
+    adapter.init_poolmanager(pool_connections, pool_maxsize, block=adapter._pool_block)
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HttpClient:
+    """Return the process-wide shared HttpClient, creating it on first use."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = HttpClient()
+    return _default_client
+
+
+def set_default_client(client: HttpClient) -> None:
+    """Replace the process-wide shared HttpClient (e.g. to change pool sizes or timeouts)."""
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
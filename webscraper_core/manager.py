@@ -1,40 +1,56 @@
+import asyncio
+import hashlib
 import requests
 from .scraper import WebScraper
-from .scrapers.realpython_scraper import RealPythonScraper
-from .scrapers.freecodecamp_scraper import FreeCodeCampScraper
-from .scrapers.datacamp_scraper import DataCampScraper
 from .analyzer import process_titles
-from .database import create_connection, create_tables
+from .singleflight import SingleFlight
+from .http_cache import HttpCache
+from .extraction import SCRAPERS, scraper_name_for_url, extract_records, create_parse_pool
+from .database import get_session_factory, is_in_memory, DEFAULT_PROFILE
 from .repositories.author_repository import AuthorRepository
 from .repositories.article_repository import ArticleRepository
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Tuple, Dict, Optional
+from .repositories.page_fingerprint_repository import PageFingerprintRepository
+from .records import ArticleRecord
+from .pipeline import ArticleWriter
+from .url_index import KnownUrlIndex
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, Tuple, Dict, Optional
 from collections import Counter
+from itertools import islice
 
 
-def _get_scraper_for_url(url: str) -> WebScraper:
+# Articles checked against the database per query while a page is streamed
+STREAM_BATCH_SIZE = 50
+# SQLite database written by run(), run_many() and run_many_async()
+DB_FILE = 'scraper_data.db'
+
+
+def _get_scraper_for_url(url: str, flight: Optional[SingleFlight] = None,
+                         cache: Optional[HttpCache] = None) -> WebScraper:
     """Get the appropriate scraper class for a given URL.
     
     Args:
         url: The URL to scrape
+        flight: Per-run fetch memo shared by all scrapers in the run
+        cache: Optional on-disk HTTP cache for listing pages
         
     Returns:
         An instance of the appropriate scraper class
     """
-    if 'realpython.com' in url:
-        return RealPythonScraper(url)
-    elif 'freecodecamp.org' in url:
-        return FreeCodeCampScraper(url)
-    elif 'datacamp.com' in url:
-        return DataCampScraper(url)
-    else:
-        # Fallback to generic WebScraper
-        return WebScraper(url)
-
-
-def run(url: str):
+    # Unknown sites fall back to the generic WebScraper
+    return SCRAPERS[scraper_name_for_url(url)](url, flight=flight, cache=cache)
+
+
+def run(url: str, db_file: str = DB_FILE):
     """Run scraper for single URL, extract data, and save to database."""
-    scraper = _get_scraper_for_url(url)
+    SessionLocal = get_session_factory(db_file)
+    if SessionLocal is None:
+        print("Failed to create database connection")
+        return
+
+    # Fetch memo, so the author fallback reuses pages fetched during enrichment
+    flight = SingleFlight()
+    scraper = _get_scraper_for_url(url, flight)
 
     # Use the scraper's fetch_page method instead of basic requests.get
     # This allows specialized scrapers (like DataCampScraper) to use their own methods
@@ -43,13 +59,20 @@ def run(url: str):
         print(f"Failed to fetch {url}")
         return
 
-    articles = scraper.extract_article_data(html_content)
+    articles = scraper.extract_listing(html_content)
     if not articles:
         print("Failed to extract articles from the response.")
         return
 
     # Save articles to database
-    result = _save_articles_to_db(articles, url)
+    session = SessionLocal()
+    try:
+        # Only fetch detail pages for articles not already in the database
+        new_articles, known = _filter_new_articles(articles, session)
+        result = _save_articles_to_db(scraper.iter_enriched(new_articles), url, session, flight)
+        result['skipped'] += known
+    finally:
+        session.close()
     
     # Display results
     print(f"\nProcessed: {url}")
@@ -59,177 +82,468 @@ def run(url: str):
         print(f"  Errors: {result['errors']}")
 
 
-def _save_articles_to_db(articles: List[dict], url: str, session) -> Dict:
+def _content_hash(html_content: str) -> str:
+    """Fingerprint a fetched page so unchanged pages can be recognised next run."""
+    return hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+
+
+def _unchanged_result(url: str) -> Dict:
+    """Build the result dictionary for a page identical to the last successful run."""
+    return {
+        'url': url,
+        'status': 'unchanged',
+        'created': 0,
+        'skipped': 0,
+        'errors': 0,
+        'total_articles': 0
+    }
+
+
+def _extract_listing(scraper: WebScraper, html_content: str,
+                     parse_pool: Optional[Executor] = None) -> List[ArticleRecord]:
+    """Extract listing articles in this thread, or in the parse pool if one is given."""
+    if parse_pool is None:
+        return scraper.extract_listing(html_content)
+    return _extract_in_pool(scraper, html_content, parse_pool)
+
+
+def _iter_listing(scraper: WebScraper, html_content: str,
+                  parse_pool: Optional[Executor] = None) -> Iterable[ArticleRecord]:
+    """Stream listing articles as cards are extracted (the parse pool returns them all at once)."""
+    if parse_pool is None:
+        return scraper.iter_articles(html_content)
+    return _extract_in_pool(scraper, html_content, parse_pool)
+
+
+def _extract_in_pool(scraper: WebScraper, html_content: str, parse_pool: Executor) -> List[ArticleRecord]:
+    return parse_pool.submit(
+        extract_records, scraper_name_for_url(scraper.url), scraper.url,
+        html_content.encode('utf-8'), scraper.parser
+    ).result()
+
+
+def _batched(items: Iterable[ArticleRecord], size: int) -> Iterator[List[ArticleRecord]]:
+    """Yield lists of up to size items from a stream."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _filter_new_articles(articles: List[ArticleRecord], session,
+                         known_urls: Optional[KnownUrlIndex] = None) -> Tuple[List[ArticleRecord], int]:
+    """Split off articles whose URL is already stored, using one bulk query.
+
+    Returns (new_articles, known_count). Runs before enrichment so detail
+    pages are only fetched for articles that will actually be inserted.
+    With a known-URL index the check is answered from memory instead.
+    """
+    if known_urls is not None:
+        return known_urls.split_new(articles)
+    known_urls = ArticleRepository(session).get_existing_urls(a.get('url') for a in articles)
+    new_articles = [a for a in articles if a.get('url') not in known_urls]
+    return new_articles, len(articles) - len(new_articles)
+
+
+def _prepare_records(articles: Iterable[ArticleRecord], url: str,
+                     flight: Optional[SingleFlight] = None,
+                     start_index: int = 0) -> Tuple[List[ArticleRecord], int]:
+    """Collect scraped articles for saving, filling in missing Real Python authors.
+
+    This is the network part of saving, so in single-writer mode it runs in
+    the scraping thread and only the database write is handed to the writer.
+    start_index is the position of the first article on its listing page, so
+    the author fallback limit applies per page when a page is saved in batches.
+
+    Returns (records, error_count).
+    """
+    errors = 0
+    # Initialize scraper for fetching additional data if needed
+    scraper = WebScraper(url, flight=flight)
+    
+    records = []
+    
+    for index, article_data in enumerate(articles, start_index):
+        try:
+            # For Real Python articles, try to fetch author from article detail page
+            # Only fetch for first few articles to avoid rate limiting
+            if 'realpython.com' in url and article_data.get('author') == 'Unknown':
+                if index < 3:  # Limit author fetching to first 3 articles
+                    article_url = article_data.get('url', '')
+                    if article_url:
+                        fetched_author = scraper.fetch_realpython_author(article_url)
+                        if fetched_author:
+                            article_data['author'] = fetched_author
+            
+            records.append(article_data)
+                
+        except Exception as e:
+            print(f"Error processing article: {e}")
+            errors += 1
+            continue
+    return records, errors
+
+
+def _save_articles_to_db(articles: Iterable[ArticleRecord], url: str, session,
+                         flight: Optional[SingleFlight] = None, start_index: int = 0) -> Dict:
     """Save scraped articles to the database.
     
+    Authors of the batch are resolved in one lookup, and the articles are
+    inserted with one bulk INSERT ... ON CONFLICT(url) DO NOTHING in a
+    single transaction, so URLs already stored are skipped by the database.
+    
     Args:
-        articles: List of article dictionaries from scraper
+        articles: Article records from the scraper (a list or a stream)
         url: Source URL (for tracking)
-        session: Database session (shared across worker threads)
+        session: Database session (owned by the calling thread)
+        flight: Per-run fetch memo; author pages already fetched during
+            enrichment are reused instead of being requested again
+        start_index: Position of the first article among the page's articles
+            (see _prepare_records)
         
     Returns:
         Dictionary with statistics: {created, skipped, errors}
     """
+    errors = 0
     try:
         # Initialize repositories with the provided session
         author_repo = AuthorRepository(session)
         article_repo = ArticleRepository(session)
         
-        # Initialize scraper for fetching additional data if needed
-        scraper = WebScraper(url)
+        records, errors = _prepare_records(articles, url, flight, start_index)
         
-        created = 0
-        skipped = 0
-        errors = 0
+        # Resolve (or create) all authors of the batch at once
+        author_ids = author_repo.get_or_create_many(a.get('author', 'Unknown') for a in records)
         
-        # Process each article
-        for article_data in articles:
-            try:
-                # For Real Python articles, try to fetch author from article detail page
-                # Only fetch for first few articles to avoid rate limiting
-                if 'realpython.com' in url and article_data.get('author') == 'Unknown':
-                    if created < 3:  # Limit author fetching to first 3 articles
-                        article_url = article_data.get('url', '')
-                        if article_url:
-                            fetched_author = scraper.fetch_realpython_author(article_url)
-                            if fetched_author:
-                                article_data['author'] = fetched_author
-                
-                # Get or create author
-                author_name = article_data.get('author', 'Unknown')
-                author = author_repo.get_or_create(author_name)
-                
-                if not author:
-                    errors += 1
-                    continue
-                
-                # Try to add article (will skip if URL already exists)
-                result = article_repo.add_article_with_dedup(article_data, author)
-                
-                if result:
-                    created += 1
-                else:
-                    skipped += 1
-                    
-            except Exception as e:
-                print(f"Error processing article: {e}")
-                errors += 1
-                continue
-        
-        return {'created': created, 'skipped': skipped, 'errors': errors}
+        # Insert all articles at once (duplicate URLs are skipped)
+        result = article_repo.add_articles_bulk(records, author_ids)
+        result['errors'] += errors
+        return result
         
     except Exception as e:
         print(f"Database error: {e}")
-        return {'created': 0, 'skipped': 0, 'errors': len(articles)}
+        return {'created': 0, 'skipped': 0, 'errors': errors + 1}
 
 
-def _process_single(url: str, session) -> Dict:
+def _process_single(url: str, session, flight: Optional[SingleFlight] = None,
+                    cache: Optional[HttpCache] = None, skip_unchanged: bool = True,
+                    parse_pool: Optional[Executor] = None,
+                    writer: Optional[ArticleWriter] = None,
+                    known_urls: Optional[KnownUrlIndex] = None) -> Dict:
     """Helper that scrapes URL, extracts articles, and saves to database.
     
     Args:
         url: URL to process
-        session: Database session (shared across worker threads)
+        session: Database session (owned by the calling thread)
+        flight: Per-run fetch memo shared by all workers
+        cache: Optional on-disk HTTP cache for listing pages
+        skip_unchanged: Skip extraction and DB work when the page content
+            hash matches the last successful run (status 'unchanged')
+        parse_pool: Optional process pool that runs listing extraction
+        writer: Optional single-writer stage; if given, records and the page
+            fingerprint are written by it and session is only read from
+        known_urls: Optional in-memory index of stored URLs; new articles
+            are checked against it and added to it once saved
     
     Returns dictionary with statistics and metadata.
     """
     try:
-        scraper = _get_scraper_for_url(url)
+        scraper = _get_scraper_for_url(url, flight, cache)
         # Use the scraper's fetch_page method instead of basic requests.get
         # This allows specialized scrapers (like DataCampScraper) to use their own methods
         html_content = scraper.fetch_page()
         if not html_content:
-            return {
-                'url': url,
-                'status': 'error',
-                'message': f"Failed to fetch content",
-                'created': 0,
-                'skipped': 0,
-                'errors': 1
-            }
+            return _error_result(url, "Failed to fetch content")
     except Exception as err:
-        return {
-            'url': url,
-            'status': 'error',
-            'message': f"Failed to fetch: {err}",
-            'created': 0,
-            'skipped': 0,
-            'errors': 1
-        }
+        return _error_result(url, f"Failed to fetch: {err}")
 
     try:
-        articles = scraper.extract_article_data(html_content)
-        if not articles:
-            return {
-                'url': url,
-                'status': 'error',
-                'message': 'Failed to extract articles',
-                'created': 0,
-                'skipped': 0,
-                'errors': 1
-            }
+        # Byte-identical to the last successful run: nothing new to extract
+        content_hash = _content_hash(html_content)
+        fingerprints = PageFingerprintRepository(session)
+        if skip_unchanged and fingerprints.get_hash(url) == content_hash:
+            return _unchanged_result(url)
 
-        # Save to database using shared session
-        result = _save_articles_to_db(articles, url, session)
+        # Stream the page: each batch is checked against the database, enriched
+        # and saved while later cards are still being extracted
+        total = created = skipped = errors = 0
+        # New articles of this page handed to saving so far
+        saved_index = 0
+        pending_writes = []
+        for batch in _batched(_iter_listing(scraper, html_content, parse_pool), STREAM_BATCH_SIZE):
+            total += len(batch)
+            # Only fetch detail pages for articles not already in the database
+            new_articles, known = _filter_new_articles(batch, session, known_urls)
+            skipped += known
+            start_index = saved_index
+            saved_index += len(new_articles)
+            if writer is not None:
+                # Hand the batch to the writer and keep scraping
+                records, prepare_errors = _prepare_records(scraper.iter_enriched(new_articles), url, flight,
+                                                           start_index)
+                errors += prepare_errors
+                pending_writes.append((writer.submit(url, records), records))
+                continue
+            result = _save_articles_to_db(scraper.iter_enriched(new_articles), url, session, flight,
+                                          start_index)
+            _remember_saved(known_urls, new_articles, result)
+            created += result['created']
+            skipped += result['skipped']
+            errors += result['errors']
+        
+        # Wait until the writer has committed this page's records
+        for pending, records in pending_writes:
+            result = pending.result()
+            _remember_saved(known_urls, records, result)
+            created += result['created']
+            skipped += result['skipped']
+            errors += result['errors']
+
+        if total == 0:
+            return _error_result(url, 'Failed to extract articles')
+        
+        # Only remember the page once it was fully processed, so failures are retried
+        if errors == 0:
+            if writer is not None:
+                writer.save_fingerprint(url, content_hash).result()
+            else:
+                fingerprints.save_hash(url, content_hash)
         
         return {
             'url': url,
             'status': 'success',
-            'created': result['created'],
-            'skipped': result['skipped'],
-            'errors': result['errors'],
-            'total_articles': result['created'] + result['skipped']
+            'created': created,
+            'skipped': skipped,
+            'errors': errors,
+            'total_articles': created + skipped
         }
         
     except Exception as e:
-        return {
-            'url': url,
-            'status': 'error',
-            'message': str(e),
-            'created': 0,
-            'skipped': 0,
-            'errors': 1
-        }
+        return _error_result(url, str(e))
+
+
+def _remember_saved(known_urls: Optional[KnownUrlIndex], articles: List[ArticleRecord],
+                    result: Dict) -> None:
+    """Add the URLs of a saved batch to the known-URL index.
+
+    Only batches saved without errors are added; otherwise the database
+    (ON CONFLICT) still catches any that were stored.
+    """
+    if known_urls is not None and result['errors'] == 0:
+        known_urls.update(a.get('url') for a in articles)
+
 
+def _process_with_own_session(url: str, session_factory: Callable, *args) -> Dict:
+    """Run _process_single in a worker thread with a session of its own.
 
-def run_many(urls: List[str], max_workers: int = 5) -> List[Dict]:
+    SQLAlchemy sessions are not thread-safe, so every worker opens (and
+    closes) its own session from the shared factory; the engine's pool
+    hands each one a separate connection.
+    """
+    session = session_factory()
+    try:
+        return _process_single(url, session, *args)
+    finally:
+        session.close()
+
+
+def run_many(urls: List[str], max_workers: int = 5, http_cache_dir: Optional[str] = None,
+             skip_unchanged: bool = True, parse_workers: int = 0,
+             db_profile: str = DEFAULT_PROFILE, db_file: str = DB_FILE,
+             single_writer: bool = False, url_index: bool = False) -> List[Dict]:
     """Run scrape and save in parallel for a list of URLs using threads.
     
-    Creates a single database session and shares it with all worker threads.
+    Each worker thread uses its own database session from one shared engine.
+    If http_cache_dir is given, listing pages are cached there and refetched
+    with conditional GETs (ETag / Last-Modified). Pages whose content is
+    unchanged since the last successful run are reported as 'unchanged'
+    unless skip_unchanged is False. With parse_workers > 0, listing pages are
+    parsed in that many worker processes while the threads keep fetching.
+    db_profile names the SQLite PRAGMA profile (see database.SQLITE_PROFILES).
+    With single_writer, the worker threads only read from the database and
+    one writer thread saves all articles in batches (see pipeline.ArticleWriter).
+    With url_index, the stored article URLs are loaded into memory once and
+    new articles are recognised without querying the database.
+
+    db_file must be a database file: an in-memory database cannot be shared
+    between the worker threads.
 
     Returns a list of result dictionaries with statistics.
     """
-    # Initialize database once for all workers
-    SessionLocal = create_connection('scraper_data.db')
+    if is_in_memory(db_file):
+        print("run_many needs a database file; in-memory databases are not shared between worker threads")
+        return []
+
+    # One engine for all workers, with a connection per worker (plus one for
+    # the writer thread); reused by later runs with the same settings
+    pool_size = max_workers + 1 if single_writer else max_workers
+    SessionLocal = get_session_factory(db_file, profile=db_profile, pool_size=pool_size)
     if SessionLocal is None:
         print("Failed to create database connection")
         return []
     
-    create_tables()
-    session = SessionLocal()
+    # One fetch memo per run so no page is requested twice
+    flight = SingleFlight()
+    cache = HttpCache(http_cache_dir) if http_cache_dir else None
+    parse_pool = create_parse_pool(parse_workers) if parse_workers > 0 else None
+    writer = ArticleWriter(SessionLocal) if single_writer else None
+    known_urls = _load_url_index(SessionLocal) if url_index else None
     
     try:
         results = []
         with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            # Pass the shared session to each worker
-            future_to_url = {ex.submit(_process_single, url, session): url for url in urls}
+            # Each worker opens its own session from the factory
+            future_to_url = {
+                ex.submit(_process_with_own_session, url, SessionLocal, flight, cache,
+                          skip_unchanged, parse_pool, writer, known_urls): url
+                for url in urls
+            }
             for fut in as_completed(future_to_url):
                 url = future_to_url[fut]
                 try:
                     res = fut.result()
                     results.append(res)
                 except Exception as exc:
-                    results.append({
-                        'url': url,
-                        'status': 'error',
-                        'message': str(exc),
-                        'created': 0,
-                        'skipped': 0,
-                        'errors': 1
-                    })
+                    results.append(_error_result(url, str(exc)))
         return results
     finally:
-        # Close session after all workers are done
+        if writer is not None:
+            writer.close()
+        if parse_pool is not None:
+            parse_pool.shutdown()
+
+
+def _load_url_index(session_factory: Callable) -> KnownUrlIndex:
+    """Load the known-URL index with a short-lived session."""
+    session = session_factory()
+    try:
+        return KnownUrlIndex.load(session)
+    finally:
+        session.close()
+
+
+async def _process_single_async(url: str, http, session, save_lock: asyncio.Lock,
+                                flight: SingleFlight, cache: Optional[HttpCache] = None,
+                                skip_unchanged: bool = True,
+                                parse_pool: Optional[Executor] = None) -> Dict:
+    """Async counterpart of _process_single.
+
+    Network I/O runs on the event loop; database writes run in a worker
+    thread, one at a time, because the session is shared. Listing
+    extraction runs in a worker thread (or in the parse pool, if given) so
+    it never blocks the event loop.
+    """
+    from .async_scraper import AsyncWebScraper
+
+    try:
+        scraper = AsyncWebScraper(_get_scraper_for_url(url, flight, cache), http)
+        html_content = await scraper.fetch_page()
+        if not html_content:
+            return _error_result(url, "Failed to fetch content")
+    except Exception as err:
+        return _error_result(url, f"Failed to fetch: {err}")
+
+    try:
+        content_hash = _content_hash(html_content)
+        fingerprints = PageFingerprintRepository(session)
+        if skip_unchanged:
+            async with save_lock:
+                previous_hash = await asyncio.to_thread(fingerprints.get_hash, url)
+            if previous_hash == content_hash:
+                return _unchanged_result(url)
+
+        if parse_pool is None:
+            articles = await asyncio.to_thread(scraper.scraper.extract_listing, html_content)
+        else:
+            articles = await asyncio.to_thread(_extract_listing, scraper.scraper, html_content, parse_pool)
+        if not articles:
+            return _error_result(url, 'Failed to extract articles')
+
+        # Only fetch detail pages for articles not already in the database
+        async with save_lock:
+            new_articles, known = await asyncio.to_thread(_filter_new_articles, articles, session)
+        await scraper.enrich_articles(new_articles)
+
+        async with save_lock:
+            result = await asyncio.to_thread(_save_articles_to_db, new_articles, url, session, flight)
+            if result['errors'] == 0:
+                await asyncio.to_thread(fingerprints.save_hash, url, content_hash)
+        skipped = result['skipped'] + known
+
+        return {
+            'url': url,
+            'status': 'success',
+            'created': result['created'],
+            'skipped': skipped,
+            'errors': result['errors'],
+            'total_articles': result['created'] + skipped
+        }
+
+    except Exception as e:
+        return _error_result(url, str(e))
+
+
+async def _run_many_async(urls: List[str], max_concurrency: int, http_cache_dir: Optional[str],
+                          skip_unchanged: bool, parse_workers: int, db_profile: str,
+                          db_file: str) -> List[Dict]:
+    from .async_scraper import create_client_session
+
+    SessionLocal = get_session_factory(db_file, profile=db_profile)
+    if SessionLocal is None:
+        print("Failed to create database connection")
+        return []
+
+    session = SessionLocal()
+    save_lock = asyncio.Lock()
+    flight = SingleFlight()
+    cache = HttpCache(http_cache_dir) if http_cache_dir else None
+    parse_pool = create_parse_pool(parse_workers) if parse_workers > 0 else None
+
+    try:
+        async with create_client_session(max_concurrency) as http:
+            tasks = [
+                _process_single_async(url, http, session, save_lock, flight, cache, skip_unchanged,
+                                      parse_pool)
+                for url in urls
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [
+            _error_result(url, str(res)) if isinstance(res, BaseException) else res
+            for url, res in zip(urls, results)
+        ]
+    finally:
         session.close()
+        if parse_pool is not None:
+            parse_pool.shutdown()
+
+
+def run_many_async(urls: List[str], max_concurrency: int = 100,
+                   http_cache_dir: Optional[str] = None, skip_unchanged: bool = True,
+                   parse_workers: int = 0, db_profile: str = DEFAULT_PROFILE,
+                   db_file: str = DB_FILE) -> List[Dict]:
+    """Run scrape and save for a list of URLs on a single asyncio event loop.
+
+    Up to max_concurrency HTTP requests are kept in flight at once, instead of
+    one request per worker thread as in run_many(). http_cache_dir,
+    skip_unchanged, parse_workers, db_profile and db_file behave as in
+    run_many(), except that all saves go through one session, so db_file
+    may also be ':memory:'.
+
+    Returns a list of result dictionaries with statistics.
+    """
+    return asyncio.run(_run_many_async(urls, max_concurrency, http_cache_dir, skip_unchanged,
+                                       parse_workers, db_profile, db_file))
+
+
+def _error_result(url: str, message: str) -> Dict:
+    """Build the result dictionary for a URL that failed to process."""
+    return {
+        'url': url,
+        'status': 'error',
+        'message': message,
+        'created': 0,
+        'skipped': 0,
+        'errors': 1
+    }
 
 
 def aggregate_results(results: List[Dict]) -> Dict:
@@ -245,6 +559,7 @@ def aggregate_results(results: List[Dict]) -> Dict:
     total_skipped = 0
     total_errors = 0
     successful_urls = 0
+    unchanged_urls = 0
     failed_urls = 0
     
     for result in results:
@@ -252,6 +567,8 @@ def aggregate_results(results: List[Dict]) -> Dict:
             successful_urls += 1
             total_created += result.get('created', 0)
             total_skipped += result.get('skipped', 0)
+        elif result['status'] == 'unchanged':
+            unchanged_urls += 1
         else:
             failed_urls += 1
             total_errors += result.get('errors', 1)
@@ -259,6 +576,7 @@ def aggregate_results(results: List[Dict]) -> Dict:
     return {
         'total_urls': len(results),
         'successful_urls': successful_urls,
+        'unchanged_urls': unchanged_urls,
         'failed_urls': failed_urls,
         'total_created': total_created,
         'total_skipped': total_skipped,
@@ -266,11 +584,36 @@ def aggregate_results(results: List[Dict]) -> Dict:
     }
 
 
-def run_many_and_aggregate(urls: List[str], max_workers: int = 5) -> Tuple[List[Dict], Dict]:
+def run_many_and_aggregate(urls: List[str], max_workers: int = 5,
+                           http_cache_dir: Optional[str] = None,
+                           skip_unchanged: bool = True,
+                           parse_workers: int = 0,
+                           db_profile: str = DEFAULT_PROFILE,
+                           single_writer: bool = False,
+                           url_index: bool = False) -> Tuple[List[Dict], Dict]:
     """Convenience: run many URLs in parallel and return aggregated statistics.
 
     Returns (results, aggregated_stats)
     """
-    results = run_many(urls, max_workers=max_workers)
+    results = run_many(urls, max_workers=max_workers, http_cache_dir=http_cache_dir,
+                       skip_unchanged=skip_unchanged, parse_workers=parse_workers,
+                       db_profile=db_profile, single_writer=single_writer,
+                       url_index=url_index)
+    stats = aggregate_results(results)
+    return results, stats
+
+
+def run_many_async_and_aggregate(urls: List[str], max_concurrency: int = 100,
+                                 http_cache_dir: Optional[str] = None,
+                                 skip_unchanged: bool = True,
+                                 parse_workers: int = 0,
+                                 db_profile: str = DEFAULT_PROFILE) -> Tuple[List[Dict], Dict]:
+    """Convenience: run many URLs on the async engine and return aggregated statistics.
+
+    Returns (results, aggregated_stats)
+    """
+    results = run_many_async(urls, max_concurrency=max_concurrency, http_cache_dir=http_cache_dir,
+                             skip_unchanged=skip_unchanged, parse_workers=parse_workers,
+                             db_profile=db_profile)
     stats = aggregate_results(results)
     return results, stats
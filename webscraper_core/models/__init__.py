@@ -1,11 +1,12 @@
 """Models package for webscraper_core.
 
-Exports the Author and Article models and the Base declarative base.
+Exports the Author, Article and PageFingerprint models and the Base declarative base.
 """
 
 from .base import Base
 from .author import Author
 from .article import Article
+from .page_fingerprint import PageFingerprint
 
-__all__ = ['Author', 'Article', 'Base']
+__all__ = ['Author', 'Article', 'PageFingerprint', 'Base']
 
@@ -8,7 +8,9 @@ class Author(Base):
     __tablename__ = 'author'
     
     author_id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False)
+    # Unique index: lookups by name are indexed and concurrent workers cannot
+    # create the same author twice
+    name = Column(String(255), nullable=False, unique=True, index=True)
     
     # Relationship to Article model
     articles = relationship("Article", back_populates="author", cascade="all, delete-orphan")
@@ -0,0 +1,14 @@
+"""PageFingerprint model using SQLAlchemy."""
+from sqlalchemy import Column, String, DateTime
+from .base import Base
+
+class PageFingerprint(Base):
+    """Content hash of a listing page from the last successful run."""
+    __tablename__ = 'page_fingerprint'
+    
+    url = Column(String(500), primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    
+    def __repr__(self):
+        return f"<PageFingerprint(url='{self.url}', content_hash='{self.content_hash}', updated_at={self.updated_at})>"
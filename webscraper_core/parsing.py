@@ -0,0 +1,78 @@
+"""HTML parser backend selection for all extractors.
+
+BeautifulSoup can build trees with lxml, html5lib or Python's html.parser.
+The backend is chosen per call from (in order) an explicit name, a site
+scraper's PARSER attribute, or the global default. If the requested backend
+is not installed, the next one in PARSER_FALLBACKS is used; html.parser is
+built in, so a parser is always available.
+
+Callers may pass a SoupStrainer as parse_only to build only the subtrees
+they read (article cards, author boxes). html5lib cannot strain, so with
+that backend the whole document is parsed instead.
+"""
+import re
+import threading
+from typing import Optional, Pattern
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+
+# Preference order when the requested backend is not installed
+PARSER_FALLBACKS = ('lxml', 'html.parser')
+PARSERS = ('lxml', 'html5lib', 'html.parser')
+
+_default_parser = 'lxml'
+_warned = set()
+_warned_lock = threading.Lock()
+
+
+def is_available(parser: str) -> bool:
+    """Return True if BeautifulSoup can use the given backend in this environment."""
+    return builder_registry.lookup(parser) is not None
+
+
+def set_default_parser(parser: str) -> None:
+    """Set the backend used when neither the call nor the scraper names one."""
+    global _default_parser
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown parser '{parser}', expected one of {', '.join(PARSERS)}")
+    _default_parser = parser
+
+
+def get_default_parser() -> str:
+    """Return the global default backend name (before fallback)."""
+    return _default_parser
+
+
+def resolve_parser(parser: Optional[str] = None) -> str:
+    """Return the backend to use for `parser` (or the default), falling back if not installed."""
+    requested = parser or _default_parser
+    if is_available(requested):
+        return requested
+
+    fallback = next(p for p in PARSER_FALLBACKS if is_available(p))
+    with _warned_lock:
+        if requested not in _warned:
+            _warned.add(requested)
+            print(f"Warning: parser '{requested}' is not installed, using '{fallback}'")
+    return fallback
+
+
+def class_pattern(*names: str) -> Pattern:
+    """Return a regex matching a class attribute that contains any of names.
+
+    SoupStrainer sees the raw attribute string while parsing ("card border-0"),
+    so class_='card' would not match a multi-class element; use this instead.
+    """
+    alternatives = '|'.join(re.escape(name) for name in names)
+    return re.compile(rf'(?:^|\s)(?:{alternatives})(?:\s|$)')
+
+
+def make_soup(html_content: str, parser: Optional[str] = None, **kwargs) -> BeautifulSoup:
+    """Parse HTML with the resolved backend. Extra kwargs are passed to BeautifulSoup."""
+    resolved = resolve_parser(parser)
+    if resolved == 'html5lib' and kwargs.get('parse_only') is not None:
+        # html5lib ignores parse_only (with a warning); parse the full tree quietly
+        kwargs.pop('parse_only')
+    return BeautifulSoup(html_content, resolved, **kwargs)
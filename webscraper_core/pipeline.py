@@ -0,0 +1,235 @@
+"""Single-writer database stage for run_many().
+
+SQLite allows one writer at a time, so when every scraping thread commits
+its own batches the threads queue up on the database lock. In single-writer
+mode the scraping threads only fetch, parse and enrich: they hand their
+article records to an ArticleWriter, whose one thread drains a bounded
+queue and writes many pages' records per transaction through the bulk
+repository paths. When the writer falls behind, the full queue blocks the
+scraping threads (backpressure) instead of letting records pile up in memory.
+
+Usage:
+  with ArticleWriter(SessionLocal) as writer:
+      result = writer.submit(url, records).result()   # {created, skipped, errors}
+      writer.save_fingerprint(url, content_hash).result()
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import Callable, List, Mapping, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from .repositories.author_repository import AuthorRepository
+from .repositories.article_repository import ArticleRepository
+from .repositories.page_fingerprint_repository import PageFingerprintRepository
+
+
+# Records written per transaction; a flush happens once this many are pending
+WRITER_BATCH_SIZE = 500
+# Seconds a submitted record may wait for its batch to fill before it is written
+WRITER_FLUSH_INTERVAL = 0.5
+# Submissions (pages' batches) the queue holds before submit() blocks
+WRITER_QUEUE_SIZE = 64
+# Seconds close() waits for the writer to finish the queued work
+WRITER_CLOSE_TIMEOUT = 60.0
+# Seconds between checks that the writer is still alive while the queue is full
+_PUT_POLL_INTERVAL = 0.1
+
+
+class _WriteRequest:
+    """Records (or a page fingerprint) waiting to be written, and their future."""
+
+    __slots__ = ('url', 'records', 'content_hash', 'future')
+
+    def __init__(self, url: str, records: Optional[List[Mapping]] = None,
+                 content_hash: Optional[str] = None):
+        self.url = url
+        self.records = records
+        self.content_hash = content_hash
+        self.future: Future = Future()
+
+
+# Queue sentinel that tells the writer thread to flush and stop
+_STOP = object()
+
+
+class ArticleWriter:
+    """Write article records from many threads through one database session.
+
+    The writer thread flushes when WRITER_BATCH_SIZE records are pending or
+    when the oldest pending submission has waited flush_interval seconds.
+    Each flush resolves all authors with one get_or_create_many() call and
+    inserts every page's records in one transaction; if that transaction
+    fails, the pages are retried one transaction each so a single bad page
+    does not fail the others. If the writer thread itself stops on an
+    unexpected error, every queued and later submission fails with
+    RuntimeError instead of leaving its caller waiting.
+    """
+
+    def __init__(self, session_factory: Callable, batch_size: int = WRITER_BATCH_SIZE,
+                 flush_interval: float = WRITER_FLUSH_INTERVAL,
+                 max_pending: int = WRITER_QUEUE_SIZE):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Number of batches written so far
+        self.flushes = 0
+        self._session_factory = session_factory
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        # Set once the writer thread has exited (normally or not)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='article-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, url: str, records: List[Mapping]) -> Future:
+        """Queue records scraped from url for writing.
+
+        Blocks while the queue is full. The returned future resolves to
+        {created, skipped, errors} for these records once they are committed,
+        or raises RuntimeError if the writer thread stopped before writing them.
+        """
+        request = _WriteRequest(url, records=list(records))
+        if not request.records:
+            request.future.set_result({'created': 0, 'skipped': 0, 'errors': 0})
+            return request.future
+        return self._put(request)
+
+    def save_fingerprint(self, url: str, content_hash: str) -> Future:
+        """Queue the page fingerprint for url; the future resolves to True if saved.
+
+        Submit it after the page's record futures have resolved, so the
+        fingerprint is only stored for pages whose articles were written.
+        """
+        return self._put(_WriteRequest(url, content_hash=content_hash))
+
+    def close(self) -> None:
+        """Write everything still queued, then stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(_STOP, timeout=_PUT_POLL_INTERVAL)
+                break
+            except queue.Full:
+                continue
+        self._thread.join(timeout=WRITER_CLOSE_TIMEOUT)
+        if self._thread.is_alive():
+            print(f"Warning: database writer still busy after {WRITER_CLOSE_TIMEOUT:.0f}s")
+
+    def __enter__(self) -> 'ArticleWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _put(self, request: _WriteRequest) -> Future:
+        if self._closed:
+            raise RuntimeError("ArticleWriter is closed")
+        # Timed puts, so a full queue cannot block forever once the writer is gone
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(request, timeout=_PUT_POLL_INTERVAL)
+                break
+            except queue.Full:
+                continue
+        if self._stopped.is_set():
+            self._fail(request)
+            self._fail_queued()
+        return request.future
+
+    def _run(self) -> None:
+        pending: List[_WriteRequest] = []
+        try:
+            session = self._session_factory()
+            try:
+                self._write_loop(session, pending)
+            finally:
+                session.close()
+        except BaseException as e:
+            print(f"Database writer stopped: {e}")
+        finally:
+            # Fail whatever the writer took or left behind, so no caller waits forever
+            self._stopped.set()
+            for request in pending:
+                self._fail(request)
+            self._fail_queued()
+
+    def _write_loop(self, session, pending: List[_WriteRequest]) -> None:
+        pending_records = 0
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # Oldest submission waited long enough
+
+            if item is not None and item is not _STOP:
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(item)
+                pending_records += len(item.records or ())
+                if pending_records < self.batch_size:
+                    continue
+
+            if pending:
+                self._flush(session, pending)
+                pending.clear()
+                pending_records = 0
+            if item is _STOP:
+                return
+
+    def _fail_queued(self) -> None:
+        """Fail every submission still in the queue."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                self._fail(item)
+
+    @staticmethod
+    def _fail(request: _WriteRequest) -> None:
+        try:
+            request.future.set_exception(RuntimeError("Database writer stopped before writing"))
+        except InvalidStateError:
+            pass  # Already resolved
+
+    def _flush(self, session, pending: List[_WriteRequest]) -> None:
+        writes = [r for r in pending if r.records is not None]
+        fingerprints = [r for r in pending if r.content_hash is not None]
+        self.flushes += 1
+        try:
+            if writes:
+                for request, result in zip(writes, self._write_records(session, writes)):
+                    request.future.set_result(result)
+            fingerprint_repo = PageFingerprintRepository(session)
+            for request in fingerprints:
+                request.future.set_result(fingerprint_repo.save_hash(request.url, request.content_hash))
+        except Exception as e:
+            print(f"Database writer error: {e}")
+            for request in pending:
+                if not request.future.done():
+                    request.future.set_result(
+                        {'created': 0, 'skipped': 0, 'errors': len(request.records)}
+                        if request.records is not None else False
+                    )
+
+    def _write_records(self, session, writes: List[_WriteRequest]) -> List[dict]:
+        author_ids = AuthorRepository(session).get_or_create_many(
+            record.get('author', 'Unknown') for request in writes for record in request.records
+        )
+        article_repo = ArticleRepository(session)
+        try:
+            results = [article_repo.add_articles_bulk(request.records, author_ids, commit=False)
+                       for request in writes]
+            session.commit()
+            return results
+        except SQLAlchemyError as e:
+            session.rollback()
+            print(f"Batch write failed, retrying page by page: {e}")
+            return [article_repo.add_articles_bulk(request.records, author_ids) for request in writes]
@@ -0,0 +1,139 @@
+"""Per-host token-bucket rate limiting shared by all fetch paths.
+
+Each host gets its own bucket. A caller reserves a slot under a short lock and
+then waits outside it, so requests to different hosts never wait on each
+other's delays, and threads and coroutines hitting the same host share one
+budget. Retry-After responses push the host's next slot out.
+"""
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket allowing `burst` immediate requests, refilled at `rate` per second.
+
+    A rate of None means unlimited; only blocked_until (Retry-After) applies.
+    Not thread-safe on its own; HostRateLimiter serialises access.
+    """
+
+    def __init__(self, rate: Optional[float], burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how many seconds to wait before using it.
+
+        Tokens may go negative: each caller reserves the next free slot, so
+        concurrent callers are spaced 1/rate apart instead of all waking at once.
+        """
+        if self.rate is None:
+            return max(0.0, self.blocked_until - now)
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+
+class HostRateLimiter:
+    """Registry of per-host token buckets.
+
+    Usage:
+      limiter = HostRateLimiter()
+      limiter.configure('realpython.com', rate=0.5, burst=1)
+      limiter.acquire('https://realpython.com/some-article/')   # sleeps if needed
+      await limiter.acquire_async(url)                          # asyncio variant
+
+    Hosts without a configured limit are not delayed (except by Retry-After).
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).hostname or url
+
+    def configure(self, host: str, rate: float, burst: int = 1) -> None:
+        """Set the rate (requests per second) and burst for a host.
+
+        Reconfiguring an existing host keeps its current token state, so
+        creating another scraper for the same site does not reset the budget.
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                self._buckets[host] = TokenBucket(rate, burst)
+            else:
+                bucket.rate = rate
+                bucket.burst = max(1, burst)
+
+    def reserve(self, url: str) -> float:
+        """Reserve a request slot for the URL's host and return the seconds to wait."""
+        host = self._host(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                return 0.0
+            return bucket.reserve(time.monotonic())
+
+    def acquire(self, url: str) -> None:
+        """Block the calling thread until a request to the URL's host is allowed."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait without blocking the event loop until a request to the URL's host is allowed."""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold all requests to the URL's host for `seconds` (e.g. from Retry-After)."""
+        host = self._host(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                # Unlimited host: add a bucket that only enforces the hold
+                bucket = self._buckets[host] = TokenBucket(rate=None)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + seconds)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_default_limiter: Optional[HostRateLimiter] = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_default_limiter() -> HostRateLimiter:
+    """Return the process-wide shared HostRateLimiter, creating it on first use."""
+    global _default_limiter
+    if _default_limiter is None:
+        with _default_limiter_lock:
+            if _default_limiter is None:
+                _default_limiter = HostRateLimiter()
+    return _default_limiter
@@ -0,0 +1,93 @@
+"""Compact article record passed between scrapers, enrichment and the database.
+
+A scraped article has four fixed fields, so ArticleRecord stores them in
+__slots__ instead of a per-instance dict; a record takes about a third of the
+memory of the equivalent dict. It also behaves like a read/write
+mapping over those four keys (record['author'], record.get('url'),
+dict(record), record == {...}), so code written against article dicts
+keeps working.
+"""
+from collections.abc import Mapping
+from datetime import date
+from typing import Any, Iterator, Optional, Tuple
+
+
+FIELDS = ('title', 'author', 'url', 'publication_date')
+
+
+class ArticleRecord:
+    """One scraped article: title, author, url and publication_date.
+
+    Usage:
+      record = ArticleRecord(title='Intro', url='https://...')
+      record.author = 'Jane Doe'        # attribute access
+      record['author'] = 'Jane Doe'     # or dict-style access
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, title: str = 'Untitled', author: str = 'Unknown', url: str = '',
+                 publication_date: Optional[date] = None):
+        self.title = title
+        self.author = author
+        self.url = url
+        self.publication_date = publication_date
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'ArticleRecord':
+        """Build a record from an article dict; missing keys get the defaults."""
+        return cls(**{key: data[key] for key in FIELDS if key in data})
+
+    def to_dict(self) -> dict:
+        """Return the record as a plain dict."""
+        return {key: getattr(self, key) for key in FIELDS}
+
+    # Mapping-style access, so records can stand in for article dicts
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in FIELDS else default
+
+    def __contains__(self, key: object) -> bool:
+        return key in FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def keys(self) -> Tuple[str, ...]:
+        return FIELDS
+
+    def values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, key) for key in FIELDS)
+
+    def items(self) -> Tuple[Tuple[str, Any], ...]:
+        return tuple((key, getattr(self, key)) for key in FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ArticleRecord):
+            return self.values() == other.values()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    # Mutable, so not hashable (like dict)
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{key}={getattr(self, key)!r}' for key in FIELDS)
+        return f'ArticleRecord({fields})'
+
+
+Mapping.register(ArticleRecord)
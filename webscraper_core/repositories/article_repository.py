@@ -1,9 +1,11 @@
 #ArticleRepository class to manage article data
-from typing import Optional, List
+from typing import Optional, List, Set, Iterable, Iterator, Mapping, Dict
 from datetime import date
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session  
 from sqlalchemy.exc import SQLAlchemyError
-from ..models import Article
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from ..models import Article, Author
 from .base_repository import BaseRepository
 class ArticleRepository(BaseRepository):
     """Repository class for managing Article data in the database."""
@@ -27,6 +29,33 @@ class ArticleRepository(BaseRepository):
             print(f"Database error occurred: {e}")
             return None
 
+    def get_existing_urls(self, urls: Iterable[str]) -> Set[str]:
+        """Return the subset of urls already stored, using one IN query per 500 URLs."""
+        candidates = list(dict.fromkeys(url for url in urls if url))
+        existing = set()
+        try:
+            for i in range(0, len(candidates), 500):
+                chunk = candidates[i:i + 500]
+                rows = self.session.query(self.model.url).filter(self.model.url.in_(chunk))
+                existing.update(url for (url,) in rows)
+            return existing
+        except SQLAlchemyError as e:
+            print(f"Database error occurred: {e}")
+            return set()
+
+    def iter_urls(self, chunk_size: int = 1000) -> Iterator[str]:
+        """Yield every stored article URL, fetching chunk_size rows at a time.
+        
+        The rows are streamed from one query instead of being loaded into a
+        list, so memory use does not grow with the table.
+        """
+        try:
+            rows = self.session.query(self.model.url).yield_per(chunk_size)
+            for (url,) in rows:
+                yield url
+        except SQLAlchemyError as e:
+            print(f"Database error occurred: {e}")
+
     def create_article(self, author_id: int, title: str) -> Optional[Article]:
         """Create a new article in the database."""
         try:
@@ -43,7 +72,7 @@ class ArticleRepository(BaseRepository):
         """Add article to database, skip if URL already exists (deduplication).
         
         Args:
-            data: Dictionary with keys: title, url, publication_date (optional)
+            data: ArticleRecord (or dict) with keys: title, url, publication_date (optional)
             author: Author object from AuthorRepository.get_or_create()
             
         Returns:
@@ -76,10 +105,83 @@ class ArticleRepository(BaseRepository):
             print(f"Failed to add article: {e}")
             return None
 
-    def list_articles(self) -> List[Article]:
-        """List all articles in the database."""
+    def add_articles_bulk(self, records: Iterable[Mapping], author_ids: Mapping[str, int],
+                          commit: bool = True) -> Dict[str, int]:
+        """Insert many articles in one transaction, skipping URLs that already exist.
+        
+        Uses a single INSERT ... ON CONFLICT(url) DO NOTHING, so duplicates
+        (already stored, or repeated within records) are skipped by the
+        database instead of a SELECT per article.
+        
+        Args:
+            records: ArticleRecords (or dicts) with title, author, url, publication_date
+            author_ids: Author name -> author_id for every author in records
+            commit: If False, the insert is left in the session's transaction
+                for the caller to commit, and database errors are raised
+                instead of being rolled back here
+            
+        Returns:
+            Dictionary with counts: {created, skipped, errors}; records without
+            a URL or with an unresolved author count as errors
+        """
+        rows = []
+        errors = 0
+        for data in records:
+            url = data.get('url')
+            author_id = author_ids.get(data.get('author', 'Unknown'))
+            if not url or author_id is None:
+                errors += 1
+                continue
+            rows.append({
+                'title': data.get('title', 'Untitled'),
+                'author_id': author_id,
+                'url': url,
+                'publication_date': data.get('publication_date')
+            })
+        if not rows:
+            return {'created': 0, 'skipped': 0, 'errors': errors}
+        
+        try:
+            statement = sqlite_insert(self.model.__table__).on_conflict_do_nothing(index_elements=['url'])
+            created = self.session.execute(statement, rows).rowcount
+            if commit:
+                self.session.commit()
+            return {'created': created, 'skipped': len(rows) - created, 'errors': errors}
+        except SQLAlchemyError as e:
+            if not commit:
+                raise
+            self.session.rollback()
+            print(f"Failed to add articles: {e}")
+            return {'created': 0, 'skipped': 0, 'errors': errors + len(rows)}
+
+    def list_articles(self, load: Optional[str] = None) -> List[Article]:
+        """List all articles in the database.
+        
+        Loads the whole table; for large tables use iter_all() or page_after().
+        Pass load='joined' when article.author will be read, so authors come
+        in the same query instead of one query per article.
+        """
         try:
-            return self.session.query(self.model).all()
+            return self._with_load(self.session.query(self.model), self.model, load).all()
+        except SQLAlchemyError as e:
+            print(f"Database error occurred: {e}")
+            return []
+
+    def list_articles_with_authors(self) -> List[Row]:
+        """List every article with its author's name as flat rows, for reports.
+        
+        One SELECT ... JOIN author returning plain rows (article_id, title,
+        url, publication_date, author) ordered by article_id; no ORM objects
+        are built or tracked by the session.
+        """
+        try:
+            statement = (
+                select(self.model.article_id, self.model.title, self.model.url,
+                       self.model.publication_date, Author.name.label('author'))
+                .join(Author, self.model.author_id == Author.author_id)
+                .order_by(self.model.article_id)
+            )
+            return list(self.session.execute(statement))
         except SQLAlchemyError as e:
             print(f"Database error occurred: {e}")
             return []
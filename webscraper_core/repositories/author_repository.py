@@ -1,7 +1,8 @@
 # AuthorRepository class to manage author data
-from typing import Optional, List
+from typing import Optional, List, Iterable, Dict
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from ..models import Author
 from .base_repository import BaseRepository
 class AuthorRepository(BaseRepository):
@@ -29,11 +30,45 @@ class AuthorRepository(BaseRepository):
             if author:
                 return author
             
-            # If not found, create new author
-            return self.create_author(name)
+            # If not found, create new author; if another worker created it
+            # first (unique name), use theirs
+            return self.create_author(name) or self.get_by_name(name)
         except SQLAlchemyError as e:
             print(f"Database error in get_or_create: {e}")
             return None
+    def get_or_create_many(self, names: Iterable[str]) -> Dict[str, int]:
+        """Resolve many author names to author_ids, creating the missing authors.
+        
+        Existing authors are found with one IN query per 500 names; missing
+        ones are added with a single INSERT ... ON CONFLICT DO NOTHING, so an
+        author created concurrently by another worker is reused, not duplicated.
+        
+        Returns:
+            Dictionary mapping each resolved name to its author_id
+        """
+        wanted = list(dict.fromkeys(name for name in names if name is not None))
+        author_ids: Dict[str, int] = {}
+        try:
+            author_ids.update(self._lookup_ids(wanted))
+            missing = [name for name in wanted if name not in author_ids]
+            if missing:
+                statement = sqlite_insert(self.model.__table__).on_conflict_do_nothing()
+                self.session.execute(statement, [{'name': name} for name in missing])
+                self.session.commit()
+                author_ids.update(self._lookup_ids(missing))
+            return author_ids
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            print(f"Database error in get_or_create_many: {e}")
+            return author_ids
+    def _lookup_ids(self, names: List[str]) -> Dict[str, int]:
+        """Return {name: author_id} for the names already stored."""
+        found = {}
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            rows = self.session.query(self.model.name, self.model.author_id).filter(self.model.name.in_(chunk))
+            found.update((name, author_id) for name, author_id in rows)
+        return found
     def create_author(self, name: str) -> Optional[Author]:
         """Create a new author in the database."""
         try:
@@ -45,10 +80,15 @@ class AuthorRepository(BaseRepository):
             self.session.rollback()
             print(f"Failed to create author: {e}")
             return None
-    def list_authors(self) -> List[Author]:
-        """List all authors in the database."""
+    def list_authors(self, load: Optional[str] = None) -> List[Author]:
+        """List all authors in the database.
+        
+        Loads the whole table; for large tables use iter_all() or page_after().
+        Pass load='selectin' when author.articles will be read, so all
+        articles come in one extra query instead of one query per author.
+        """
         try:
-            return self.session.query(self.model).all()
+            return self._with_load(self.session.query(self.model), self.model, load).all()
         except SQLAlchemyError as e:
             print(f"Database error occurred: {e}")
             return []   
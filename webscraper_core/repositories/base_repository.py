@@ -1,10 +1,22 @@
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Callable
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar, Generic, Callable
 
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Query, Session, joinedload, selectinload, sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 
 T = TypeVar("T")
 
+# Rows fetched per round trip by the streaming reads
+DEFAULT_CHUNK_SIZE = 1000
+
+# Relationship loading strategies for the load argument of the read methods:
+#   'joined'   - related rows come in the same SELECT through a LEFT OUTER JOIN
+#                (best for many-to-one, e.g. Article.author)
+#   'selectin' - related rows come in one extra SELECT ... WHERE key IN (...)
+#                per batch (best for collections, e.g. Author.articles; the
+#                only one that works with collections while streaming)
+# None keeps lazy loading: one query per row the first time it is accessed.
+LOAD_STRATEGIES = {'joined': joinedload, 'selectin': selectinload}
+
 
 class BaseRepository(Generic[T]):
     """
@@ -21,6 +33,15 @@ class BaseRepository(Generic[T]):
       users = repo.fetch_all(User)                      # List[User]
       user = repo.fetch_by_id(User, 1)                  # Optional[User]
       posts = repo.fetch_by_criteria(Post, {"author_id": 3})
+
+      # Large tables: stream rows instead of building one list
+      for post in repo.iter_by_criteria(Post, {"author_id": 3}):
+          ...
+      page = repo.page_after(None, 100, Post)           # first 100 by primary key
+      page = repo.page_after(page[-1].post_id, 100, Post)
+
+      # Load relationships up front instead of one query per row
+      posts = repo.fetch_all(Post, load='joined')
       repo.close()
     """
 
@@ -50,12 +71,12 @@ class BaseRepository(Generic[T]):
         if not hasattr(model, "__table__"):
             raise ValueError(f"Invalid SQLAlchemy model: {model!r}")
 
-    def fetch_all(self, model: Type[T]) -> List[T]:
-        """Return all rows as mapped model instances."""
+    def fetch_all(self, model: Type[T], load: Optional[str] = None) -> List[T]:
+        """Return all rows as mapped model instances (load: see LOAD_STRATEGIES)."""
         self._validate_model(model)
         session = self._get_session()
         try:
-            return session.query(model).all()
+            return self._with_load(session.query(model), model, load).all()
         except SQLAlchemyError as e:
             raise RuntimeError(f"Database error when querying model '{model.__name__}': {e}")
 
@@ -69,27 +90,93 @@ class BaseRepository(Generic[T]):
         except SQLAlchemyError as e:
             raise RuntimeError(f"Database error when getting '{model.__name__}' id={record_id}: {e}")
 
-    def fetch_by_criteria(self, model: Type[T], criteria: Dict[str, Any]) -> List[T]:
+    def fetch_by_criteria(self, model: Type[T], criteria: Dict[str, Any],
+                          load: Optional[str] = None) -> List[T]:
         """
         Return rows that match all column=value pairs in criteria.
         If criteria is empty, returns all rows.
         """
         self._validate_model(model)
         if not criteria:
-            return self.fetch_all(model)
+            return self.fetch_all(model, load)
+
+        self._validate_criteria(model, criteria)
+        session = self._get_session()
+        try:
+            return self._with_load(session.query(model), model, load).filter_by(**criteria).all()
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Database error when querying model '{model.__name__}': {e}")
+
+    def iter_all(self, model: Optional[Type[T]] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, load: Optional[str] = None) -> Iterator[T]:
+        """
+        Yield all rows as mapped instances, loading chunk_size rows at a time.
+        Memory use stays flat however large the table is. model defaults to
+        the repository's model. Do not commit on the same session while iterating.
+        """
+        return self.iter_by_criteria(model, {}, chunk_size, load)
+
+    def iter_by_criteria(self, model: Optional[Type[T]] = None,
+                         criteria: Optional[Dict[str, Any]] = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         load: Optional[str] = None) -> Iterator[T]:
+        """Streaming counterpart of fetch_by_criteria() (see iter_all())."""
+        model = model or self.model
+        self._validate_model(model)
+        if criteria:
+            self._validate_criteria(model, criteria)
+        query = self._with_load(self._get_session().query(model), model, load)
+        if criteria:
+            query = query.filter_by(**criteria)
+        # Validation above runs now; rows are only fetched once iteration starts
+        return self._stream(model, query.yield_per(chunk_size))
+
+    def _stream(self, model: Type[T], query) -> Iterator[T]:
+        try:
+            yield from query
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Database error when querying model '{model.__name__}': {e}")
 
+    def page_after(self, last_id: Any = None, limit: int = 100,
+                   model: Optional[Type[T]] = None, load: Optional[str] = None) -> List[T]:
+        """
+        Return up to limit rows whose primary key is greater than last_id, in
+        primary key order (keyset pagination). Pass None for the first page and
+        the last row's key for the next; an empty list means the end. Unlike
+        OFFSET, each page costs the same however deep into the table it is.
+        """
+        model = model or self.model
+        self._validate_model(model)
+        primary_key = model.__mapper__.primary_key
+        if len(primary_key) != 1:
+            raise ValueError(f"Keyset pagination needs a single-column primary key: {model.__name__}")
+        key = primary_key[0]
+
+        session = self._get_session()
+        try:
+            query = self._with_load(session.query(model), model, load)
+            if last_id is not None:
+                query = query.filter(key > last_id)
+            return query.order_by(key).limit(limit).all()
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Database error when paging model '{model.__name__}': {e}")
+
+    def _with_load(self, query: Query, model: Type[T], load: Optional[str]) -> Query:
+        """Apply a LOAD_STRATEGIES strategy to every relationship of model."""
+        if load is None:
+            return query
+        if load not in LOAD_STRATEGIES:
+            raise ValueError(f"Unknown load strategy {load!r}; expected one of {sorted(LOAD_STRATEGIES)}")
+        strategy = LOAD_STRATEGIES[load]
+        return query.options(*(strategy(rel.class_attribute) for rel in model.__mapper__.relationships))
+
+    def _validate_criteria(self, model: Type[T], criteria: Dict[str, Any]) -> None:
         # Validate column names against model's table columns to reduce injection surface
         allowed_cols = {c.name for c in model.__table__.columns}
         for col in criteria.keys():
             if col not in allowed_cols:
                 raise ValueError(f"Invalid column name for model {model.__name__}: {col}")
 
-        session = self._get_session()
-        try:
-            return session.query(model).filter_by(**criteria).all()
-        except SQLAlchemyError as e:
-            raise RuntimeError(f"Database error when querying model '{model.__name__}': {e}")
-
     def close(self) -> None:
         """Close the underlying SQLAlchemy Session (if present)."""
         if self._session is not None:
@@ -0,0 +1,37 @@
+# PageFingerprintRepository class to manage listing page content hashes
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from ..models import PageFingerprint
+from .base_repository import BaseRepository
+class PageFingerprintRepository(BaseRepository):
+    """Repository class for the per-URL content hashes of listing pages."""
+
+    def __init__(self, session: Session):
+        super().__init__(session, PageFingerprint)
+
+    def get_hash(self, url: str) -> Optional[str]:
+        """Return the content hash stored for a URL, or None if never stored."""
+        try:
+            fingerprint = self.session.get(self.model, url)
+            return fingerprint.content_hash if fingerprint else None
+        except SQLAlchemyError as e:
+            print(f"Database error occurred: {e}")
+            return None
+
+    def save_hash(self, url: str, content_hash: str) -> bool:
+        """Store (insert or update) the content hash for a URL."""
+        try:
+            fingerprint = self.session.get(self.model, url)
+            if fingerprint is None:
+                fingerprint = PageFingerprint(url=url)
+                self.session.add(fingerprint)
+            fingerprint.content_hash = content_hash
+            fingerprint.updated_at = datetime.now()
+            self.session.commit()
+            return True
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            print(f"Failed to save page fingerprint: {e}")
+            return False
@@ -3,51 +3,181 @@ Upgraded WebScraper to extract full article data instead of just titles.
 Extracts: title, author, URL, and publication_date from each article.
 """
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from datetime import datetime
-import time
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlparse
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from .http_client import HttpClient, get_default_client
+from .singleflight import SingleFlight
+from .http_cache import HttpCache
+from .parsing import make_soup
+from .dates import parse_date, contains_month
+from .records import ArticleRecord
 
 
 class WebScraper:
     """Responsible for fetching a URL and extracting rich article data."""
 
-    def __init__(self, url: str):
+    # Politeness limit for the site's host: seconds between requests at a steady
+    # rate, with RATE_LIMIT_BURST requests allowed back to back. None = unlimited.
+    RATE_LIMIT_DELAY: Optional[float] = None
+    RATE_LIMIT_BURST = 1
+    # Maximum detail pages fetched concurrently by enrich_articles()
+    DETAIL_WORKERS = 1
+    # HTML parser backend for this site ('lxml', 'html5lib', 'html.parser');
+    # None uses the global default from webscraper_core.parsing
+    PARSER: Optional[str] = None
+    # Subtrees the site's extractors read from listing and detail pages; parsing
+    # is restricted to them when set. None builds the full document tree.
+    LISTING_STRAINER: Optional[SoupStrainer] = None
+    DETAIL_STRAINER: Optional[SoupStrainer] = None
+    # Print a warning for date strings that match no known format; site
+    # scrapers fall back silently because their date text is best effort
+    WARN_UNPARSED_DATES = True
+
+    def __init__(self, url: str, http: Optional[HttpClient] = None,
+                 flight: Optional[SingleFlight] = None, cache: Optional[HttpCache] = None,
+                 parser: Optional[str] = None):
         self.url = url
+        # Shared pooled client so connections are reused across fetches and threads
+        self.http = http if http is not None else get_default_client()
+        # Per-run memo: detail pages fetched once are never fetched again in the run
+        self.flight = flight
+        # Optional on-disk cache; fetch_page revalidates it with a conditional GET
+        self.cache = cache
+        # Parser backend override for this instance (falls back to PARSER, then the global default)
+        self.parser = parser or self.PARSER
+        if self.RATE_LIMIT_DELAY:
+            host = urlparse(url).hostname
+            if host:
+                self.http.limiter.configure(host, 1 / self.RATE_LIMIT_DELAY, self.RATE_LIMIT_BURST)
+
+    def _make_soup(self, html_content: str, **kwargs) -> BeautifulSoup:
+        """Parse HTML with this scraper's configured parser backend."""
+        return make_soup(html_content, self.parser, **kwargs)
 
     def fetch_page(self):
         """Fetch HTML content from the URL."""
         try:
-            response = requests.get(self.url)
-            response.raise_for_status()
-            return response.text
+            return self.http.get_text(self.url, cache=self.cache)
         except requests.exceptions.RequestException as err:
             print(f"Failed to fetch {self.url}: {err}")
             return None
 
-    def extract_article_data(self, html_content: str) -> List[dict]:
+    def extract_article_data(self, html_content: str) -> List[ArticleRecord]:
         """Extract article data (title, author, url, publication_date) from HTML.
         
-        Returns a list of dictionaries with article information.
+        Returns a list of ArticleRecords with article information, enriched
+        from detail pages where the site needs it.
+        """
+        return self.enrich_articles(self.extract_listing(html_content))
+
+    def iter_articles(self, html_content: str) -> Iterator[ArticleRecord]:
+        """Yield article records from a listing page, one card at a time.
+        
+        Detail pages are not fetched. Consumers can start on the first record
+        (see iter_enriched) while later cards are still being extracted.
         Handles different HTML structures for different websites.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
+        soup = self._make_soup(html_content)
         
         # Try to detect which website we're scraping and use appropriate selectors
         if 'realpython.com' in self.url:
-            articles = self._extract_realpython_articles(soup)
+            yield from self._iter_realpython_articles(soup)
         elif 'freecodecamp.org' in self.url:
-            articles = self._extract_freecodecamp_articles(soup)
+            yield from self._iter_freecodecamp_articles(soup)
         elif 'datacamp.com' in self.url:
-            articles = self._extract_datacamp_articles(soup)
+            yield from self._iter_datacamp_articles(soup)
         else:
             # Fallback to generic extraction
-            articles = self._extract_generic_articles(soup)
-        
+            yield from self._iter_generic_articles(soup)
+
+    def extract_listing(self, html_content: str) -> List[ArticleRecord]:
+        """Extract all article records from a listing page without fetching detail pages."""
+        return list(self.iter_articles(html_content))
+
+    def detail_url(self, article: ArticleRecord) -> Optional[str]:
+        """Return the detail page URL to fetch for an article, or None if not needed."""
+        return None
+
+    def fetch_detail_page(self, article_url: str) -> Optional[str]:
+        """Fetch the HTML of an article detail page."""
+        try:
+            response = self.http.get(article_url)
+            response.raise_for_status()
+            return response.text
+        except requests.exceptions.RequestException as err:
+            print(f"Failed to fetch {article_url}: {err}")
+            return None
+
+    def parse_detail(self, html_content: str) -> Dict[str, Any]:
+        """Return the article fields to update from a detail page's HTML."""
+        return {}
+
+    def get_detail(self, article_url: str) -> Optional[Dict[str, Any]]:
+        """Fetch and parse a detail page at most once per run.
+
+        With a SingleFlight memo, concurrent requests for the same URL wait on
+        the first one and later requests reuse its parsed fields. Only those
+        fields are kept for the run, not the page HTML. A failed fetch returns
+        None and is not memoised, so a later request retries it.
+        """
+        if self.flight is None:
+            return self._fetch_detail(article_url)
+        return self.flight.do(article_url, lambda: self._fetch_detail(article_url))
+
+    def _fetch_detail(self, article_url: str) -> Optional[Dict[str, Any]]:
+        html_content = self.fetch_detail_page(article_url)
+        return self.parse_detail(html_content) if html_content else None
+
+    def enrich_articles(self, articles: List[ArticleRecord]) -> List[ArticleRecord]:
+        """Fetch detail pages for articles that need them and merge the results.
+
+        Up to DETAIL_WORKERS pages are fetched concurrently; the host's rate
+        limit still applies to each request. Results are merged in order on
+        the calling thread.
+        """
+        for _ in self.iter_enriched(articles):
+            pass
         return articles
 
-    def _extract_realpython_articles(self, soup: BeautifulSoup) -> List[dict]:
+    def iter_enriched(self, articles: Iterable[ArticleRecord]) -> Iterator[ArticleRecord]:
+        """Yield articles in order, each once its detail page (if any) is merged.
+
+        Accepts a stream such as iter_articles(): up to DETAIL_WORKERS detail
+        pages are fetched ahead of the article being yielded, so the first
+        record is ready after one fetch instead of after the whole page.
+        """
+        workers = max(1, self.DETAIL_WORKERS)
+        window = deque()
+        executor = None
+        try:
+            for article in articles:
+                url = self.detail_url(article)
+                if url and workers > 1:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=workers)
+                    window.append((article, executor.submit(self.get_detail, url)))
+                else:
+                    window.append((article, self.get_detail(url) if url else None))
+                # Keep at most DETAIL_WORKERS fetches ahead of the consumer
+                while len(window) > workers or (window and not isinstance(window[0][1], Future)):
+                    yield self._merge_detail(*window.popleft())
+            while window:
+                yield self._merge_detail(*window.popleft())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _merge_detail(self, article: ArticleRecord, detail) -> ArticleRecord:
+        """Apply fetched (or pending) detail fields to their article and return the article."""
+        fields = detail.result() if isinstance(detail, Future) else detail
+        for key, value in (fields or {}).items():
+            article[key] = value
+        return article
+
+    def _iter_realpython_articles(self, soup: BeautifulSoup) -> Iterator[ArticleRecord]:
         """Extract articles from Real Python (https://realpython.com).
         
         According to Real Python rules:
@@ -57,8 +187,6 @@ class WebScraper:
         4. Author info is on individual article pages
         5. Publication date is in span with date text
         """
-        articles = []
-        
         # Real Python article cards have class 'card border-0'
         for card_elem in soup.find_all('div', class_='card'):
             try:
@@ -92,12 +220,10 @@ class WebScraper:
                 # Extract publication date from span (usually says "Oct 15, 2025" format)
                 # Look for span with date text
                 pub_date = None
-                card_text = card_elem.get_text()
                 # Try to find date patterns like "Oct 15, 2025"
                 for span in card_elem.find_all('span', class_='mr-2'):
                     date_text = span.get_text(strip=True)
-                    if any(month in date_text for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                                                              'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
+                    if contains_month(date_text):
                         pub_date = self._parse_date(date_text)
                         break
                 
@@ -106,23 +232,19 @@ class WebScraper:
                 # For now, set it to Unknown and retrieve it from article detail page
                 author = 'Unknown'
                 
-                articles.append({
-                    'title': title,
-                    'author': author,
-                    'url': url,
-                    'publication_date': pub_date
-                })
+                yield ArticleRecord(
+                    title=title,
+                    author=author,
+                    url=url,
+                    publication_date=pub_date
+                )
                 
             except Exception as e:
                 print(f"Error extracting Real Python article: {e}")
                 continue
-        
-        return articles
 
-    def _extract_freecodecamp_articles(self, soup: BeautifulSoup) -> List[dict]:
+    def _iter_freecodecamp_articles(self, soup: BeautifulSoup) -> Iterator[ArticleRecord]:
         """Extract articles from freeCodeCamp News (https://www.freecodecamp.org/news)."""
-        articles = []
-        
         # freeCodeCamp uses article cards with class 'post-card'
         for article_elem in soup.find_all('article', class_=['post-card', 'article']):
             try:
@@ -146,22 +268,18 @@ class WebScraper:
                     pub_date = self._parse_date(date_str)
                 
                 if title and url:
-                    articles.append({
-                        'title': title,
-                        'author': author,
-                        'url': url,
-                        'publication_date': pub_date
-                    })
+                    yield ArticleRecord(
+                        title=title,
+                        author=author,
+                        url=url,
+                        publication_date=pub_date
+                    )
             except Exception as e:
                 print(f"Error extracting freeCodeCamp article: {e}")
                 continue
-        
-        return articles
 
-    def _extract_datacamp_articles(self, soup: BeautifulSoup) -> List[dict]:
+    def _iter_datacamp_articles(self, soup: BeautifulSoup) -> Iterator[ArticleRecord]:
         """Extract articles from DataCamp Blog (https://www.datacamp.com/blog)."""
-        articles = []
-        
         # DataCamp uses article cards with various classes
         for article_elem in soup.find_all(['article', 'div'], class_=['card', 'post', 'blog-card']):
             try:
@@ -189,25 +307,21 @@ class WebScraper:
                     pub_date = self._parse_date(date_str)
                 
                 if title and url:
-                    articles.append({
-                        'title': title,
-                        'author': author,
-                        'url': url,
-                        'publication_date': pub_date
-                    })
+                    yield ArticleRecord(
+                        title=title,
+                        author=author,
+                        url=url,
+                        publication_date=pub_date
+                    )
             except Exception as e:
                 print(f"Error extracting DataCamp article: {e}")
                 continue
-        
-        return articles
 
-    def _extract_generic_articles(self, soup: BeautifulSoup) -> List[dict]:
+    def _iter_generic_articles(self, soup: BeautifulSoup) -> Iterator[ArticleRecord]:
         """Generic article extraction for unknown websites.
         
         Attempts to find articles using common HTML patterns.
         """
-        articles = []
-        
         # Look for article elements
         for article_elem in soup.find_all(['article', 'div'], class_=['article', 'post', 'card']):
             try:
@@ -236,106 +350,44 @@ class WebScraper:
                     date_str = time_elem.get('datetime') or time_elem.get_text(strip=True)
                     pub_date = self._parse_date(date_str)
                 
-                articles.append({
-                    'title': title,
-                    'author': author,
-                    'url': url,
-                    'publication_date': pub_date
-                })
+                yield ArticleRecord(
+                    title=title,
+                    author=author,
+                    url=url,
+                    publication_date=pub_date
+                )
             except Exception as e:
                 print(f"Error extracting generic article: {e}")
                 continue
-        
-        return articles
 
     def fetch_realpython_author(self, article_url: str) -> Optional[str]:
         """Fetch author name from individual Real Python article page.
         
-        According to Real Python rules:
-        - Author name is in div class="card mt-3" with id="author"
-        - Specifically in a strong tag inside a p tag with class="card-header h3"
-        
-        Includes rate limiting to avoid 429 errors.
+        Delegates to RealPythonScraper so the request goes through the same
+        per-host rate limit and per-run memo as the scraper's own
+        detail-page fetches; a page already fetched in this run is reused.
         """
-        try:
-            # Add delay to avoid rate limiting (2 seconds between requests)
-            time.sleep(2)
-            
-            response = requests.get(article_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find author card: div class="card mt-3" with id="author"
-            author_card = soup.find('div', class_='card', id='author')
-            if not author_card:
-                return None
-            
-            # Find p tag with class "card-header"
-            header_p = author_card.find('p', class_='card-header')
-            if not header_p:
-                return None
-            
-            # Find strong tag inside the p tag
-            strong_tag = header_p.find('strong')
-            if not strong_tag:
-                return None
-            
-            author_name = strong_tag.get_text(strip=True)
-            return author_name if author_name else None
-            
-        except requests.exceptions.Timeout:
-            print(f"Timeout fetching author from {article_url}")
-            return None
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:
-                print(f"Rate limited (429) - backing off from {article_url}")
-            else:
-                print(f"HTTP error fetching author from {article_url}: {e}")
-            return None
-        except Exception as e:
-            print(f"Error fetching author from {article_url}: {e}")
-            return None
+        # Imported here: the site scrapers subclass WebScraper
+        from .scrapers.realpython_scraper import RealPythonScraper
+        scraper = RealPythonScraper(article_url, http=self.http, flight=self.flight)
+        return scraper._fetch_author_from_detail_page(article_url)
 
     def _parse_date(self, date_str: str) -> Optional[object]:
         """Parse date string into Python date object.
         
-        Handles various date formats commonly found in web articles.
+        Handles the date formats commonly found in web articles
+        (see webscraper_core.dates).
         """
-        if not date_str:
-            return None
-        
-        # Common date formats to try
-        date_formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-        ]
-        
-        # Remove timezone info if present
-        if '+' in date_str:
-            date_str = date_str.split('+')[0]
-        if 'T' in date_str:
-            date_str = date_str.split('T')[0]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str.strip(), fmt)
-                return parsed_date.date()
-            except ValueError:
-                continue
-        
-        # If no format matched, return None
-        print(f"Warning: Could not parse date '{date_str}'")
-        return None
+        parsed_date = parse_date(date_str)
+        if parsed_date is None and date_str and self.WARN_UNPARSED_DATES:
+            print(f"Warning: Could not parse date '{date_str}'")
+        return parsed_date
 
-    def scrape(self, response_text: str | None = None) -> List[dict]:
+    def scrape(self, response_text: str | None = None) -> List[ArticleRecord]:
         """Scrape and return article data.
         
         If response_text is provided, uses that instead of fetching.
-        Returns list of article dictionaries.
+        Returns a list of ArticleRecords.
         """
         if response_text is None:
             response_text = self.fetch_page()
@@ -346,7 +398,7 @@ class WebScraper:
 
     def extract_titles(self, html_content: str) -> List[str]:
         """Legacy method: Extract only titles from HTML (for backward compatibility)."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self._make_soup(html_content)
         titles = [h2.get_text() for h2 in soup.find_all('h2')]
         if not titles:
             titles = [tag.get_text() for tag in soup.find_all(class_='card-title')]
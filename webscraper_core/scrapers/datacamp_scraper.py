@@ -8,64 +8,101 @@ Follows the extraction rules in docs/DATA_CAMP_RULES.md:
 5. Publication date is in a <p> tag near the bottom of the card
 """
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from datetime import datetime
+from bs4 import SoupStrainer
+from typing import Iterator, List, Optional
 from webscraper_core.scraper import WebScraper
-import time
+from webscraper_core.http_client import HttpClient
+from webscraper_core.clearance_cache import ClearanceCache
+from webscraper_core.dates import contains_month
+from webscraper_core.records import ArticleRecord
+from urllib.parse import urlparse
+import re
+import threading
 import urllib3
 import cloudscraper
 
 # Suppress SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Headers that mimic a modern browser; the User-Agent is replaced by the cached
+# one when a clearance is restored, since the clearance is bound to it
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Cache-Control': 'max-age=0',
+}
+
+# data-trackid matchers, compiled once: article cards / title links, and author profile links
+MEDIA_CARD = re.compile('media-card-')
+AUTHOR_PROFILE = 'media-visit-author-profile'
+
+
+# Cloudflare clearance persisted between runs; replace to change the location
+clearance_cache = ClearanceCache('.cloudflare_clearance.json')
+
+_cloud_client: Optional[HttpClient] = None
+_cloud_client_lock = threading.Lock()
+
+
+def get_cloud_client() -> HttpClient:
+    """Return the shared cloudscraper-backed HttpClient, creating it on first use.
+
+    Reusing one cloudscraper session keeps its connection pool and the
+    Cloudflare cookies it has already obtained. A clearance saved by a
+    previous run is restored into the new session.
+    """
+    global _cloud_client
+    if _cloud_client is None:
+        with _cloud_client_lock:
+            if _cloud_client is None:
+                session = cloudscraper.create_scraper()
+                session.headers.update(BROWSER_HEADERS)
+                clearance_cache.apply(session, urlparse(DataCampScraper.BASE_URL).hostname)
+                _cloud_client = HttpClient(session=session)
+    return _cloud_client
+
 
 class DataCampScraper(WebScraper):
     """Specialized scraper for extracting articles from DataCamp Blog."""
     
     BASE_URL = 'https://www.datacamp.com'
+    RATE_LIMIT_DELAY = 1  # seconds between requests to datacamp.com
+    WARN_UNPARSED_DATES = False  # unparseable dates are left empty without a warning
+    LISTING_STRAINER = SoupStrainer('div', attrs={'data-trackid': MEDIA_CARD})  # article cards
+    
+    def __init__(self, url: str, http: Optional[HttpClient] = None, **kwargs):
+        # Use cloudscraper to bypass Cloudflare protection
+        super().__init__(url, http if http is not None else get_cloud_client(), **kwargs)
     
     def fetch_page(self):
         """Fetch HTML content from the URL with proper headers using cloudscraper to bypass Cloudflare."""
         try:
-            # Use cloudscraper to bypass Cloudflare protection
-            scraper = cloudscraper.create_scraper()
+            # Browser headers are set on the shared session
+            html_content = self.http.get_text(self.url, cache=self.cache, allow_redirects=True)
             
-            # Define headers that mimic a modern browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Cache-Control': 'max-age=0',
-            }
-            
-            # Add a small delay to avoid rate limiting
-            time.sleep(1)
-            
-            response = scraper.get(self.url, headers=headers, timeout=15, allow_redirects=True)
-            response.raise_for_status()
-            return response.text
+            # Persist a newly obtained clearance so later runs skip the challenge
+            clearance_cache.store(self.http.session, urlparse(self.url).hostname or '')
+            return html_content
         except requests.exceptions.RequestException as err:
             print(f"Failed to fetch {self.url}: {err}")
             return None
     
-    def extract_article_data(self, html_content: str) -> List[dict]:
-        """Extract article data from DataCamp Blog homepage.
+    def iter_articles(self, html_content: str) -> Iterator[ArticleRecord]:
+        """Yield article data from DataCamp Blog homepage, one card at a time.
         
-        Returns a list of dictionaries with:
+        Yields ArticleRecords with:
         - title: Article title
         - author: Author name(s)
         - url: Article URL (absolute)
         - publication_date: Publication date
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
-        
+        soup = self._make_soup(html_content, parse_only=self.LISTING_STRAINER)
         # Find all article cards (div with data-trackid containing "media-card-")
-        for card_elem in soup.find_all('div', attrs={'data-trackid': lambda x: x and 'media-card-' in str(x)}):
+        for card_elem in soup.find_all('div', attrs={'data-trackid': MEDIA_CARD}):
             try:
-                # Extract title and URL from anchor tag with data-trackid containing "media-card-"
-                title_link = card_elem.find('a', attrs={'data-trackid': lambda x: x and 'media-card-' in str(x)})
+                # One pass over the card's links and paragraphs
+                title_link, authors, text_paragraphs = self._scan_card(card_elem)
                 if not title_link:
                     continue
                 
@@ -86,50 +123,68 @@ class DataCampScraper(WebScraper):
                 if not title:
                     continue
                 
-                # Extract author(s) from author profile links with data-trackid="media-visit-author-profile"
-                authors = self._extract_authors(card_elem)
                 author = ', '.join(authors) if authors else 'Unknown'
                 
-                # Extract publication date from p tag (typically the last p tag in the card)
-                pub_date = self._extract_publication_date(card_elem)
+                # Publication date is in one of the card's remaining p tags
+                pub_date = self._date_from_paragraphs(text_paragraphs)
                 
-                articles.append({
-                    'title': title,
-                    'author': author,
-                    'url': url,
-                    'publication_date': pub_date
-                })
+                yield ArticleRecord(
+                    title=title,
+                    author=author,
+                    url=url,
+                    publication_date=pub_date
+                )
                 
             except Exception as e:
                 print(f"Error extracting DataCamp article: {e}")
                 continue
+    
+    def _scan_card(self, card_elem):
+        """Walk a card's <a> and <p> tags once, in document order.
+        
+        Returns (title_link, authors, other_paragraphs):
+        - title_link: first <a> whose data-trackid contains "media-card-"
+        - authors: text of the first <p> after each author profile link
+          (data-trackid="media-visit-author-profile"), without duplicates
+        - other_paragraphs: text of the <p> tags not used as author names
+        
+        The lookup never leaves the card, so cost is linear in the card size.
+        """
+        title_link = None
+        authors = []
+        other_paragraphs = []
+        awaiting_author = False
+        
+        for elem in card_elem.find_all(['a', 'p']):
+            if elem.name == 'a':
+                trackid = elem.get('data-trackid') or ''
+                if trackid == AUTHOR_PROFILE:
+                    awaiting_author = True
+                elif title_link is None and MEDIA_CARD.search(trackid):
+                    title_link = elem
+                continue
+            
+            text = elem.get_text(strip=True)
+            if awaiting_author:
+                awaiting_author = False
+                if text and text not in authors:
+                    authors.append(text)
+            else:
+                other_paragraphs.append(text)
         
-        return articles
+        return title_link, authors, other_paragraphs
     
     def _extract_authors(self, card_elem) -> List[str]:
         """Extract author name(s) from article card.
         
-        Authors are in <p> tags that are siblings to elements
+        Authors are in <p> tags that follow elements
         containing data-trackid="media-visit-author-profile".
         """
-        authors = []
         try:
-            # Find all author profile links
-            for author_link in card_elem.find_all('a', attrs={'data-trackid': 'media-visit-author-profile'}):
-                # Find the next p tag (sibling) that contains the author name
-                parent = author_link.parent
-                while parent:
-                    next_p = parent.find_next('p')
-                    if next_p:
-                        author_name = next_p.get_text(strip=True)
-                        if author_name and author_name not in authors:
-                            authors.append(author_name)
-                        break
-                    parent = parent.parent if parent.parent else None
+            return self._scan_card(card_elem)[1]
         except Exception as e:
             print(f"Error extracting authors: {e}")
-        
-        return authors
+            return []
     
     def _extract_publication_date(self, card_elem) -> Optional[object]:
         """Extract publication date from article card.
@@ -138,59 +193,15 @@ class DataCampScraper(WebScraper):
         and contains text like "November 22, 2024".
         """
         try:
-            # Find all p tags in the card
-            p_tags = card_elem.find_all('p')
-            if not p_tags:
-                return None
-            
-            # Look through p tags for date patterns
-            for p_tag in p_tags:
-                date_text = p_tag.get_text(strip=True)
-                # Check if p contains a date (has month and year)
-                if any(month in date_text for month in ['January', 'February', 'March', 'April', 'May', 'June',
-                                                          'July', 'August', 'September', 'October', 'November', 'December']):
-                    return self._parse_date(date_text)
-                
-                # Also check for abbreviated months
-                if any(month in date_text for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                                                          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
-                    return self._parse_date(date_text)
+            return self._date_from_paragraphs(self._scan_card(card_elem)[2])
         except Exception as e:
             print(f"Error extracting publication date: {e}")
-        
-        return None
-    
-    def _parse_date(self, date_str: str) -> Optional[object]:
-        """Parse date string into Python date object.
-        
-        Handles various date formats commonly found in DataCamp articles.
-        """
-        if not date_str:
             return None
-        
-        # Common date formats to try
-        date_formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-        ]
-        
-        # Remove timezone info if present
-        clean_date_str = date_str
-        if '+' in clean_date_str:
-            clean_date_str = clean_date_str.split('+')[0]
-        if 'T' in clean_date_str:
-            clean_date_str = clean_date_str.split('T')[0]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(clean_date_str.strip(), fmt)
-                return parsed_date.date()
-            except ValueError:
-                continue
-        
-        # If no format matched, return None
+    
+    def _date_from_paragraphs(self, paragraphs: List[str]) -> Optional[object]:
+        """Parse the first paragraph text that names a month."""
+        for date_text in paragraphs:
+            # Check if p contains a date (full or abbreviated month name)
+            if contains_month(date_text):
+                return self._parse_date(date_text)
         return None
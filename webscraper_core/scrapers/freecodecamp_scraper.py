@@ -6,12 +6,11 @@ Follows the extraction rules in docs/FREE_CODE_CAMP_RULES.md:
 3. Author name is in <a> tag inside article card with article detail page link
 4. Publication date is in <time> tag with datetime attribute
 """
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from datetime import datetime
-import time
+from bs4 import SoupStrainer
+from typing import Iterator
 from webscraper_core.scraper import WebScraper
+from webscraper_core.parsing import class_pattern
+from webscraper_core.records import ArticleRecord
 
 
 class FreeCodeCampScraper(WebScraper):
@@ -20,19 +19,21 @@ class FreeCodeCampScraper(WebScraper):
     BASE_URL = 'https://www.freecodecamp.org'
     NEWS_BASE_URL = 'https://www.freecodecamp.org/news'
     RATE_LIMIT_DELAY = 1  # seconds between requests
+    WARN_UNPARSED_DATES = False  # unparseable dates are left empty without a warning
+    # Keep the post-card wrappers too: extraction falls back to them for title and footer
+    LISTING_STRAINER = SoupStrainer(['article', 'div'], class_=class_pattern('post-card', 'post-card-content'))
+    DETAIL_STRAINER = SoupStrainer(['section', 'time'], class_=class_pattern('author-card', 'post-full-meta-date'))
     
-    def extract_article_data(self, html_content: str) -> List[dict]:
-        """Extract article data from freeCodeCamp News homepage.
+    def iter_articles(self, html_content: str) -> Iterator[ArticleRecord]:
+        """Yield article data from freeCodeCamp News homepage, one card at a time.
         
-        Returns a list of dictionaries with:
+        Yields ArticleRecords with:
         - title: Article title
         - author: Author name
         - url: Article URL (absolute)
         - publication_date: Publication date
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
-        
+        soup = self._make_soup(html_content, parse_only=self.LISTING_STRAINER)
         # freeCodeCamp News uses div elements with class 'post-card-content'
         # These are nested inside elements with class 'post-card'
         for post_card in soup.find_all('div', class_='post-card-content'):
@@ -97,18 +98,16 @@ class FreeCodeCampScraper(WebScraper):
                         date_str = time_elem.get('datetime') or time_elem.get_text(strip=True)
                         pub_date = self._parse_date(date_str)
                 
-                articles.append({
-                    'title': title,
-                    'author': author,
-                    'url': url,
-                    'publication_date': pub_date
-                })
+                yield ArticleRecord(
+                    title=title,
+                    author=author,
+                    url=url,
+                    publication_date=pub_date
+                )
                 
             except Exception as e:
                 print(f"Error extracting freeCodeCamp article: {e}")
                 continue
-        
-        return articles
     
     def _fetch_article_details(self, article_url: str) -> dict:
         """Fetch additional details from article detail page if needed.
@@ -117,10 +116,9 @@ class FreeCodeCampScraper(WebScraper):
         but this method can be extended for additional metadata.
         """
         try:
-            time.sleep(self.RATE_LIMIT_DELAY)
-            response = requests.get(article_url, timeout=10)
+            response = self.http.get(article_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._make_soup(response.text, parse_only=self.DETAIL_STRAINER)
             
             # Extract details from article page
             details = {}
@@ -145,41 +143,3 @@ class FreeCodeCampScraper(WebScraper):
         except Exception as e:
             print(f"Error fetching freeCodeCamp article details from {article_url}: {e}")
             return {}
-    
-    def _parse_date(self, date_str: str) -> Optional[object]:
-        """Parse date string into Python date object.
-        
-        Handles various date formats commonly found in freeCodeCamp articles.
-        """
-        if not date_str:
-            return None
-        
-        # Common date formats to try
-        date_formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%dT%H:%M:%S.%fZ',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-        ]
-        
-        # Remove timezone info and time if present
-        clean_date_str = date_str
-        if '+' in clean_date_str:
-            clean_date_str = clean_date_str.split('+')[0]
-        if 'Z' in clean_date_str:
-            clean_date_str = clean_date_str.replace('Z', '')
-        if 'T' in clean_date_str:
-            clean_date_str = clean_date_str.split('T')[0]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(clean_date_str.strip(), fmt)
-                return parsed_date.date()
-            except ValueError:
-                continue
-        
-        # If no format matched, return None
-        return None
@@ -8,31 +8,34 @@ Follows the extraction rules in docs/REAL_PYTHON_RULES.md:
 5. Publication date is in span with date text
 """
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from datetime import datetime
-import time
+from bs4 import SoupStrainer
+from typing import Any, Dict, Iterator, Optional
 from webscraper_core.scraper import WebScraper
+from webscraper_core.parsing import class_pattern
+from webscraper_core.dates import contains_month
+from webscraper_core.records import ArticleRecord
 
 
 class RealPythonScraper(WebScraper):
     """Specialized scraper for extracting articles from Real Python."""
     
     BASE_URL = 'https://realpython.com'
-    RATE_LIMIT_DELAY = 2  # seconds between requests to article detail pages
+    RATE_LIMIT_DELAY = 2  # seconds between requests to realpython.com
+    DETAIL_WORKERS = 5  # author pages fetched concurrently
+    WARN_UNPARSED_DATES = False  # unparseable dates are left empty without a warning
+    LISTING_STRAINER = SoupStrainer('div', class_=class_pattern('card'))  # article cards
+    DETAIL_STRAINER = SoupStrainer('div', id='author')  # author box on article pages
     
-    def extract_article_data(self, html_content: str) -> List[dict]:
-        """Extract article data from Real Python homepage.
+    def iter_articles(self, html_content: str) -> Iterator[ArticleRecord]:
+        """Yield article data from the Real Python homepage, one card at a time.
         
-        Returns a list of dictionaries with:
+        Yields ArticleRecords with:
         - title: Article title
-        - author: Author name (fetched from detail page)
+        - author: 'Unknown' (filled in from the detail page by enrichment)
         - url: Article URL (absolute)
         - publication_date: Publication date
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
-        
+        soup = self._make_soup(html_content, parse_only=self.LISTING_STRAINER)
         # Real Python article cards have class 'card border-0'
         for card_elem in soup.find_all('div', class_='card'):
             try:
@@ -65,22 +68,17 @@ class RealPythonScraper(WebScraper):
                 # Extract publication date from span (usually "Oct 15, 2025" format)
                 pub_date = self._extract_publication_date(card_elem)
                 
-                # Extract author from article detail page
-                # We'll fetch it and add it to the article data
-                author = self._fetch_author_from_detail_page(url)
-                
-                articles.append({
-                    'title': title,
-                    'author': author or 'Unknown',
-                    'url': url,
-                    'publication_date': pub_date
-                })
+                # Author is on the article detail page, fetched during enrichment
+                yield ArticleRecord(
+                    title=title,
+                    author='Unknown',
+                    url=url,
+                    publication_date=pub_date
+                )
                 
             except Exception as e:
                 print(f"Error extracting Real Python article: {e}")
                 continue
-        
-        return articles
     
     def _extract_publication_date(self, card_elem) -> Optional[object]:
         """Extract publication date from article card.
@@ -92,30 +90,65 @@ class RealPythonScraper(WebScraper):
             for span in card_elem.find_all('span', class_='mr-2'):
                 date_text = span.get_text(strip=True)
                 # Check if span contains a date (has month name)
-                if any(month in date_text for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                                                          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
+                if contains_month(date_text):
                     return self._parse_date(date_text)
         except Exception as e:
             print(f"Error extracting publication date: {e}")
         
         return None
     
+    def detail_url(self, article: ArticleRecord) -> Optional[str]:
+        """Articles without a known author need their detail page fetched."""
+        if article.get('author') in (None, '', 'Unknown'):
+            return article.get('url') or None
+        return None
+    
+    def fetch_detail_page(self, article_url: str) -> Optional[str]:
+        """Fetch an article detail page.
+        
+        The shared client applies the realpython.com rate limit to avoid 429 errors.
+        """
+        try:
+            response = self.http.get(article_url)
+            response.raise_for_status()
+            return response.text
+            
+        except requests.exceptions.Timeout:
+            print(f"Timeout fetching author from {article_url}")
+            return None
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 429:
+                print(f"Rate limited (429) - skipping author fetch for {article_url}")
+            else:
+                print(f"HTTP error fetching author from {article_url}: {e}")
+            return None
+        except Exception as e:
+            print(f"Error fetching author from {article_url}: {e}")
+            return None
+    
+    def parse_detail(self, html_content: str) -> Dict[str, Any]:
+        """Return the article author from its detail page."""
+        return {'author': self._parse_author(html_content) or 'Unknown'}
+    
     def _fetch_author_from_detail_page(self, article_url: str) -> Optional[str]:
         """Fetch author name from individual Real Python article page.
         
+        Rate limited by the shared client to avoid 429 errors.
+        """
+        detail = self.get_detail(article_url)
+        if not detail or detail['author'] == 'Unknown':
+            return None
+        return detail['author']
+    
+    def _parse_author(self, html_content: str) -> Optional[str]:
+        """Parse the author name from a Real Python article page.
+        
         According to Real Python rules:
         - Author name is in div class="card mt-3" with id="author"
         - Specifically in a strong tag inside a p tag with class="card-header h3"
-        
-        Includes rate limiting to avoid 429 errors.
         """
         try:
-            # Add delay to avoid rate limiting
-            time.sleep(self.RATE_LIMIT_DELAY)
-            
-            response = requests.get(article_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._make_soup(html_content, parse_only=self.DETAIL_STRAINER)
             
             # Find author card: div class="card mt-3" with id="author"
             author_card = soup.find('div', class_='card', id='author')
@@ -135,49 +168,6 @@ class RealPythonScraper(WebScraper):
             author_name = strong_tag.get_text(strip=True)
             return author_name if author_name else None
             
-        except requests.exceptions.Timeout:
-            print(f"Timeout fetching author from {article_url}")
-            return None
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:
-                print(f"Rate limited (429) - skipping author fetch for {article_url}")
-            else:
-                print(f"HTTP error fetching author from {article_url}: {e}")
-            return None
         except Exception as e:
-            print(f"Error fetching author from {article_url}: {e}")
+            print(f"Error parsing author page: {e}")
             return None
-    
-    def _parse_date(self, date_str: str) -> Optional[object]:
-        """Parse date string into Python date object.
-        
-        Handles various date formats commonly found in articles.
-        """
-        if not date_str:
-            return None
-        
-        # Common date formats to try
-        date_formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-        ]
-        
-        # Remove timezone info and time if present
-        if '+' in date_str:
-            date_str = date_str.split('+')[0]
-        if 'T' in date_str:
-            date_str = date_str.split('T')[0]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str.strip(), fmt)
-                return parsed_date.date()
-            except ValueError:
-                continue
-        
-        # If no format matched, return None
-        return None
@@ -0,0 +1,104 @@
+"""Request coalescing ("singleflight") with a per-run memo.
+
+One SingleFlight instance is created per scraping run and shared by every
+scraper in it. The first caller for a key does the work; concurrent callers
+for the same key wait for that result, and later callers get the memoised
+result, so a page is fetched (and parsed) at most once per run. Callers
+memoise small parsed results rather than page HTML, so the memo stays small.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _Call:
+    """An in-flight call that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce duplicate calls by key and memoise their results.
+
+    Usage:
+      flight = SingleFlight()
+      author = flight.do(url, lambda: fetch_author(url))              # threads
+      author = await flight.do_async(url, lambda: afetch_author(url)) # asyncio
+
+    Results are kept for the lifetime of the instance. None (a failed fetch)
+    and exceptions are passed to the callers already waiting but not
+    memoised, so a later call retries.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: Dict[str, Any] = {}
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: Dict[str, asyncio.Future] = {}
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._results
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Return the memoised result for key, or run fn once and share its result."""
+        with self._lock:
+            if key in self._results:
+                return self._results[key]
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            if call.result is not None:
+                with self._lock:
+                    self._results[key] = call.result
+            return call.result
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Asyncio variant of do(); coalesces coroutines running on one event loop."""
+        with self._lock:
+            if key in self._results:
+                return self._results[key]
+        future = self._async_calls.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = self._async_calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged as never retrieved
+            future.exception()
+            raise
+        else:
+            if result is not None:
+                with self._lock:
+                    self._results[key] = result
+            future.set_result(result)
+            return result
+        finally:
+            del self._async_calls[key]
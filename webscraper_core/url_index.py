@@ -0,0 +1,64 @@
+"""In-memory index of article URLs already stored in the database.
+
+Deciding whether a scraped article is new normally costs an IN query per
+batch against the article.url column. A KnownUrlIndex is loaded once per
+run with one streaming query and then answers "new or known" from memory;
+it is updated as articles are inserted, so later pages in the same run see
+them too.
+
+URLs are kept as 64-bit BLAKE2b digests rather than strings, so the index
+takes a fixed ~70 bytes per URL however long the URLs are. Two different
+URLs sharing a digest is possible but negligible (about 1 in 30 million
+with a million stored URLs); such an article would be treated as known.
+
+Usage:
+  index = KnownUrlIndex.load(session)
+  if url not in index: ...
+  index.update(inserted_urls)
+"""
+from hashlib import blake2b
+from typing import Iterable, List, Mapping, Set, Tuple
+
+from .repositories.article_repository import ArticleRepository
+
+
+def url_digest(url: str) -> int:
+    """Return the 64-bit digest the index stores for url."""
+    return int.from_bytes(blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class KnownUrlIndex:
+    """Set of 64-bit digests of known article URLs.
+
+    Lookups and updates are plain set operations, which are safe to call
+    from several worker threads at once.
+    """
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self._digests: Set[int] = {url_digest(url) for url in urls if url}
+
+    @classmethod
+    def load(cls, session, chunk_size: int = 1000) -> 'KnownUrlIndex':
+        """Build the index from every article URL in the database (one streaming query)."""
+        return cls(ArticleRepository(session).iter_urls(chunk_size))
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and url_digest(url) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def add(self, url: str) -> None:
+        """Mark url as stored."""
+        if url:
+            self._digests.add(url_digest(url))
+
+    def update(self, urls: Iterable[str]) -> None:
+        """Mark every URL in urls as stored."""
+        self._digests.update(url_digest(url) for url in urls if url)
+
+    def split_new(self, articles: Iterable[Mapping]) -> Tuple[List[Mapping], int]:
+        """Split off articles whose URL is known; returns (new_articles, known_count)."""
+        articles = list(articles)
+        new_articles = [a for a in articles if a.get('url') not in self]
+        return new_articles, len(articles) - len(new_articles)